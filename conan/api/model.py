@@ -7,6 +7,7 @@ from conans.client.graph.graph import RECIPE_EDITABLE, RECIPE_CONSUMER, RECIPE_P
     RECIPE_VIRTUAL, BINARY_SKIP, BINARY_MISSING, BINARY_INVALID
 from conan.internal.errors import NotFoundException
 from conan.errors import ConanException
+from conan.internal.json_stream import iter_json_file
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 from conans.util.files import load
@@ -75,18 +76,18 @@ class MultiPackagesList:
 
     @staticmethod
     def load(file):
+        result = {}
         try:
-            content = json.loads(load(file))
+            # Read remote by remote, without loading the whole json text in memory
+            for (remote, ), pkglist in iter_json_file(file, ("*", )):
+                if "error" in pkglist:
+                    result[remote] = pkglist
+                else:
+                    result[remote] = PackagesList.deserialize(pkglist)
         except JSONDecodeError as e:
             raise ConanException(f"Package list file invalid JSON: {file}\n{e}")
         except Exception as e:
             raise ConanException(f"Package list file missing or broken: {file}\n{e}")
-        result = {}
-        for remote, pkglist in content.items():
-            if "error" in pkglist:
-                result[remote] = pkglist
-            else:
-                result[remote] = PackagesList.deserialize(pkglist)
         pkglist = MultiPackagesList()
         pkglist.lists = result
         return pkglist
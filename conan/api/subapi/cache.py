@@ -90,6 +90,7 @@ class CacheAPI:
         app = ConanApp(self.conan_api)
         if temp:
             rmdir(app.cache.temp_folder)
+            rmdir(app.cache.graphs_folder)
             # Clean those build folders that didn't succeed to create a package and wont be in DB
             builds_folder = app.cache.builds_folder
             if os.path.isdir(builds_folder):
@@ -243,6 +244,37 @@ class CacheAPI:
         download_cache = DownloadCache(download_cache_path)
         return download_cache.get_backup_sources_files(excluded_urls, package_list, only_upload)
 
+    def _download_caches(self):
+        """ the existing download caches: the packages one and the sources one, that can be the
+        same folder
+        """
+        config = self.conan_api.config.global_conf
+        sources_cache = config.get("core.sources:download_cache") or HomePaths(
+            self.conan_api.cache_folder).default_sources_backup_folder
+        folders = [config.get("core.download:download_cache"), sources_cache]
+        folders = [f for i, f in enumerate(folders) if f and os.path.isdir(f)
+                   and f not in folders[:i]]
+        return [DownloadCache(f) for f in folders]
+
+    def download_cache_stats(self):
+        """ the number of entries, the size, and the accumulated hits and misses of every kind
+        of entry, for every download cache
+        @return: {download_cache_folder: {kind: {"entries", "size", "hits", "misses"}}}
+        """
+        return {c.path: c.stats() for c in self._download_caches()}
+
+    def download_cache_prune(self, max_size):
+        """ remove the least recently used entries of the download caches until every one is not
+        larger than max_size bytes
+        @return: {download_cache_folder: {"removed": [entries], "freed": size}}
+        """
+        result = {}
+        for download_cache in self._download_caches():
+            download_cache.sync_index()
+            removed, freed = download_cache.prune(max_size)
+            result[download_cache.path] = {"removed": removed, "freed": freed}
+        return result
+
 
 def _resolve_latest_ref(app, ref):
     if ref.revision is None or ref.revision == "latest":
@@ -19,8 +19,11 @@ class DownloadAPI:
         """Download the recipe specified in the ref from the remote.
         If the recipe is already in the cache it will be skipped,
         but the specified metadata will be downloaded."""
+        return self._recipe(ConanApp(self.conan_api), ref, remote, metadata)
+
+    @staticmethod
+    def _recipe(app, ref, remote, metadata):
         output = ConanOutput()
-        app = ConanApp(self.conan_api)
         assert ref.revision, f"Reference '{ref}' must have revision"
         try:
             app.cache.recipe_layout(ref)  # raises if not found
@@ -52,8 +55,11 @@ class DownloadAPI:
         The recipe for this package binary must already exist in the cache.
         If the package is already in the cache it will be skipped,
         but the specified metadata will be downloaded."""
+        return self._package(ConanApp(self.conan_api), pref, remote, metadata)
+
+    @staticmethod
+    def _package(app, pref, remote, metadata):
         output = ConanOutput()
-        app = ConanApp(self.conan_api)
         try:
             app.cache.recipe_layout(pref.ref)  # raises if not found
         except ConanException:
@@ -81,13 +87,16 @@ class DownloadAPI:
                       metadata: Optional[List[str]] = None):
         """Download the recipes and packages specified in the package_list from the remote,
         parallelized based on `core.download:parallel`"""
+        app = ConanApp(self.conan_api)
+
         def _download_pkglist(pkglist):
             for ref, recipe_bundle in pkglist.refs().items():
-                self.recipe(ref, remote, metadata)
+                self._recipe(app, ref, remote, metadata)
                 for pref, _ in pkglist.prefs(ref, recipe_bundle).items():
-                    self.package(pref, remote, metadata)
+                    self._package(app, pref, remote, metadata)
 
         t = time.time()
+        stats = app.requester.connection_stats()
         parallel = self.conan_api.config.get("core.download:parallel", default=1, check_type=int)
         thread_pool = ThreadPool(parallel) if parallel > 1 else None
         if not thread_pool or len(package_list.refs()) <= 1:
@@ -101,4 +110,7 @@ class DownloadAPI:
             thread_pool.join()
 
         elapsed = time.time() - t
+        stats = app.requester.connection_stats(since=stats)
+        ConanOutput().verbose(f"HTTP connections: {stats['opened']} opened, "
+                              f"{stats['reused']} reused")
         ConanOutput().success(f"Download completed in {int(elapsed)}s\n")
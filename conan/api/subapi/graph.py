@@ -1,4 +1,7 @@
+from multiprocessing.pool import ThreadPool
+
 from conan.api.output import ConanOutput
+from conan.internal.cache.graph_cache import GraphCache
 from conan.internal.conan_app import ConanApp
 from conans.client.graph.graph import Node, RECIPE_CONSUMER, CONTEXT_HOST, RECIPE_VIRTUAL, \
     CONTEXT_BUILD
@@ -17,8 +20,8 @@ class GraphAPI:
     def _load_root_consumer_conanfile(self, path, profile_host, profile_build,
                                       name=None, version=None, user=None, channel=None,
                                       update=None, remotes=None, lockfile=None,
-                                      is_build_require=False):
-        app = ConanApp(self.conan_api)
+                                      is_build_require=False, app=None):
+        app = app or ConanApp(self.conan_api)
 
         if path.endswith(".py"):
             conanfile = app.loader.load_consumer(path,
@@ -85,10 +88,11 @@ class GraphAPI:
         return root_node
 
     def _load_root_virtual_conanfile(self, profile_host, profile_build, requires, tool_requires,
-                                     lockfile, remotes, update, check_updates=False, python_requires=None):
+                                     lockfile, remotes, update, check_updates=False, python_requires=None,
+                                     app=None):
         if not python_requires and not requires and not tool_requires:
             raise ConanException("Provide requires or tool_requires")
-        app = ConanApp(self.conan_api)
+        app = app or ConanApp(self.conan_api)
         conanfile = app.loader.load_virtual(requires=requires,
                                             tool_requires=tool_requires,
                                             python_requires=python_requires,
@@ -170,16 +174,95 @@ class GraphAPI:
         """
         ConanOutput().title("Computing dependency graph")
         app = ConanApp(self.conan_api)
+        return self._load_graph(app, root_node, profile_host, profile_build, lockfile, remotes,
+                                update, check_update)
 
+    def _load_graph(self, app, root_node, profile_host, profile_build, lockfile, remotes, update,
+                    check_update):
         assert profile_host is not None
         assert profile_build is not None
 
         remotes = remotes or []
+        global_conf = self.conan_api.config.global_conf
+        graph_cache = fingerprint = cached = None
+        # Updating or checking updates needs to query the remotes again, it cannot be reused
+        if global_conf.get("core.graph:cache", check_type=bool) and not update \
+                and not check_update:
+            graph_cache = GraphCache(app.cache, global_conf, self.conan_api.local.editable_packages)
+            fingerprint = graph_cache.fingerprint(root_node, profile_host, profile_build,
+                                                  lockfile, remotes)
+            cached = graph_cache.get(fingerprint)
         builder = DepsGraphBuilder(app.proxy, app.loader, app.range_resolver, app.cache, remotes,
-                                   update, check_update, self.conan_api.config.global_conf)
-        deps_graph = builder.load_graph(root_node, profile_host, profile_build, lockfile)
+                                   update, check_update, global_conf)
+        if cached is not None:
+            ConanOutput().info("Reusing the resolved graph of a previous computation with the "
+                               "same inputs")
+            cached_lockfile, resolved_ranges = cached
+            deps_graph = builder.load_graph(root_node, profile_host, profile_build,
+                                            cached_lockfile)
+            resolved_ranges.update(deps_graph.resolved_ranges)
+            deps_graph.resolved_ranges = resolved_ranges
+        else:
+            deps_graph = builder.load_graph(root_node, profile_host, profile_build, lockfile)
+            if graph_cache is not None:
+                # Stored with the recipes in the cache after the expansion, that could have
+                # brought new ones from the remotes
+                graph_cache.store(fingerprint, deps_graph)
         return deps_graph
 
+    def load_graph_matrix(self, configurations, path=None, requires=None, tool_requires=None,
+                          name=None, version=None, user=None, channel=None, lockfile=None,
+                          remotes=None, build_mode=None, update=None, parallel=1):
+        """ Compute and analyze the dependency graphs of the same consumer, a conanfile or a list
+        of requires and tool_requires, for several configurations in the same process. The
+        loaded recipes, the resolved version ranges and the recipes retrieved from the remotes
+        are shared among all of them, so they are loaded, resolved or retrieved only once
+
+        :param configurations: a list of (profile_host, profile_build) tuples
+        :param path: the path of the consumer conanfile, if not using requires/tool_requires
+        :param build_mode: the --build argument, to analyze the binaries of every graph
+        :param parallel: number of graphs computed concurrently, 1 by default
+        :return: the list of graphs, in the same order than the configurations. The graphs
+            with errors are not analyzed
+        """
+        requires = [RecipeReference.loads(r) if isinstance(r, str) else r for r in requires] \
+            if requires else None
+        tool_requires = [RecipeReference.loads(r) if isinstance(r, str) else r
+                         for r in tool_requires] if tool_requires else None
+        ConanOutput().title(f"Computing {len(configurations)} dependency graphs")
+        app = ConanApp(self.conan_api)
+        global_conf = self.conan_api.config.global_conf
+
+        def _compute(configuration):
+            profile_host, profile_build = configuration
+            if path:
+                root_node = self._load_root_consumer_conanfile(path, profile_host, profile_build,
+                                                               name=name, version=version,
+                                                               user=user, channel=channel,
+                                                               lockfile=lockfile, remotes=remotes,
+                                                               update=update, app=app)
+            else:
+                self._scope_options(profile_host, requires=requires, tool_requires=tool_requires)
+                root_node = self._load_root_virtual_conanfile(profile_host, profile_build,
+                                                              requires, tool_requires, lockfile,
+                                                              remotes, update, app=app)
+            graph = self._load_graph(app, root_node, profile_host, profile_build, lockfile,
+                                     remotes, update, check_update=False)
+            if not graph.error:
+                # The binaries analysis is not shared, binaries can be skipped in one graph only
+                binaries_analyzer = GraphBinariesAnalyzer(app, global_conf)
+                binaries_analyzer.evaluate_graph(graph, build_mode, lockfile, remotes, update)
+            return graph
+
+        if parallel <= 1 or len(configurations) <= 1:
+            return [_compute(c) for c in configurations]
+        thread_pool = ThreadPool(parallel)
+        try:
+            return thread_pool.map(_compute, configurations)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+
     def analyze_binaries(self, graph, build_mode=None, remotes=None, update=None, lockfile=None,
                          build_modes_test=None, tested_graph=None):
         """ Given a dependency graph, will compute the package_ids of all recipes in the graph, and
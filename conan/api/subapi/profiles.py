@@ -1,4 +1,5 @@
 import os
+import time
 
 from conan.api.output import ConanOutput
 from conan.internal.cache.home_paths import HomePaths
@@ -17,6 +18,9 @@ class ProfilesAPI:
     def __init__(self, conan_api):
         self._conan_api = conan_api
         self._home_paths = HomePaths(conan_api.cache_folder)
+        # The loader memoizes the rendered and parsed profiles, for commands loading many of them
+        self._loader = ProfileLoader(conan_api.cache_folder)
+        self._profile_plugin = None  # ((path, mtime, size), profile_plugin function)
 
     def get_default_host(self):
         """
@@ -86,15 +90,17 @@ class ProfilesAPI:
 
     def _get_profile(self, profiles, settings, options, conf, cwd, cache_settings,
                      profile_plugin, global_conf):
-        loader = ProfileLoader(self._conan_api.cache_folder)
-        profile = loader.from_cli_args(profiles, settings, options, conf, cwd)
+        profile = self._loader.from_cli_args(profiles, settings, options, conf, cwd)
         if profile_plugin is not None:
+            t1 = time.time()
             try:
                 profile_plugin(profile)
             except Exception as e:
                 msg = f"Error while processing 'profile.py' plugin"
                 msg = scoped_traceback(msg, e, scope="/extensions/plugins")
                 raise ConanException(msg)
+            duration = time.time() - t1
+            ConanOutput().debug(f"'profile.py' plugin executed in {duration} time")
         profile.process_settings(cache_settings)
         profile.conf.validate()
         # Apply the new_config to the profiles the global one, so recipes get it too
@@ -159,6 +165,10 @@ class ProfilesAPI:
             raise ConanException("The 'profile.py' plugin file doesn't exist. If you want "
                                  "to disable it, edit its contents instead of removing it")
 
-        mod, _ = load_python_file(profile_plugin)
-        if hasattr(mod, "profile_plugin"):
-            return mod.profile_plugin
+        # The plugin is loaded once while it doesn't change, not for every profile computed
+        stat = os.stat(profile_plugin)
+        key = profile_plugin, stat.st_mtime_ns, stat.st_size
+        if self._profile_plugin is None or self._profile_plugin[0] != key:
+            mod, _ = load_python_file(profile_plugin)
+            self._profile_plugin = key, getattr(mod, "profile_plugin", None)
+        return self._profile_plugin[1]
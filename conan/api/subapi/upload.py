@@ -20,7 +20,9 @@ class UploadAPI:
     def check_upstream(self, package_list, remote, enabled_remotes, force=False):
         """Check if the artifacts are already in the specified remote, skipping them from
         the package_list in that case"""
-        app = ConanApp(self.conan_api)
+        self._check_upstream(ConanApp(self.conan_api), package_list, remote, enabled_remotes, force)
+
+    def _check_upstream(self, app, package_list, remote, enabled_remotes, force):
         for ref, bundle in package_list.refs().items():
             layout = app.cache.recipe_layout(ref)
             conanfile_path = layout.conanfile()
@@ -30,7 +32,8 @@ class UploadAPI:
                                    "because upload_policy='skip'")
                 bundle["packages"] = {}
 
-        UploadUpstreamChecker(app).check(package_list, remote, force)
+        checker = UploadUpstreamChecker(app, self.conan_api.config.global_conf)
+        checker.check(package_list, remote, force)
 
     def prepare(self, package_list, enabled_remotes, metadata=None):
         """Compress the recipes and packages and fill the upload_data objects
@@ -41,9 +44,11 @@ class UploadAPI:
         :param metadata: A list of patterns of metadata that should be uploaded. Default None
         means all metadata will be uploaded together with the pkg artifacts. If metadata is empty
         string (""), it means that no metadata files should be uploaded."""
+        self._prepare(ConanApp(self.conan_api), package_list, enabled_remotes, metadata)
+
+    def _prepare(self, app, package_list, enabled_remotes, metadata):
         if metadata and metadata != [''] and '' in metadata:
             raise ConanException("Empty string and patterns can not be mixed for metadata.")
-        app = ConanApp(self.conan_api)
         preparator = PackagePreparator(app, self.conan_api.config.global_conf)
         preparator.prepare(package_list, enabled_remotes)
         if metadata != ['']:
@@ -53,7 +58,10 @@ class UploadAPI:
         signer.sign(package_list)
 
     def upload(self, package_list, remote):
-        app = ConanApp(self.conan_api)
+        self._upload(ConanApp(self.conan_api), package_list, remote)
+
+    @staticmethod
+    def _upload(app, package_list, remote):
         app.remote_manager.check_credentials(remote)
         executor = UploadExecutor(app)
         executor.upload(package_list, remote)
@@ -68,6 +76,7 @@ class UploadAPI:
         - execute the actual upload
         - upload potential sources backups
         """
+        app = ConanApp(self.conan_api)
 
         def _upload_pkglist(pkglist, subtitle=lambda _: None):
             if check_integrity:
@@ -75,17 +84,18 @@ class UploadAPI:
                 self.conan_api.cache.check_integrity(pkglist)
             # Check if the recipes/packages are in the remote
             subtitle("Checking server existing packages")
-            self.check_upstream(pkglist, remote, enabled_remotes, force)
+            self._check_upstream(app, pkglist, remote, enabled_remotes, force)
             subtitle("Preparing artifacts for upload")
-            self.prepare(pkglist, enabled_remotes, metadata)
+            self._prepare(app, pkglist, enabled_remotes, metadata)
 
             if not dry_run:
                 subtitle("Uploading artifacts")
-                self.upload(pkglist, remote)
+                self._upload(app, pkglist, remote)
                 backup_files = self.conan_api.cache.get_backup_sources(pkglist)
-                self.upload_backup_sources(backup_files)
+                self._upload_backup_sources(app, backup_files)
 
         t = time.time()
+        stats = app.requester.connection_stats()
         ConanOutput().title(f"Uploading to remote {remote.name}")
         parallel = self.conan_api.config.get("core.upload:parallel", default=1, check_type=int)
         thread_pool = ThreadPool(parallel) if parallel > 1 else None
@@ -98,9 +108,15 @@ class UploadAPI:
             thread_pool.close()
             thread_pool.join()
         elapsed = time.time() - t
+        stats = app.requester.connection_stats(since=stats)
+        ConanOutput().verbose(f"HTTP connections: {stats['opened']} opened, "
+                              f"{stats['reused']} reused")
         ConanOutput().success(f"Upload completed in {int(elapsed)}s\n")
 
     def upload_backup_sources(self, files):
+        return self._upload_backup_sources(ConanApp(self.conan_api), files)
+
+    def _upload_backup_sources(self, app, files):
         config = self.conan_api.config.global_conf
         url = config.get("core.sources:upload_url", check_type=str)
         if url is None:
@@ -113,7 +129,6 @@ class UploadAPI:
             output.info("No backup sources files to upload")
             return files
 
-        app = ConanApp(self.conan_api)
         # TODO: verify might need a config to force it to False
         uploader = FileUploader(app.requester, verify=True, config=config, source_credentials=True)
         # TODO: For Artifactory, we can list all files once and check from there instead
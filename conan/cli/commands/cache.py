@@ -9,6 +9,7 @@ from conan.cli.commands.list import print_list_text, print_list_json
 from conan.errors import ConanException
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
+from conans.util.files import human_size
 
 
 def json_export(data):
@@ -164,3 +165,60 @@ def cache_backup_upload(conan_api: ConanAPI, parser, subparser, *args):
     """
     files = conan_api.cache.get_backup_sources()
     conan_api.upload.upload_backup_sources(files)
+
+
+def _print_download_stats(result):
+    if not result:
+        cli_out_write("There are no download caches")
+    for folder, kinds in result.items():
+        cli_out_write(folder)
+        for kind, stats in kinds.items():
+            accesses = stats["hits"] + stats["misses"]
+            rate = f"{100 * stats['hits'] // accesses}%" if accesses else "-"
+            cli_out_write(f"  {kind}: {stats['entries']} entries, {human_size(stats['size'])}, "
+                          f"{stats['hits']} hits, {stats['misses']} misses, hit rate {rate}")
+
+
+def _json_download_cache(result):
+    cli_out_write(json.dumps(result, indent=4))
+
+
+@conan_subcommand(formatters={"text": _print_download_stats, "json": _json_download_cache})
+def cache_download_stats(conan_api: ConanAPI, parser, subparser, *args):
+    """
+    Show the number of entries, size, hits and misses of the download caches
+    """
+    parser.parse_args(*args)
+    return conan_api.cache.download_cache_stats()
+
+
+def _parse_size(size):
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    value = size.strip().upper().rstrip("B")
+    factor = units.get(value[-1:], 1)
+    if value[-1:] in units:
+        value = value[:-1]
+    try:
+        return int(float(value) * factor)
+    except ValueError:
+        raise ConanException(f"Invalid size '{size}', use a number of bytes or a K, M, G, T "
+                             "suffixed value, e.g. 10G")
+
+
+def _print_download_prune(result):
+    for folder, pruned in result.items():
+        cli_out_write(f"{folder}: removed {len(pruned['removed'])} entries, "
+                      f"{human_size(pruned['freed'])} freed")
+
+
+@conan_subcommand(formatters={"text": _print_download_prune, "json": _json_download_cache})
+def cache_download_prune(conan_api: ConanAPI, parser, subparser, *args):
+    """
+    Remove the least recently used packages artifacts and extracted sources of the download
+    caches, until they are not larger than the given size. Backup sources are not removed
+    """
+    subparser.add_argument("--max-size", required=True,
+                           help="Maximum size of every download cache, in bytes or with a "
+                                "K, M, G, T suffix, e.g. 10G")
+    args = parser.parse_args(*args)
+    return conan_api.cache.download_cache_prune(_parse_size(args.max_size))
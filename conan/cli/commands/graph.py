@@ -1,11 +1,14 @@
+import argparse
 import json
 import os
+import shlex
 
 from conan.api.model import ListPattern
 from conan.api.output import ConanOutput, cli_out_write, Color
 from conan.cli import make_abs_path
-from conan.cli.args import common_graph_args, validate_common_graph_args
+from conan.cli.args import common_graph_args, validate_common_graph_args, add_profiles_args
 from conan.cli.command import conan_command, conan_subcommand
+from conan.cli.formatters import stream_json_formatter
 from conan.cli.commands.list import prepare_pkglist_compact, print_serial
 from conan.cli.formatters.graph import format_graph_html, format_graph_json, format_graph_dot
 from conan.cli.formatters.graph.build_order_html import format_build_order_html
@@ -62,7 +65,32 @@ def cli_build_order(result):
 
 
 def json_build_order(result):
-    cli_out_write(json.dumps(result["build_order"], indent=4))
+    stream_json_formatter(result["build_order"])
+
+
+def _matrix_configurations(conan_api, args):
+    """ the (name, profile_host, profile_build, ProfileArgs) of every --matrix configuration
+    """
+    matrix_parser = argparse.ArgumentParser(prog="--matrix", add_help=False)
+    add_profiles_args(matrix_parser)
+    result = []
+    for i, entry in enumerate(args.matrix):
+        tokens = shlex.split(entry)
+        name = tokens.pop(0) if tokens and not tokens[0].startswith("-") else f"config{i}"
+        if any(name == r[0] for r in result):
+            raise ConanException(f"Duplicated --matrix configuration name '{name}'")
+        entry_args, unknown = matrix_parser.parse_known_args(tokens)
+        if unknown:
+            raise ConanException(f"Invalid --matrix '{entry}', only profile, settings, options "
+                                 f"and conf arguments are allowed: {' '.join(unknown)}")
+        for f in "profile", "settings", "options", "conf":
+            for context in "host", "build":
+                common = getattr(args, f"{f}_{context}") or []
+                current = getattr(entry_args, f"{f}_{context}", None) or []
+                setattr(entry_args, f"{f}_{context}", common + current or None)
+        profile_host, profile_build = conan_api.profiles.get_profiles_from_args(entry_args)
+        result.append((name, profile_host, profile_build, ProfileArgs.from_args(entry_args)))
+    return result
 
 
 @conan_subcommand(formatters={"text": cli_build_order, "json": json_build_order,
@@ -77,6 +105,11 @@ def graph_build_order(conan_api, parser, subparser, *args):
     subparser.add_argument("--reduce", action='store_true', default=False,
                            help='Reduce the build order, output only those to build. Use this '
                                 'only if the result will not be merged later with other build-order')
+    subparser.add_argument("--matrix", action="append",
+                           help='Compute the build order of several configurations at once, '
+                                'merged, each one defined by a name and profile arguments, that '
+                                'are added to the common ones, e.g. --matrix="windows '
+                                '-pr:h=windows -s:h build_type=Debug". Can be repeated')
     args = parser.parse_args(*args)
 
     # parameter validation
@@ -97,38 +130,65 @@ def graph_build_order(conan_api, parser, subparser, *args):
                                                cwd=cwd,
                                                partial=args.lockfile_partial,
                                                overrides=overrides)
-    profile_host, profile_build = conan_api.profiles.get_profiles_from_args(args)
-
-    if path:
-        deps_graph = conan_api.graph.load_graph_consumer(path, args.name, args.version,
-                                                         args.user, args.channel,
-                                                         profile_host, profile_build, lockfile,
-                                                         remotes, args.build, args.update)
+    if args.matrix:
+        configurations = _matrix_configurations(conan_api, args)
+        parallel = conan_api.config.get("core.graph:parallel", default=1, check_type=int)
+        graphs = conan_api.graph.load_graph_matrix([(h, b) for _, h, b, _ in configurations],
+                                                   path, args.requires, args.tool_requires,
+                                                   args.name, args.version, args.user,
+                                                   args.channel, lockfile, remotes, args.build,
+                                                   args.update, parallel)
+        for (name, _, _, _), deps_graph in zip(configurations, graphs):
+            ConanOutput().title(f"Dependency graph of configuration '{name}'")
+            print_graph_basic(deps_graph)
+            deps_graph.report_graph_error()
+            print_graph_packages(deps_graph)
     else:
-        deps_graph = conan_api.graph.load_graph_requires(args.requires, args.tool_requires,
-                                                         profile_host, profile_build, lockfile,
-                                                         remotes, args.build, args.update)
-    print_graph_basic(deps_graph)
-    deps_graph.report_graph_error()
-    conan_api.graph.analyze_binaries(deps_graph, args.build, remotes=remotes, update=args.update,
-                                     lockfile=lockfile)
-    print_graph_packages(deps_graph)
+        profile_host, profile_build = conan_api.profiles.get_profiles_from_args(args)
+        if path:
+            deps_graph = conan_api.graph.load_graph_consumer(path, args.name, args.version,
+                                                             args.user, args.channel,
+                                                             profile_host, profile_build,
+                                                             lockfile, remotes, args.build,
+                                                             args.update)
+        else:
+            deps_graph = conan_api.graph.load_graph_requires(args.requires, args.tool_requires,
+                                                             profile_host, profile_build,
+                                                             lockfile, remotes, args.build,
+                                                             args.update)
+        print_graph_basic(deps_graph)
+        deps_graph.report_graph_error()
+        conan_api.graph.analyze_binaries(deps_graph, args.build, remotes=remotes,
+                                         update=args.update, lockfile=lockfile)
+        print_graph_packages(deps_graph)
+        configurations = [(None, profile_host, profile_build, ProfileArgs.from_args(args))]
+        graphs = [deps_graph]
 
     out = ConanOutput()
     out.title("Computing the build order")
 
-    install_graph = InstallGraph(deps_graph, order_by=args.order_by,
-                                 profile_args=ProfileArgs.from_args(args))
+    if args.reduce and args.order_by is None:
+        raise ConanException("--reduce needs --order-by argument defined")
+    install_graph = None
+    for (name, _, _, profile_args), deps_graph in zip(configurations, graphs):
+        current = InstallGraph(deps_graph, order_by=args.order_by, profile_args=profile_args)
+        if name is not None:
+            # The same result as merging the build-order files of every configuration
+            current = InstallGraph.deserialize(current.install_build_order(), name)
+        if install_graph is None:
+            install_graph = current
+        else:
+            install_graph.merge(current)
     if args.reduce:
-        if args.order_by is None:
-            raise ConanException("--reduce needs --order-by argument defined")
         install_graph.reduce()
     install_order_serialized = install_graph.install_build_order()
     if args.order_by is None:  # legacy
         install_order_serialized = install_order_serialized["order"]
 
-    lockfile = conan_api.lockfile.update_lockfile(lockfile, deps_graph, args.lockfile_packages,
-                                                  clean=args.lockfile_clean)
+    for deps_graph in graphs:
+        lockfile = conan_api.lockfile.update_lockfile(lockfile, deps_graph,
+                                                      args.lockfile_packages,
+                                                      clean=args.lockfile_clean)
     conan_api.lockfile.save_lockfile(lockfile, args.lockfile_out, cwd)
 
     return {"build_order": install_order_serialized,
@@ -1,10 +1,9 @@
-import json
-
 from conan.api.conan_api import ConanAPI
 from conan.api.model import ListPattern, MultiPackagesList
 from conan.api.output import Color, cli_out_write
 from conan.cli import make_abs_path
 from conan.cli.command import conan_command, OnceArgument
+from conan.cli.formatters import stream_json_formatter
 from conan.cli.formatters.list import list_packages_html
 from conan.errors import ConanException
 from conans.util.dates import timestamp_to_str
@@ -193,9 +192,7 @@ def prepare_pkglist_compact(pkglist):
 
 
 def print_list_json(data):
-    results = data["results"]
-    myjson = json.dumps(results, indent=4)
-    cli_out_write(myjson)
+    stream_json_formatter(data["results"])
 
 
 @conan_command(group="Consumer", formatters={"text": print_list_text,
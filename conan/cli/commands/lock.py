@@ -74,10 +74,7 @@ def lock_merge(conan_api, parser, subparser, *args): # noqa
     args = parser.parse_args(*args)
 
     result = Lockfile()
-    for lockfile in args.lockfile:
-        lockfile = make_abs_path(lockfile)
-        graph_lock = Lockfile.load(lockfile)
-        result.merge(graph_lock)
+    result.merge_all(Lockfile.load(make_abs_path(lockfile)) for lockfile in args.lockfile)
 
     lockfile_out = make_abs_path(args.lockfile_out)
     result.save(lockfile_out)
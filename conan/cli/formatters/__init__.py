@@ -1,8 +1,18 @@
 import json
 
 from conan.api.output import cli_out_write
+from conan.internal.json_stream import iter_json
 
 
 def default_json_formatter(data):
     myjson = json.dumps(data, indent=4)
     cli_out_write(myjson)
+
+
+def stream_json_formatter(data):
+    """ same output as default_json_formatter(), but written in chunks, without building the
+    whole text in memory, for potentially large outputs like graphs or package lists
+    """
+    for chunk in iter_json(data, indent=4):
+        cli_out_write(chunk, endline="")
+    cli_out_write("")
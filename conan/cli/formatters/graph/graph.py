@@ -1,9 +1,9 @@
-import json
 import os
 
 from jinja2 import Template, select_autoescape
 
 from conan.api.output import cli_out_write, ConanOutput
+from conan.cli.formatters import stream_json_formatter
 from conan.cli.formatters.graph.graph_info_text import filter_graph
 from conan.cli.formatters.graph.info_graph_dot import graph_info_dot
 from conan.cli.formatters.graph.info_graph_html import graph_info_html
@@ -142,7 +142,6 @@ def format_graph_json(result):
     graph = result["graph"]
     field_filter = result.get("field_filter")
     package_filter = result.get("package_filter")
-    serial = graph.serialize()
+    serial = graph.serialize(lazy=True)
     serial = filter_graph(serial, package_filter=package_filter, field_filter=field_filter)
-    json_result = json.dumps({"graph": serial}, indent=4)
-    cli_out_write(json_result)
+    stream_json_formatter({"graph": serial})
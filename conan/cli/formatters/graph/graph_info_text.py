@@ -2,20 +2,22 @@ import fnmatch
 from collections import OrderedDict
 
 from conan.api.output import ConanOutput, cli_out_write
+from conan.internal.json_stream import JsonStreamDict
 
 
 def filter_graph(graph, package_filter=None, field_filter=None):
+    # A lazy serialization of the nodes is filtered while it is being written
+    container = JsonStreamDict if isinstance(graph["nodes"], JsonStreamDict) else dict
     if package_filter is not None:
-        graph["nodes"] = {id_: n for id_, n in graph["nodes"].items()
-                          if any(fnmatch.fnmatch(n["ref"] or "", p) for p in package_filter)}
+        graph["nodes"] = container((id_, n) for id_, n in graph["nodes"].items()
+                                   if any(fnmatch.fnmatch(n["ref"] or "", p)
+                                          for p in package_filter))
     if field_filter is not None:
         if "ref" not in field_filter:
             field_filter.append("ref")
-        result = {}
-        for id_, n in graph["nodes"].items():
-            new_node = OrderedDict((k, v) for k, v in n.items() if k in field_filter)
-            result[id_] = new_node
-        graph["nodes"] = result
+        graph["nodes"] = container((id_, OrderedDict((k, v) for k, v in n.items()
+                                                     if k in field_filter))
+                                   for id_, n in graph["nodes"].items())
     return graph
 
 
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+
+from conans.util.files import load, save
+
+GENERATED_FILES_MANIFEST = "conangenerated.json"
+
+
+class GeneratedFiles:
+    """ Write layer for the files created by the generators and the generate() method.
+
+    Files whose contents didn't change are not written again, so their timestamps are kept and
+    build systems like CMake don't reconfigure for nothing. If tracked, the files written in the
+    generators folder are recorded in a manifest per configuration, so files generated by a
+    previous generation of the same configuration that are no longer generated can be removed.
+    Only the built-in generators write through this layer, not the recipes ``save()`` calls.
+    """
+
+    def __init__(self, generators_folder, configuration, track=True):
+        self._folder = os.path.abspath(generators_folder)
+        self._configuration = configuration
+        self._track = track
+        self._files = {}  # {abs_path: changed(bool)}
+
+    def save(self, path, content, encoding="utf-8", newline=""):
+        path = os.path.abspath(path)
+        data = content if newline == "" else content.replace("\n", os.linesep)
+        data = data.encode(encoding)
+        try:
+            with open(path, "rb") as handle:
+                changed = handle.read() != data
+        except OSError:
+            changed = True
+        if changed:
+            dir_path = os.path.dirname(path)
+            os.makedirs(dir_path, exist_ok=True)
+            with open(path, "wb") as handle:
+                handle.write(data)
+        self._files[path] = self._files.get(path, False) or changed
+
+    def _relative_files(self):
+        result = []
+        for f in self._files:
+            try:
+                rel_path = os.path.relpath(f, self._folder)
+            except ValueError:  # Different drive in Windows, cannot be inside the folder
+                continue
+            if not rel_path.startswith(os.pardir + os.sep):
+                result.append(rel_path.replace("\\", "/"))
+        return sorted(result)
+
+    def finish(self, output):
+        """ remove the stale files of this configuration, update the manifest and report """
+        removed = self._remove_stale() if self._track else []
+        changed = [f for f, c in self._files.items() if c]
+        if self._files or removed:
+            output.verbose(f"Generated files: {len(changed)} changed, "
+                           f"{len(self._files) - len(changed)} unchanged, {len(removed)} removed")
+        for f in changed:
+            output.debug(f"Generated file changed: {f}")
+        for f in removed:
+            output.debug(f"Stale generated file removed: {f}")
+
+    def _remove_stale(self):
+        manifest_path = os.path.join(self._folder, GENERATED_FILES_MANIFEST)
+        try:
+            manifest = json.loads(load(manifest_path))
+        except (OSError, ValueError):
+            manifest = {}
+        previous = manifest.pop(self._configuration, [])
+        # The files already removed are forgotten, and so are the configurations without files
+        for config, files in list(manifest.items()):
+            files = [f for f in files if os.path.isfile(os.path.join(self._folder, f))]
+            if files:
+                manifest[config] = files
+            else:
+                manifest.pop(config)
+        generated = self._relative_files()
+        if generated:
+            manifest[self._configuration] = generated
+        # Files still generated by other configurations (multi-config generators) are not stale
+        in_use = set(f for files in manifest.values() for f in files)
+        removed = []
+        for f in previous:
+            if f not in in_use:
+                full_path = os.path.join(self._folder, f)
+                if os.path.isfile(full_path):
+                    os.remove(full_path)
+                    removed.append(f)
+        if manifest:
+            save(manifest_path, json.dumps(manifest, indent=2))
+        elif os.path.isfile(manifest_path):
+            os.remove(manifest_path)
+        return removed
+
+
+def generation_configuration(conanfile):
+    """ a key that identifies the configuration of the conanfile, as several configurations can
+    be generated in the same generators folder
+    """
+    config = conanfile.settings.dumps() + "\n" + conanfile.options.dumps()
+    return hashlib.sha1(config.encode("utf-8")).hexdigest()
+
+
+def save_generated_file(conanfile, path, content, encoding="utf-8", newline=""):
+    """ save a file, through the GeneratedFiles write layer if the conanfile is generating """
+    generated_files = getattr(conanfile, "_conan_generated_files", None)
+    if isinstance(generated_files, GeneratedFiles):
+        generated_files.save(path, content, encoding, newline)
+        return
+    dir_path = os.path.dirname(path)
+    if dir_path:
+        os.makedirs(dir_path, exist_ok=True)
+    with open(path, "w", encoding=encoding, newline=newline) as handle:
+        handle.write(content)
@@ -3,11 +3,13 @@ import os
 import traceback
 import importlib
 
-from conan.internal.cache.home_paths import HomePaths
+from conan.internal.api.install.generated_files import GeneratedFiles, generation_configuration, \
+    save_generated_file
 from conans.client.subsystems import deduce_subsystem, subsystem_path
 from conan.internal.errors import conanfile_exception_formatter
 from conan.errors import ConanException
-from conans.util.files import save, mkdir, chdir
+from conans.model.build_info import memoize_cpp_info
+from conans.util.files import mkdir, chdir
 
 _generators = {"CMakeToolchain": "conan.tools.cmake",
                "CMakeDeps": "conan.tools.cmake",
@@ -77,10 +79,30 @@ def write_generators(conanfile, app, envs_generation=None):
     _receive_generators(conanfile)
 
     hook_manager = app.hook_manager
-    # TODO: Optimize this, so the global generators are not loaded every call to write_generators
-    global_generators = load_cache_generators(HomePaths(app.cache_folder).custom_generators_path)
+    global_generators = app.custom_generators
     hook_manager.execute("pre_generate", conanfile=conanfile)
 
+    # The generated files are only written if they changed, and the stale ones are removed,
+    # unless generating in the project root folder, without a layout, that also has user files
+    project_folders = [f for f in (conanfile.recipe_folder, conanfile.source_folder) if f]
+    track = not any(_same_folder(new_gen_folder, f) for f in project_folders)
+    generated_files = GeneratedFiles(new_gen_folder, generation_configuration(conanfile), track)
+    conanfile._conan_generated_files = generated_files
+    try:
+        _generate(conanfile, global_generators, envs_generation)
+    finally:
+        conanfile._conan_generated_files = None
+    generated_files.finish(conanfile.output)
+
+    hook_manager.execute("post_generate", conanfile=conanfile)
+
+
+def _same_folder(folder, other):
+    return os.path.normcase(os.path.abspath(folder)) == os.path.normcase(os.path.abspath(other))
+
+
+def _generate(conanfile, global_generators, envs_generation):
+    new_gen_folder = conanfile.generators_folder
     if conanfile.generators:
         conanfile.output.highlight(f"Writing generators to {new_gen_folder}")
     # generators check that they are not present in the generators field,
@@ -91,31 +113,36 @@ def write_generators(conanfile, app, envs_generation=None):
         if gen not in old_generators:
             old_generators.append(gen)
     conanfile.generators = []
-    try:
-        for generator_name in old_generators:
-            if isinstance(generator_name, str):
-                global_generator = global_generators.get(generator_name)
-                generator_class = global_generator or _get_generator_class(generator_name)
-            else:
-                generator_class = generator_name
-                generator_name = generator_class.__name__
-            if generator_class:
-                try:
-                    generator = generator_class(conanfile)
-                    mkdir(new_gen_folder)
-                    conanfile.output.info(f"Generator '{generator_name}' calling 'generate()'")
-                    with chdir(new_gen_folder):
-                        generator.generate()
-                    continue
-                except Exception as e:
-                    # When a generator fails, it is very useful to have the whole stacktrace
-                    if not isinstance(e, ConanException):
-                        conanfile.output.error(traceback.format_exc(), error_type="exception")
-                    raise ConanException(f"Error in generator '{generator_name}': {str(e)}") from e
-    finally:
-        # restore the generators attribute, so it can raise
-        # if the user tries to instantiate a generator already present in generators
-        conanfile.generators = old_generators
+    # The dependencies cannot change while generating, their components sorting and
+    # aggregation are computed once, and shared by all the generators
+    deps_cpp_info = [d.cpp_info for d in conanfile.dependencies.values()]
+    with memoize_cpp_info(deps_cpp_info):
+        try:
+            for generator_name in old_generators:
+                if isinstance(generator_name, str):
+                    global_generator = global_generators.get(generator_name)
+                    generator_class = global_generator or _get_generator_class(generator_name)
+                else:
+                    generator_class = generator_name
+                    generator_name = generator_class.__name__
+                if generator_class:
+                    try:
+                        generator = generator_class(conanfile)
+                        mkdir(new_gen_folder)
+                        conanfile.output.info(f"Generator '{generator_name}' calling 'generate()'")
+                        with chdir(new_gen_folder):
+                            generator.generate()
+                        continue
+                    except Exception as e:
+                        # When a generator fails, it is very useful to have the whole stacktrace
+                        if not isinstance(e, ConanException):
+                            conanfile.output.error(traceback.format_exc(), error_type="exception")
+                        raise ConanException(f"Error in generator '{generator_name}': "
+                                             f"{str(e)}") from e
+        finally:
+            # restore the generators attribute, so it can raise
+            # if the user tries to instantiate a generator already present in generators
+            conanfile.generators = old_generators
     if hasattr(conanfile, "generate"):
         conanfile.output.highlight("Calling generate()")
         conanfile.output.info(f"Generators folder: {new_gen_folder}")
@@ -124,25 +151,26 @@ def write_generators(conanfile, app, envs_generation=None):
             with conanfile_exception_formatter(conanfile, "generate"):
                 conanfile.generate()
 
-    if envs_generation is None:
-        if conanfile.virtualbuildenv:
-            mkdir(new_gen_folder)
-            with chdir(new_gen_folder):
-                from conan.tools.env.virtualbuildenv import VirtualBuildEnv
-                env = VirtualBuildEnv(conanfile)
-                # TODO: Check length of env.vars().keys() when adding NotEmpty
-                env.generate()
-        if conanfile.virtualrunenv:
-            mkdir(new_gen_folder)
-            with chdir(new_gen_folder):
-                from conan.tools.env import VirtualRunEnv
-                env = VirtualRunEnv(conanfile)
-                env.generate()
+    # The user generate() can modify the cpp_info of the dependencies at any moment, it
+    # is not memoized, but nothing can change them while generating the environments
+    with memoize_cpp_info(deps_cpp_info):
+        if envs_generation is None:
+            if conanfile.virtualbuildenv:
+                mkdir(new_gen_folder)
+                with chdir(new_gen_folder):
+                    from conan.tools.env.virtualbuildenv import VirtualBuildEnv
+                    env = VirtualBuildEnv(conanfile)
+                    # TODO: Check length of env.vars().keys() when adding NotEmpty
+                    env.generate()
+            if conanfile.virtualrunenv:
+                mkdir(new_gen_folder)
+                with chdir(new_gen_folder):
+                    from conan.tools.env import VirtualRunEnv
+                    env = VirtualRunEnv(conanfile)
+                    env.generate()
 
     _generate_aggregated_env(conanfile)
 
-    hook_manager.execute("post_generate", conanfile=conanfile)
-
 
 def _receive_conf(conanfile):
     """  collect conf_info from the immediate build_requires, aggregate it and injects/update
@@ -202,25 +230,34 @@ def _generate_aggregated_env(conanfile):
                 return ". " + " && . ".join('"{}"'.format(s) for s in files)
             filename = "conan{}.sh".format(group)
             generated.append(filename)
-            save(os.path.join(conanfile.generators_folder, filename), sh_content(shs))
-            save(os.path.join(conanfile.generators_folder, "deactivate_{}".format(filename)),
-                 sh_content(deactivates(shs)))
+            save_generated_file(conanfile, os.path.join(conanfile.generators_folder, filename),
+                                sh_content(shs))
+            save_generated_file(conanfile,
+                                os.path.join(conanfile.generators_folder,
+                                             "deactivate_{}".format(filename)),
+                                sh_content(deactivates(shs)))
         if bats:
             def bat_content(files):
                 return "\r\n".join(["@echo off"] + ['call "{}"'.format(b) for b in files])
             filename = "conan{}.bat".format(group)
             generated.append(filename)
-            save(os.path.join(conanfile.generators_folder, filename), bat_content(bats))
-            save(os.path.join(conanfile.generators_folder, "deactivate_{}".format(filename)),
-                 bat_content(deactivates(bats)))
+            save_generated_file(conanfile, os.path.join(conanfile.generators_folder, filename),
+                                bat_content(bats))
+            save_generated_file(conanfile,
+                                os.path.join(conanfile.generators_folder,
+                                             "deactivate_{}".format(filename)),
+                                bat_content(deactivates(bats)))
         if ps1s:
             def ps1_content(files):
                 return "\r\n".join(['& "{}"'.format(b) for b in files])
             filename = "conan{}.ps1".format(group)
             generated.append(filename)
-            save(os.path.join(conanfile.generators_folder, filename), ps1_content(ps1s))
-            save(os.path.join(conanfile.generators_folder, "deactivate_{}".format(filename)),
-                 ps1_content(deactivates(ps1s)))
+            save_generated_file(conanfile, os.path.join(conanfile.generators_folder, filename),
+                                ps1_content(ps1s))
+            save_generated_file(conanfile,
+                                os.path.join(conanfile.generators_folder,
+                                             "deactivate_{}".format(filename)),
+                                ps1_content(deactivates(ps1s)))
     if generated:
         conanfile.output.highlight("Generating aggregated env files")
         conanfile.output.info(f"Generated aggregated env files: {generated}")
@@ -2,7 +2,7 @@ import os
 import platform
 from collections import OrderedDict, defaultdict
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, meta
 
 from conan import conan_version
 from conan.api.output import ConanOutput
@@ -75,9 +75,41 @@ def _check_correct_cstd(settings):
 """
 
 
+class _LRUMemo:
+    """ bounded memoization dict, discarding the least recently used entries, as the loader
+    lives as long as its ConanAPI, and the keys (profile texts, environment) are not small
+    """
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+
 class ProfileLoader:
+    _MEMO_SIZE = 64
+
     def __init__(self, cache_folder):
         self._home_paths = HomePaths(cache_folder)
+        # Memoization for loading many profiles, or the same ones many times, with this loader
+        self._environments = _LRUMemo(self._MEMO_SIZE)  # {base_path: jinja2 Environment}
+        # {(base_path, text): (compiled template, includes other templates)}
+        self._templates = _LRUMemo(self._MEMO_SIZE)
+        self._rendered = _LRUMemo(self._MEMO_SIZE)  # {(path, text, cwd, environ): rendered}
+        self._parsed = _LRUMemo(self._MEMO_SIZE)  # {rendered text: _ProfileParser}
 
     def from_cli_args(self, profiles, settings, options, conf, cwd):
         """ Return a Profile object, as the result of merging a potentially existing Profile
@@ -113,28 +145,58 @@ class ProfileLoader:
         except Exception as e:
             raise ConanException(f"Cannot load profile:\n{e}")
 
-        # All profiles will be now rendered with jinja2 as first pass
+        text = self._render(text, profile_path)
+
+        try:
+            return self._recurse_load_profile(text, profile_path)
+        except ConanException as exc:
+            raise ConanException("Error reading '%s' profile: %s" % (profile_name, exc))
+
+    def _render(self, text, profile_path):
+        """ All profiles are rendered with jinja2 as first pass. The compiled templates are reused
+        for the same text, and the rendered result too, if the current directory and environment
+        didn't change, as they are the only inputs of the rendering context that might change,
+        and the template doesn't include other templates, that could have changed
+        """
         base_path = os.path.dirname(profile_path)
         file_path = os.path.basename(profile_path)
+        rendered_key = (profile_path, text, os.getcwd(), frozenset(os.environ.items()))
+        rendered = self._rendered.get(rendered_key)
+        if rendered is not None:
+            return rendered
+
+        template = self._templates.get((base_path, text))
+        if template is not None:
+            rtemplate, references = template
+        else:
+            env = self._environments.get(base_path)
+            if env is None:
+                # Included templates are not cached, they are loaded again in every render
+                env = Environment(loader=FileSystemLoader(base_path), cache_size=0)
+                self._environments[base_path] = env
+            try:
+                ast = env.parse(text)
+            except Exception as e:
+                raise ConanException(f"Error while rendering the profile template file "
+                                     f"'{profile_path}'. Check your Jinja2 syntax: {str(e)}")
+            references = any(True for _ in meta.find_referenced_templates(ast))
+            rtemplate = env.from_string(ast)
+            self._templates[(base_path, text)] = rtemplate, references
+
         context = {"platform": platform,
                    "os": os,
                    "profile_dir": base_path,
                    "profile_name": file_path,
                    "conan_version": conan_version,
                    "detect_api": detect_api}
-
-        rtemplate = Environment(loader=FileSystemLoader(base_path)).from_string(text)
-
         try:
-            text = rtemplate.render(context)
+            rendered = rtemplate.render(context)
         except Exception as e:
             raise ConanException(f"Error while rendering the profile template file '{profile_path}'. "
                                  f"Check your Jinja2 syntax: {str(e)}")
-
-        try:
-            return self._recurse_load_profile(text, profile_path)
-        except ConanException as exc:
-            raise ConanException("Error reading '%s' profile: %s" % (profile_name, exc))
+        if not references:
+            self._rendered[rendered_key] = rendered
+        return rendered
 
     def _recurse_load_profile(self, text, profile_path):
         """ Parse and return a Profile object from a text config like representation.
@@ -143,7 +205,10 @@ class ProfileLoader:
         try:
             inherited_profile = Profile()
             cwd = os.path.dirname(os.path.abspath(profile_path)) if profile_path else None
-            profile_parser = _ProfileParser(text)
+            profile_parser = self._parsed.get(text)
+            if profile_parser is None:
+                profile_parser = _ProfileParser(text)
+                self._parsed[text] = profile_parser
             # Iterate the includes and call recursive to get the profile and variables
             # from parent profiles
             for include in profile_parser.includes:
@@ -2,6 +2,7 @@ import fnmatch
 import os
 import shutil
 import time
+from multiprocessing.pool import ThreadPool
 
 from conan.internal.conan_app import ConanApp
 from conan.api.output import ConanOutput
@@ -23,15 +24,36 @@ class UploadUpstreamChecker:
     revision already exists in the remote server, or if the --force parameter is forcing the upload
     This is completely irrespective of the actual package contents, it only uses the local
     computed revision and the remote one
+
+    The checks can run concurrently with ``core.upload:check_parallel`` threads. The packages of
+    a recipe revision that is not in the server cannot be there, and are not checked
     """
-    def __init__(self, app: ConanApp):
+    def __init__(self, app: ConanApp, global_conf):
         self._app = app
+        self._parallel = global_conf.get("core.upload:check_parallel", default=1, check_type=int)
+
+    def _map(self, func, items):
+        if self._parallel <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        thread_pool = ThreadPool(min(self._parallel, len(items)))
+        try:
+            return thread_pool.map(func, items)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
 
     def check(self, upload_bundle, remote, force):
-        for ref, recipe_bundle in upload_bundle.refs().items():
-            self._check_upstream_recipe(ref, recipe_bundle, remote, force)
+        recipes = list(upload_bundle.refs().items())
+        in_server = self._map(lambda r: self._check_upstream_recipe(*r, remote, force), recipes)
+        prefs = []
+        for (ref, recipe_bundle), recipe_in_server in zip(recipes, in_server):
             for pref, prev_bundle in upload_bundle.prefs(ref, recipe_bundle).items():
-                self._check_upstream_package(pref, prev_bundle, remote, force)
+                if recipe_in_server:
+                    prefs.append((pref, prev_bundle))
+                else:
+                    assert (pref.revision is not None), "Cannot upload a package without PREV"
+                    self._package_upload(pref, prev_bundle, False, force)
+        self._map(lambda p: self._check_upstream_package(*p, remote, force), prefs)
 
     def _check_upstream_recipe(self, ref, ref_bundle, remote, force):
         output = ConanOutput(scope=str(ref))
@@ -44,6 +66,7 @@ class UploadUpstreamChecker:
         except NotFoundException:
             ref_bundle["force_upload"] = False
             ref_bundle["upload"] = True
+            return False
         else:
             if force:
                 output.info(f"Recipe '{ref.repr_notime()}' already in server, forcing upload")
@@ -53,6 +76,7 @@ class UploadUpstreamChecker:
                 output.info(f"Recipe '{ref.repr_notime()}' already in server, skipping upload")
                 ref_bundle["upload"] = False
                 ref_bundle["force_upload"] = False
+            return True
 
     def _check_upstream_package(self, pref, prev_bundle, remote, force):
         assert (pref.revision is not None), "Cannot upload a package without PREV"
@@ -63,18 +87,25 @@ class UploadUpstreamChecker:
             server_revisions = self._app.remote_manager.get_package_revision_reference(pref, remote)
             assert server_revisions
         except NotFoundException:
+            self._package_upload(pref, prev_bundle, False, force)
+        else:
+            self._package_upload(pref, prev_bundle, True, force)
+
+    @staticmethod
+    def _package_upload(pref, prev_bundle, in_server, force):
+        if not in_server:
             prev_bundle["force_upload"] = False
             prev_bundle["upload"] = True
+            return
+        output = ConanOutput(scope=str(pref.ref))
+        if force:
+            output.info(f"Package '{pref.repr_notime()}' already in server, forcing upload")
+            prev_bundle["force_upload"] = True
+            prev_bundle["upload"] = True
         else:
-            output = ConanOutput(scope=str(pref.ref))
-            if force:
-                output.info(f"Package '{pref.repr_notime()}' already in server, forcing upload")
-                prev_bundle["force_upload"] = True
-                prev_bundle["upload"] = True
-            else:
-                output.info(f"Package '{pref.repr_notime()}' already in server, skipping upload")
-                prev_bundle["force_upload"] = False
-                prev_bundle["upload"] = False
+            output.info(f"Package '{pref.repr_notime()}' already in server, skipping upload")
+            prev_bundle["force_upload"] = False
+            prev_bundle["upload"] = False
 
 
 class PackagePreparator:
@@ -50,6 +50,11 @@ class PkgCache:
     def builds_folder(self):
         return os.path.join(self._base_folder, "b")
 
+    @property
+    def graphs_folder(self):
+        """ resolved graphs of previous computations, reused by later ones with the same inputs"""
+        return os.path.join(self._base_folder, "graphs")
+
     def _create_path(self, relative_path, remove_contents=True):
         path = self._full_path(relative_path)
         if os.path.exists(path) and remove_contents:
@@ -124,6 +129,10 @@ class PkgCache:
         ref_data = self._db.get_latest_recipe(ref)
         return ref_data.get("ref")
 
+    def recipes_state(self):
+        """ changes every time a recipe revision is stored, removed or updated in the cache """
+        return self._db.recipes_state()
+
     def get_recipe_revisions_references(self, ref: RecipeReference):
         # For listing multiple revisions only
         assert ref.revision is None
@@ -14,6 +14,7 @@ FINALIZE_FOLDER = "f"
 EXPORT_FOLDER = "e"
 EXPORT_SRC_FOLDER = "es"
 DOWNLOAD_EXPORT_FOLDER = "d"
+BYTECODE_FOLDER = "pyc"
 METADATA = "metadata"
 
 
@@ -76,6 +76,9 @@ class CacheDatabase:
         """ Returns the reference data as a dictionary (or fails) """
         return self._recipes.get_latest_recipe(ref)
 
+    def recipes_state(self):
+        return self._recipes.state()
+
     def get_recipe_revisions_references(self, ref: RecipeReference):
         return self._recipes.get_recipe_revisions_references(ref)
 
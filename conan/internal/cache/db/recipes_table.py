@@ -78,6 +78,16 @@ class RecipesDBTable(BaseDbTable):
         with self.db_connection() as conn:
             conn.execute(query)
 
+    def state(self):
+        """ a summary of the stored recipe revisions, that changes when any of them is added,
+        removed or its timestamp updated, but not when they are just used (lru)
+        """
+        query = f'SELECT COUNT(*), MAX({self.columns.timestamp}), ' \
+                f'TOTAL({self.columns.timestamp}) FROM {self.table_name}'
+        with self.db_connection() as conn:
+            r = conn.execute(query)
+            return tuple(r.fetchone())
+
     # returns all different conan references (name/version@user/channel)
     def all_references(self):
         query = f'SELECT DISTINCT {self.columns.reference} FROM {self.table_name}'
@@ -0,0 +1,113 @@
+import hashlib
+import json
+import os
+
+from conan.api.output import ConanOutput
+from conans import __version__
+from conans.client.graph.graph import CONTEXT_HOST
+from conans.model.graph_lock import Lockfile
+from conans.model.recipe_ref import RecipeReference
+from conans.util.files import load, save
+
+
+class GraphCache:
+    """ Stores the resolved references of the dependency graphs computed, as a lockfile, under a
+    fingerprint of all the inputs of the computation: the consumer conanfile, the profiles, the
+    lockfile, the global configuration, the remotes and the state of the recipes in the cache.
+
+    A later computation with the same fingerprint is expanded locked to those references, so it
+    doesn't need to resolve version ranges or check the remotes for the recipes again.
+
+    The entries are stored with the state of the recipes in the cache after the expansion, as it
+    can download new recipes from the remotes, so only a later computation that would find
+    exactly the same recipes in the cache reuses it. Only the most recently used entries are kept.
+    """
+    _MAX_ENTRIES = 100
+
+    def __init__(self, cache, global_conf, editable_packages):
+        self._folder = cache.graphs_folder
+        self._cache = cache
+        self._global_conf = global_conf
+        self._editable_packages = editable_packages
+
+    def fingerprint(self, root_node, profile_host, profile_build, lockfile, remotes):
+        """ the fingerprint of the inputs of the computation, except the recipes in the cache, it
+        must be computed before the expansion, that modifies the requirements of the root node
+        """
+        conanfile = root_node.conanfile
+        sha = hashlib.sha256()
+
+        def _update(*items):
+            for item in items:
+                sha.update(str(item).encode("utf-8"))
+                sha.update(b"\0")
+
+        _update(__version__, root_node.context == CONTEXT_HOST, root_node.ref,
+                profile_host.dumps(), profile_build.dumps(), self._global_conf.dumps())
+
+        def _update_recipe(path):
+            _update(load(path))
+            conandata = os.path.join(os.path.dirname(path), "conandata.yml")
+            if os.path.isfile(conandata):
+                _update(load(conandata))
+
+        if root_node.path:
+            _update_recipe(root_node.path)
+        # The editable packages replace the cache ones, and their recipes can change any time
+        for ref, editable in sorted(self._editable_packages.edited_refs.items(),
+                                    key=lambda e: repr(e[0])):
+            _update(repr(ref), editable["path"], editable.get("output_folder"))
+            if os.path.isfile(editable["path"]):
+                _update_recipe(editable["path"])
+        _update(*[(repr(r.ref), r.serialize()) for r in conanfile.requires.values()])
+        python_requires = getattr(conanfile, "python_requires", None)
+        if python_requires is not None and hasattr(python_requires, "all_refs"):
+            _update(*[repr(r) for r in python_requires.all_refs()])
+        _update(lockfile.dumps() if lockfile is not None else None)
+        _update(*[(r.name, r.url, r.disabled, r.allowed_packages) for r in remotes])
+        return sha.hexdigest()
+
+    def _path(self, fingerprint):
+        # The entry of these inputs with the current recipes in the cache
+        sha = hashlib.sha256(f"{fingerprint}:{self._cache.recipes_state()}".encode("utf-8"))
+        return os.path.join(self._folder, sha.hexdigest() + ".json")
+
+    def get(self, fingerprint):
+        """ the lockfile and resolved version ranges of a previous computation, None if there
+        is no previous computation or it cannot be read
+        """
+        path = self._path(fingerprint)
+        if not os.path.isfile(path):
+            return None
+        try:
+            os.utime(path)  # The most recently used entries are the ones kept
+            data = json.loads(load(path))
+            lockfile = Lockfile.deserialize(data["lockfile"])
+            resolved_ranges = {RecipeReference.loads(k): RecipeReference.loads(v)
+                               for k, v in data["resolved_ranges"].items()}
+        except Exception as e:
+            ConanOutput().warning(f"Ignoring broken graph cache entry {path}: {e}")
+            return None
+        # Not a user lockfile, it must not fail for requirements it doesn't contain
+        lockfile.partial = True
+        return lockfile, resolved_ranges
+
+    def store(self, fingerprint, deps_graph):
+        if deps_graph.error:
+            return
+        data = {"lockfile": Lockfile(deps_graph).serialize(),
+                "resolved_ranges": {repr(k): repr(v) for k, v in
+                                    deps_graph.resolved_ranges.items()}}
+        save(self._path(fingerprint), json.dumps(data))
+        self._prune()
+
+    def _prune(self):
+        entries = [os.path.join(self._folder, f) for f in os.listdir(self._folder)]
+        if len(entries) <= self._MAX_ENTRIES:
+            return
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for entry in entries[self._MAX_ENTRIES:]:
+            try:
+                os.remove(entry)
+            except OSError:  # Removed by another concurrent process
+                pass
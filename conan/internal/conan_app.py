@@ -1,6 +1,7 @@
 import os
 
 from conan.api.output import ConanOutput
+from conan.internal.api.install.generators import load_cache_generators
 from conan.internal.cache.cache import PkgCache
 from conan.internal.cache.home_paths import HomePaths
 from conans.client.graph.proxy import ConanProxy
@@ -64,7 +65,16 @@ class ConanApp:
         cmd_wrap = CmdWrapper(home_paths.wrapper_path)
         conanfile_helpers = ConanFileHelpers(self.requester, cmd_wrap, global_conf, self.cache,
                                              self.cache_folder)
-        self.loader = ConanFileLoader(self.pyreq_loader, conanfile_helpers)
+        self.loader = ConanFileLoader(self.pyreq_loader, conanfile_helpers, self.cache)
+        self._custom_generators = None
+
+    @property
+    def custom_generators(self):
+        """ user generators in the cache extensions, loaded only once per app, when needed"""
+        if self._custom_generators is None:
+            generators_path = HomePaths(self.cache_folder).custom_generators_path
+            self._custom_generators = load_cache_generators(generators_path)
+        return self._custom_generators
 
     @staticmethod
     def _configure(global_conf):
@@ -1,13 +1,14 @@
 import filecmp
 import os
 import shutil
+from multiprocessing.pool import ThreadPool
 
 from conan.internal.cache.home_paths import HomePaths
 from conan.api.output import ConanOutput
 from conans.client.loader import load_python_file
 from conan.internal.errors import conanfile_exception_formatter
 from conan.errors import ConanException
-from conans.util.files import rmdir, mkdir
+from conans.util.files import rmdir, mkdir, reflink_file
 
 
 def _find_deployer(d, cache_deploy_folder):
@@ -83,6 +84,7 @@ def full_deploy(graph, output_folder):
     # TODO: Document that this will NOT work with editables
     conanfile = graph.root.conanfile
     conanfile.output.info(f"Conan built-in full deployer to {output_folder}")
+    deploys = []
     for dep in conanfile.dependencies.values():
         if dep.package_folder is None:
             continue
@@ -93,7 +95,8 @@ def full_deploy(graph, output_folder):
             folder_name = os.path.join(folder_name, build_type)
         if arch:
             folder_name = os.path.join(folder_name, arch)
-        _deploy_single(dep, conanfile, output_folder, folder_name)
+        deploys.append((dep, folder_name))
+    _deploy_all(conanfile, output_folder, deploys)
 
 
 def runtime_deploy(graph, output_folder):
@@ -107,6 +110,8 @@ def runtime_deploy(graph, output_folder):
                    "Please give feedback at https://github.com/conan-io/conan/issues")
     mkdir(output_folder)
     symlinks = conanfile.conf.get("tools.deployer:symlinks", check_type=bool, default=True)
+    mode, parallel = _deploy_mode(conanfile)
+    files = {}  # The files are copied at the end, concurrently, destination: (source, dep)
     for req, dep in conanfile.dependencies.host.items():
         if not req.run:  # Avoid deploying unused binaries at runtime
             continue
@@ -119,21 +124,35 @@ def runtime_deploy(graph, output_folder):
             if not os.path.isdir(bindir):
                 output.warning(f"{dep.ref} {bindir} does not exist")
                 continue
-            count += _flatten_directory(dep, bindir, output_folder, symlinks)
+            count += _flatten_directory(dep, bindir, output_folder, symlinks, files=files)
 
         for libdir in cpp_info.libdirs:
             if not os.path.isdir(libdir):
                 output.warning(f"{dep.ref} {libdir} does not exist")
                 continue
-            count += _flatten_directory(dep, libdir, output_folder, symlinks, [".dylib", ".so"])
+            count += _flatten_directory(dep, libdir, output_folder, symlinks, [".dylib", ".so"],
+                                        files=files)
 
         output.info(f"Copied {count} files from {dep.ref}")
+
+    def _copy(item):
+        dest_filepath, (src_filepath, dep_) = item
+        try:
+            _deploy_file(src_filepath, dest_filepath, symlinks, mode)
+            output.verbose(f"Copied {src_filepath} into {output_folder}")
+        except Exception as e:
+            if "WinError 1314" in str(e):
+                ConanOutput().error("runtime_deploy: Windows symlinks require admin privileges "
+                                    "or 'Developer mode = ON'", error_type="exception")
+            raise ConanException(f"runtime_deploy: Copy of '{dep_}' files failed: {e}.\nYou can "
+                                 f"use 'tools.deployer:symlinks' conf to disable symlinks")
+    _map(_copy, list(files.items()), parallel)
     conanfile.output.success(f"Runtime deployed to folder: {output_folder}")
 
 
-def _flatten_directory(dep, src_dir, output_dir, symlinks, extension_filter=None):
+def _flatten_directory(dep, src_dir, output_dir, symlinks, extension_filter=None, files=None):
     """
-    Copy all the files from the source directory in a flat output directory.
+    Collect all the files from the source directory to be copied in a flat output directory.
     An optional string, named extension_filter, can be set to copy only the files with
     the listed extensions.
     """
@@ -147,32 +166,128 @@ def _flatten_directory(dep, src_dir, output_dir, symlinks, extension_filter=None
 
             src_filepath = os.path.join(src_dirpath, src_filename)
             dest_filepath = os.path.join(output_dir, src_filename)
-            if os.path.exists(dest_filepath):
-                if filecmp.cmp(src_filepath, dest_filepath):  # Be efficient, do not copy
+            # The file might be pending to be copied from another dependency
+            existing = files[dest_filepath][0] if dest_filepath in files else dest_filepath
+            if os.path.exists(existing):
+                if filecmp.cmp(src_filepath, existing):  # Be efficient, do not copy
                     output.verbose(f"{dest_filepath} exists with same contents, skipping copy")
                     continue
                 else:
                     output.warning(f"{dest_filepath} exists and will be overwritten")
 
-            try:
-                file_count += 1
-                shutil.copy2(src_filepath, dest_filepath, follow_symlinks=symlinks)
-                output.verbose(f"Copied {src_filepath} into {output_dir}")
-            except Exception as e:
-                if "WinError 1314" in str(e):
-                    ConanOutput().error("runtime_deploy: Windows symlinks require admin privileges "
-                                        "or 'Developer mode = ON'", error_type="exception")
-                raise ConanException(f"runtime_deploy: Copy of '{dep}' files failed: {e}.\nYou can "
-                                     f"use 'tools.deployer:symlinks' conf to disable symlinks")
+            file_count += 1
+            files[dest_filepath] = src_filepath, dep
     return file_count
 
 
+def _deploy_mode(conanfile):
+    mode = conanfile.conf.get("tools.deployer:mode", default="copy",
+                              choices=["copy", "hardlink", "reflink", "symlink"])
+    parallel = conanfile.conf.get("tools.deployer:parallel", default=1, check_type=int)
+    return mode, parallel
+
+
+def _map(func, items, parallel):
+    if parallel <= 1 or len(items) <= 1:
+        for item in items:
+            func(item)
+        return
+    thread_pool = ThreadPool(min(parallel, len(items)))
+    try:
+        thread_pool.map(func, items)
+    finally:
+        thread_pool.close()
+        thread_pool.join()
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        rmdir(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _deploy_file(src, dst, symlinks, mode):
+    """ deploys the src file into dst with the mode, unless dst is already the same file, so
+    re-deploying is incremental. Returns True if dst was written
+    """
+    if symlinks and os.path.islink(src):
+        link = os.readlink(src)
+        if os.path.islink(dst) and os.readlink(dst) == link:
+            return False
+        _remove(dst)
+        os.symlink(link, dst)
+        return True
+    if mode == "symlink":
+        src = os.path.abspath(src)
+        if os.path.islink(dst) and os.readlink(dst) == src:
+            return False
+    elif os.path.isfile(dst) and not os.path.islink(dst):
+        if os.path.samefile(src, dst):
+            # A hardlink of a previous deploy, only valid if still deploying hardlinks
+            if mode == "hardlink":
+                return False
+        elif filecmp.cmp(src, dst, shallow=False):
+            return False
+    _remove(dst)
+    if mode == "symlink":
+        os.symlink(src, dst)
+        return True
+    if mode == "hardlink":
+        try:
+            os.link(src, dst)
+            return True
+        except OSError:  # Different filesystems, fallback to a copy
+            pass
+    elif mode == "reflink":
+        try:
+            reflink_file(src, dst)
+            return True
+        except OSError:  # Not supported by the filesystem, fallback to a copy
+            _remove(dst)
+    shutil.copy2(src, dst)
+    return True
+
+
+def _deploy_tree(src, dst, symlinks, mode):
+    """ makes the dst folder an image of the src one, only writing the files that are not already
+    the same in dst, and removing the ones that are not in src
+    """
+    dst = os.path.normpath(dst)
+    existed = os.path.isdir(dst) and not os.path.islink(dst)
+    if not existed:
+        _remove(dst)
+    expected = {dst}
+    for root, subfolders, files in os.walk(src, followlinks=not symlinks):
+        dst_root = os.path.normpath(os.path.join(dst, os.path.relpath(root, src)))
+        if os.path.islink(dst_root) or os.path.isfile(dst_root):
+            _remove(dst_root)
+        os.makedirs(dst_root, exist_ok=True)
+        expected.add(dst_root)
+        if symlinks:  # The symlinks to folders are deployed as symlinks, not walked
+            links = [f for f in subfolders if os.path.islink(os.path.join(root, f))]
+            subfolders[:] = [f for f in subfolders if f not in links]
+            files = files + links
+        for f in files:
+            dst_file = os.path.join(dst_root, f)
+            _deploy_file(os.path.join(root, f), dst_file, symlinks, mode)
+            expected.add(dst_file)
+        shutil.copystat(root, dst_root)
+
+    if existed:
+        for root, subfolders, files in os.walk(dst, topdown=False):
+            for f in files + subfolders:
+                path = os.path.join(root, f)
+                if path not in expected:
+                    _remove(path)
+
+
 def _deploy_single(dep, conanfile, output_folder, folder_name):
     new_folder = os.path.join(output_folder, folder_name)
-    rmdir(new_folder)
     symlinks = conanfile.conf.get("tools.deployer:symlinks", check_type=bool, default=True)
+    mode, _ = _deploy_mode(conanfile)
     try:
-        shutil.copytree(dep.package_folder, new_folder, symlinks=symlinks)
+        _deploy_tree(dep.package_folder, new_folder, symlinks, mode)
     except Exception as e:
         if "WinError 1314" in str(e):
             ConanOutput().error("full_deploy: Symlinks in Windows require admin privileges "
@@ -182,6 +297,13 @@ def _deploy_single(dep, conanfile, output_folder, folder_name):
     dep.set_deploy_folder(new_folder)
 
 
+def _deploy_all(conanfile, output_folder, deploys):
+    """ deploys every (dep, folder_name) of the list, concurrently with tools.deployer:parallel
+    """
+    _, parallel = _deploy_mode(conanfile)
+    _map(lambda d: _deploy_single(d[0], conanfile, output_folder, d[1]), deploys, parallel)
+
+
 def direct_deploy(graph, output_folder):
     """
     Deploys to output_folder a single package,
@@ -194,5 +316,6 @@ def direct_deploy(graph, output_folder):
     # If the argument is --requires, the current conanfile is a virtual one with 1 single
     # dependency, the "reference" package. If the argument is a local path, then all direct
     # dependencies
-    for dep in conanfile.dependencies.filter({"direct": True}).values():
-        _deploy_single(dep, conanfile, output_folder, dep.ref.name)
+    deploys = [(dep, dep.ref.name)
+               for dep in conanfile.dependencies.filter({"direct": True}).values()]
+    _deploy_all(conanfile, output_folder, deploys)
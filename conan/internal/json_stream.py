@@ -0,0 +1,160 @@
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonStreamDict:
+    """ A dictionary whose items are generated while it is being written by iter_json(), so the
+    whole content, like the serialization of all the nodes of a large graph, never needs to be in
+    memory at the same time. It can be iterated only once.
+    """
+    def __init__(self, items):
+        self._items = items  # iterable of (key, value)
+
+    def items(self):
+        return self._items
+
+
+def _key(key):
+    # same conversion of keys as json.dumps
+    if isinstance(key, str):
+        return json.dumps(key)
+    return json.dumps(json.dumps(key))
+
+
+def iter_json(data, indent=4, depth=3):
+    """ yields the text of data as json, in chunks, exactly as json.dumps(data, indent=indent).
+    Generators and JsonStreamDict are consumed while writing. Plain dicts and lists are written
+    item by item up to ``depth`` levels, deeper ones in a single chunk
+    """
+    yield from _iter_json(data, indent, depth, 0)
+
+
+def _iter_json(data, indent, depth, level):
+    lazy = isinstance(data, JsonStreamDict) or (hasattr(data, "__next__"))
+    if not lazy and (level >= depth or not isinstance(data, (dict, list, tuple))):
+        text = json.dumps(data, indent=indent)
+        if level:
+            text = text.replace("\n", "\n" + " " * (indent * level))
+        yield text
+        return
+
+    is_dict = isinstance(data, (dict, JsonStreamDict))
+    items = data.items() if is_dict else data
+    opening, closing = ("{", "}") if is_dict else ("[", "]")
+    separator = "\n" + " " * (indent * (level + 1))
+    first = True
+    for item in items:
+        prefix = opening + separator if first else "," + separator
+        first = False
+        if is_dict:
+            key, value = item
+            prefix += _key(key) + ": "
+        else:
+            value = item
+        yield prefix
+        yield from _iter_json(value, indent, depth, level + 1)
+    if first:
+        yield opening + closing
+    else:
+        yield "\n" + " " * (indent * level) + closing
+
+
+class _JsonStreamReader:
+    def __init__(self, handle, chunk_size):
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """ drop the already parsed text and read more, False if there is nothing else to read """
+        if self._eof:
+            return False
+        data = self._handle.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def _error(self, msg):
+        return json.JSONDecodeError(msg, self._buffer, self._pos)
+
+    def peek(self):
+        """ the next non-whitespace char, without consuming it, None at the end """
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, chars):
+        char = self.peek()
+        if char is None or char not in chars:
+            raise self._error(f"Expecting one of '{chars}'")
+        self._pos += 1
+        return char
+
+    def _decode(self):
+        if self.peek() is None:
+            raise self._error("Expecting value")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():  # The value might be incomplete, keep reading
+                    continue
+                raise
+            # A number at the end of the buffer might continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def walk(self, path, pattern):
+        char = self.peek()
+        if len(path) >= len(pattern) or char not in ("{", "["):
+            yield path, self._decode()
+            return
+        self._pos += 1
+        closing = "}" if char == "{" else "]"
+        if self.peek() == closing:
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            if char == "{":
+                key = self._decode()
+                if not isinstance(key, str):
+                    raise self._error("Expecting property name enclosed in double quotes")
+                self._expect(":")
+            else:
+                key = index
+                index += 1
+            if pattern[len(path)] in ("*", key):
+                yield from self.walk(path + (key,), pattern)
+            else:
+                yield path + (key,), self._decode()
+            if self._expect("," + closing) == closing:
+                return
+
+
+def iter_json_file(path, pattern, chunk_size=1 << 16):
+    """ reads a json file incrementally, without loading the whole text or document in memory.
+    The containers matching ``pattern``, a tuple of keys, indexes or "*", are walked, and
+    it yields (path, value) for every value not walked into, like:
+
+        iter_json_file(f, ("order", "*", "*")) => (("order_by",), "recipe"),
+                                                  (("order", 0, 0), {...}), ...
+    """
+    with open(path, "r", encoding="utf-8", newline="") as handle:
+        reader = _JsonStreamReader(handle, chunk_size)
+        yield from reader.walk((), pattern)
+        if reader.peek() is not None:
+            raise reader._error("Extra data")
@@ -0,0 +1,26 @@
+from functools import lru_cache
+
+from jinja2 import Environment, Undefined
+
+
+@lru_cache(maxsize=None)
+def _template_environment(trim_blocks, lstrip_blocks, keep_trailing_newline, undefined):
+    # One shared environment per different configuration, most generators use the same one
+    return Environment(trim_blocks=trim_blocks, lstrip_blocks=lstrip_blocks,
+                       keep_trailing_newline=keep_trailing_newline, undefined=undefined)
+
+
+@lru_cache(maxsize=512)
+def _compiled_template(text, trim_blocks, lstrip_blocks, keep_trailing_newline, undefined):
+    env = _template_environment(trim_blocks, lstrip_blocks, keep_trailing_newline, undefined)
+    return env.from_string(text)
+
+
+def get_template(text, trim_blocks=False, lstrip_blocks=False, keep_trailing_newline=False,
+                 undefined=Undefined):
+    """ Drop-in replacement of ``jinja2.Template(text, ...)`` for the built-in generators and
+    toolchains. The compiled template is cached by its text and options, so the same template
+    used for every dependency, every block or every call is only compiled once per process.
+    Jinja2 templates are immutable once compiled, so they can be rendered concurrently.
+    """
+    return _compiled_template(text, trim_blocks, lstrip_blocks, keep_trailing_newline, undefined)
@@ -2,12 +2,12 @@ import os
 import textwrap
 from collections import OrderedDict
 
-from jinja2 import Template
-
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conan.errors import ConanException
 from conans.model.dependencies import get_transitive_requires
-from conans.util.files import load, save
+from conans.util.files import load
 from conan.tools.apple.apple import _to_apple_arch
 
 GLOBAL_XCCONFIG_TEMPLATE = textwrap.dedent("""\
@@ -123,7 +123,7 @@ class XcodeDeps(object):
             raise ConanException("XcodeDeps.architecture is None, it should have a value")
         generator_files = self._content()
         for generator_file, content in generator_files.items():
-            save(generator_file, content)
+            save_generated_file(self._conanfile, generator_file, content)
 
     def _conf_xconfig_file(self, require, pkg_name, comp_name, package_folder, transitive_cpp_infos):
         """
@@ -169,7 +169,7 @@ class XcodeDeps(object):
             fields["linker_flags"] = ""
             fields["exe_flags"] = ""
 
-        template = Template(self._conf_xconfig)
+        template = get_template(self._conf_xconfig)
         content_multi = template.render(**fields)
         return content_multi
 
@@ -188,10 +188,10 @@ class XcodeDeps(object):
                         else f"conan_{_format_name(component[0])}_{_format_name(component[1])}.xcconfig"
                         for component in components]
 
-            content_multi = Template(content_multi).render({"pkg_name": pkg_name,
-                                                            "comp_name": comp_name,
-                                                            "dep_xconfig_filename": dep_xconfig_filename,
-                                                            "deps_includes": _get_includes(reqs)})
+            content_multi = get_template(content_multi).render({"pkg_name": pkg_name,
+                                                                "comp_name": comp_name,
+                                                                "dep_xconfig_filename": dep_xconfig_filename,
+                                                                "deps_includes": _get_includes(reqs)})
 
         if dep_xconfig_filename not in content_multi:
             content_multi = content_multi.replace('.xcconfig"',
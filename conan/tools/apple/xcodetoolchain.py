@@ -1,10 +1,10 @@
 import textwrap
 
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
 from conan.tools.apple.apple import to_apple_arch
 from conan.tools.apple.xcodedeps import GLOBAL_XCCONFIG_FILENAME, GLOBAL_XCCONFIG_TEMPLATE, \
     _add_includes_to_file_or_create, _xcconfig_settings_filename, _xcconfig_conditional
-from conans.util.files import save
 
 
 class XcodeToolchain(object):
@@ -48,11 +48,14 @@ class XcodeToolchain(object):
 
     def generate(self):
         check_duplicated_generator(self, self._conanfile)
-        save(self._agreggated_xconfig_filename, self._agreggated_xconfig_content)
-        save(self._vars_xconfig_filename, self._vars_xconfig_content)
+        save_generated_file(self._conanfile, self._agreggated_xconfig_filename,
+                            self._agreggated_xconfig_content)
+        save_generated_file(self._conanfile, self._vars_xconfig_filename,
+                            self._vars_xconfig_content)
         if self._check_if_extra_flags:
-            save(self._flags_xcconfig_filename, self._flags_xcconfig_content)
-        save(GLOBAL_XCCONFIG_FILENAME, self._global_xconfig_content)
+            save_generated_file(self._conanfile, self._flags_xcconfig_filename,
+                                self._flags_xcconfig_content)
+        save_generated_file(self._conanfile, GLOBAL_XCCONFIG_FILENAME, self._global_xconfig_content)
 
     @property
     def _cppstd(self):
@@ -1,10 +1,11 @@
 import textwrap
+from multiprocessing.pool import ThreadPool
 
 import jinja2
-from jinja2 import Template
 
 from conan.api.output import Color
 from conan.internal import check_duplicated_generator
+from conan.internal.templates import get_template
 from conan.tools.cmake.cmakedeps import FIND_MODE_CONFIG, FIND_MODE_NONE, FIND_MODE_BOTH, \
     FIND_MODE_MODULE
 from conan.tools.cmake.cmakedeps.templates.config import ConfigTemplate
@@ -13,7 +14,7 @@ from conan.tools.cmake.cmakedeps.templates.macros import MacrosTemplate
 from conan.tools.cmake.cmakedeps.templates.target_configuration import TargetConfigurationTemplate
 from conan.tools.cmake.cmakedeps.templates.target_data import ConfigDataTemplate
 from conan.tools.cmake.cmakedeps.templates.targets import TargetsTemplate
-from conan.tools.files import save
+from conan.internal.api.install.generated_files import save_generated_file
 from conan.errors import ConanException
 from conans.model.dependencies import get_transitive_requires
 
@@ -45,8 +46,16 @@ class CMakeDeps(object):
 
         # Current directory is the generators_folder
         generator_files = self.content
-        for generator_file, content in generator_files.items():
-            save(self._conanfile, generator_file, content)
+        parallel = self._conanfile.conf.get("tools.cmake.cmakedeps:parallel", default=1,
+                                            check_type=int)
+        if parallel > 1 and len(generator_files) > 1:
+            # All the contents are already rendered, only the writing to disk is concurrent
+            with ThreadPool(parallel) as pool:
+                pool.starmap(lambda f, c: save_generated_file(self._conanfile, f, c),
+                             generator_files.items())
+        else:
+            for generator_file, content in generator_files.items():
+                save_generated_file(self._conanfile, generator_file, content)
         self.generate_aggregator()
 
     @property
@@ -218,10 +227,10 @@ class CMakeDeps(object):
             set(CONANDEPS_LEGACY {% for t in configs %} {{t.root_target_name}} {% endfor %})
             """)
 
-        template = Template(template, trim_blocks=True, lstrip_blocks=True,
-                            undefined=jinja2.StrictUndefined)
+        template = get_template(template, trim_blocks=True, lstrip_blocks=True,
+                                undefined=jinja2.StrictUndefined)
         conandeps = template.render({"configs": configs})
-        save(self._conanfile, "conandeps_legacy.cmake", conandeps)
+        save_generated_file(self._conanfile, "conandeps_legacy.cmake", conandeps)
 
     def get_transitive_requires(self, conanfile):
         # Prepared to filter transitive tool-requires with visible=True
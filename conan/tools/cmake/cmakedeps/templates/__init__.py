@@ -1,7 +1,7 @@
 import jinja2
-from jinja2 import Template
 
 from conan.errors import ConanException
+from conan.internal.templates import get_template
 
 
 class CMakeDepsFileTemplate(object):
@@ -36,13 +36,9 @@ class CMakeDepsFileTemplate(object):
         except Exception as e:
             raise ConanException("error generating context for '{}': {}".format(self.conanfile, e))
 
-        # Cache the template instance as a class attribute to greatly speed up the rendering
-        # NOTE: this assumes that self.template always returns the same string
-        template_instance = getattr(type(self), "template_instance", None)
-        if template_instance is None:
-            template_instance = Template(self.template, trim_blocks=True, lstrip_blocks=True,
+        # The compiled template is cached, so it is not recompiled for every dependency
+        template_instance = get_template(self.template, trim_blocks=True, lstrip_blocks=True,
                                          undefined=jinja2.StrictUndefined)
-            setattr(type(self), "template_instance", template_instance)
         return template_instance.render(context)
 
     def context(self):
@@ -3,6 +3,7 @@ import os
 import platform
 import textwrap
 
+from conan.internal.api.install.generated_files import save_generated_file
 from conan.api.output import ConanOutput, Color
 from conan.tools.cmake.layout import get_build_folder_custom_vars
 from conan.tools.cmake.toolchain.blocks import GenericSystemBlock
@@ -11,7 +12,7 @@ from conan.tools.build import build_jobs
 from conan.tools.microsoft import is_msvc
 from conans.client.graph.graph import RECIPE_CONSUMER
 from conan.errors import ConanException
-from conans.util.files import save, load
+from conans.util.files import load
 
 
 def write_cmake_presets(conanfile, toolchain_file, generator, cache_variables,
@@ -81,7 +82,7 @@ class _CMakePresets:
                                            preset_prefix, buildenv, runenv, cmake_executable)
 
         preset_content = json.dumps(data, indent=4)
-        save(preset_path, preset_content)
+        save_generated_file(conanfile, preset_path, preset_content)
         ConanOutput(str(conanfile)).info(f"CMakeToolchain generated: {preset_path}")
         return preset_path, data
 
@@ -300,7 +301,7 @@ class _IncludingPresets:
 
         data = json.dumps(data, indent=4)
         ConanOutput(str(conanfile)).info(f"CMakeToolchain generated: {user_presets_path}")
-        save(user_presets_path, data)
+        save_generated_file(conanfile, user_presets_path, data)
 
     @staticmethod
     def _collect_user_inherits(output_dir, preset_prefix):
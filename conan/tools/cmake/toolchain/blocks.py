@@ -3,9 +3,8 @@ import re
 import textwrap
 from collections import OrderedDict
 
-from jinja2 import Template
-
 from conan.internal.internal_tools import universal_arch_separator, is_universal_arch
+from conan.internal.templates import get_template
 from conan.tools.apple.apple import get_apple_sdk_fullname, _to_apple_arch
 from conan.tools.android.utils import android_abi
 from conan.tools.apple.apple import is_apple_os, to_apple_arch
@@ -46,7 +45,7 @@ class Block:
             return
 
         template = f"########## '{self._name}' block #############\n" + self.template + "\n\n"
-        template = Template(template, trim_blocks=True, lstrip_blocks=True)
+        template = get_template(template, trim_blocks=True, lstrip_blocks=True)
         return template.render(**context)
 
     def context(self):
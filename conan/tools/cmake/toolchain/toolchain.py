@@ -2,10 +2,10 @@ import os
 import textwrap
 from collections import OrderedDict
 
-from jinja2 import Template
-
 from conan.api.output import ConanOutput
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conan.tools.build import use_win_mingw
 from conan.tools.cmake.presets import write_cmake_presets
 from conan.tools.cmake.toolchain import CONAN_TOOLCHAIN_FILENAME
@@ -22,7 +22,6 @@ from conan.tools.microsoft import VCVars
 from conan.tools.microsoft.visual import vs_ide_version
 from conan.errors import ConanException
 from conans.model.options import _PackageOption
-from conans.util.files import save
 
 
 class Variables(OrderedDict):
@@ -144,8 +143,8 @@ class CMakeToolchain:
     @property
     def content(self):
         context = self._context()
-        content = Template(self._template, trim_blocks=True, lstrip_blocks=True,
-                           keep_trailing_newline=True).render(**context)
+        content = get_template(self._template, trim_blocks=True, lstrip_blocks=True,
+                               keep_trailing_newline=True).render(**context)
         return content
 
     @property
@@ -172,7 +171,9 @@ class CMakeToolchain:
         toolchain_file = self._conanfile.conf.get("tools.cmake.cmaketoolchain:toolchain_file")
         if toolchain_file is None:  # The main toolchain file generated only if user dont define
             toolchain_file = self.filename
-            save(os.path.join(self._conanfile.generators_folder, toolchain_file), self.content)
+            save_generated_file(self._conanfile,
+                                os.path.join(self._conanfile.generators_folder, toolchain_file),
+                                self.content)
             ConanOutput(str(self._conanfile)).info(f"CMakeToolchain generated: {toolchain_file}")
         # If we're using Intel oneAPI, we need to generate the environment file and run it
         if self._conanfile.settings.get_safe("compiler") == "intel-cc":
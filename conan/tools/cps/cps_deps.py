@@ -1,5 +1,5 @@
 from conan.cps.cps import CPS
-from conan.tools.files import save
+from conan.internal.api.install.generated_files import save_generated_file
 
 import json
 import os
@@ -50,4 +50,5 @@ class CPSDeps:
 
         name = f"cpsmap-{config_name}.json"
         self._conanfile.output.info(f"Generating CPS mapping file: {name}")
-        save(self._conanfile, os.path.join(cps_folder, name), json.dumps(mapping, indent=2))
+        save_generated_file(self._conanfile, os.path.join(cps_folder, name),
+                            json.dumps(mapping, indent=2))
@@ -3,11 +3,11 @@ import textwrap
 from collections import OrderedDict
 from contextlib import contextmanager
 
+from conan.internal.api.install.generated_files import save_generated_file
 from conan.internal.api.install.generators import relativize_paths
 from conans.client.subsystems import deduce_subsystem, WINDOWS, subsystem_path
 from conan.errors import ConanException
 from conans.model.recipe_ref import ref_matches
-from conans.util.files import save
 
 
 class _EnvVarPlaceHolder:
@@ -97,7 +97,7 @@ class _EnvValue:
         return "\n".join(result)
 
     def copy(self):
-        return _EnvValue(self._name, self._values, self._sep, self._path)
+        return _EnvValue(self._name, self._values[:], self._sep, self._path)
 
     @property
     def is_path(self):
@@ -126,14 +126,37 @@ class _EnvValue:
         """
         :type other: _EnvValue
         """
+        self.compose_env_values([other])
+
+    def compose_env_values(self, others):
+        """ equivalent to calling compose_env_value() for every one of the others, in order, but
+        building the resulting list of values only once, in linear time. Repeated paths are
+        removed, only the first one is effective
+        :type others: list[_EnvValue]
+        """
         try:
             index = self._values.index(_EnvVarPlaceHolder)
         except ValueError:  # It doesn't have placeholder
-            pass
-        else:
-            new_value = self._values[:]  # do a copy
-            new_value[index:index + 1] = other._values  # replace the placeholder
-            self._values = new_value
+            return
+        before = self._values[:index]
+        afters = [self._values[index + 1:]]
+        placeholder = True
+        for other in others:
+            try:
+                other_index = other._values.index(_EnvVarPlaceHolder)
+            except ValueError:  # A define() of the other, nothing else can be composed after it
+                before.extend(other._values)
+                placeholder = False
+                break
+            before.extend(other._values[:other_index])
+            afters.append(other._values[other_index + 1:])
+        if placeholder:
+            before.append(_EnvVarPlaceHolder)
+        for after in reversed(afters):
+            before.extend(after)
+        if self._path:
+            before = list(OrderedDict.fromkeys(before))
+        self._values = before
 
     def get_str(self, placeholder, subsystem, pathsep, root_path=None, script_path=None):
         """
@@ -297,12 +320,27 @@ class Environment:
         :param other: the "other" Environment
         :type other: class:`Environment`
         """
-        for k, v in other._values.items():
+        return self.compose_envs([other])
+
+    def compose_envs(self, others):
+        """
+        Compose an Environment object with a list of other ones, in order. It is equivalent to
+        calling ``compose_env()`` for each one of them, but every variable is composed only once.
+
+        :param others: list of the "other" Environment, from higher to lower precedence
+        :type others: list[Environment]
+        """
+        pending = OrderedDict()  # {var_name: [_EnvValue]} of the others, in order
+        for other in others:
+            for k, v in other._values.items():
+                pending.setdefault(k, []).append(v)
+
+        for k, values in pending.items():
             existing = self._values.get(k)
             if existing is None:
-                self._values[k] = v.copy()
-            else:
-                existing.compose_env_value(v)
+                existing = self._values[k] = values[0].copy()
+                values = values[1:]
+            existing.compose_env_values(values)
 
         return self
 
@@ -435,8 +473,7 @@ class EnvVars:
 
         content = "\n".join(result)
         # It is very important to save it correctly with utf-8, the Conan util save() is broken
-        os.makedirs(os.path.dirname(os.path.abspath(file_location)), exist_ok=True)
-        open(file_location, "w", encoding="utf-8").write(content)
+        save_generated_file(self._conanfile, file_location, content, newline=None)
 
     def save_ps1(self, file_location, generate_deactivate=True,):
         _, filename = os.path.split(file_location)
@@ -482,8 +519,8 @@ class EnvVars:
         content = "\n".join(result)
         # It is very important to save it correctly with utf-16, the Conan util save() is broken
         # and powershell uses utf-16 files!!!
-        os.makedirs(os.path.dirname(os.path.abspath(file_location)), exist_ok=True)
-        open(file_location, "w", encoding="utf-16").write(content)
+        save_generated_file(self._conanfile, file_location, content, encoding="utf-16",
+                            newline=None)
 
     def save_sh(self, file_location, generate_deactivate=True):
         filepath, filename = os.path.split(file_location)
@@ -518,7 +555,7 @@ class EnvVars:
 
         content = "\n".join(result)
         content = f'script_folder="{os.path.abspath(filepath)}"\n' + content
-        save(file_location, content)
+        save_generated_file(self._conanfile, file_location, content)
 
     def save_script(self, filename):
         """
@@ -657,7 +694,7 @@ def create_env_script(conanfile, content, filename, scope="build"):
         scope (str): The scope or environment group for which the script will be registered.
     """
     path = os.path.join(conanfile.generators_folder, filename)
-    save(path, content)
+    save_generated_file(conanfile, path, content)
 
     if scope:
         register_env_script(conanfile, path, scope)
@@ -1,3 +1,5 @@
+import time
+
 from conan.internal import check_duplicated_generator
 from conan.tools.env import Environment
 from conan.tools.env.virtualrunenv import runenv_from_cpp_info
@@ -49,29 +51,33 @@ class VirtualBuildEnv:
         else:
             return self._buildenv
 
+        t1 = time.time()
         # Top priority: profile
-        profile_env = self._conanfile.buildenv
-        self._buildenv.compose_env(profile_env)
+        envs = [self._conanfile.buildenv]
 
         build_requires = self._conanfile.dependencies.build.topological_sort
+        os_name = self._conanfile.settings_build.get_safe("os")
         for require, build_require in reversed(build_requires.items()):
             if require.direct:  # Only buildenv_info from direct deps is propagated
                 # higher priority, explicit buildenv_info
                 if build_require.buildenv_info:
-                    self._buildenv.compose_env(build_require.buildenv_info)
+                    envs.append(build_require.buildenv_info)
             # Lower priority, the runenv of all transitive "requires" of the build requires
             if build_require.runenv_info:
-                self._buildenv.compose_env(build_require.runenv_info)
+                envs.append(build_require.runenv_info)
             # Then the implicit
-            os_name = self._conanfile.settings_build.get_safe("os")
-            self._buildenv.compose_env(runenv_from_cpp_info(build_require, os_name))
+            envs.append(runenv_from_cpp_info(build_require, os_name))
 
         # Requires in host context can also bring some direct buildenv_info
         host_requires = self._conanfile.dependencies.host.topological_sort
         for require in reversed(host_requires.values()):
             if require.buildenv_info:
-                self._buildenv.compose_env(require.buildenv_info)
+                envs.append(require.buildenv_info)
 
+        self._buildenv.compose_envs(envs)
+        duration = time.time() - t1
+        self._conanfile.output.debug(f"VirtualBuildEnv: composed {len(envs)} environments "
+                                     f"in {duration} time")
         return self._buildenv
 
     def vars(self, scope="build"):
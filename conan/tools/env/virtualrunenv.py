@@ -1,14 +1,22 @@
 import os
+import time
 
 from conan.internal import check_duplicated_generator
 from conan.tools.env import Environment
 
 
 def runenv_from_cpp_info(dep, os_name):
-    """ return an Environment deducing the runtime information from a cpp_info
+    """ return an Environment deducing the runtime information from a cpp_info. While generating
+    the files of a consumer (see ``memoize_cpp_info()``) it is computed once per dependency and os
     """
+    cpp_info = dep.cpp_info
+    return cpp_info._memoized(f"runenv_{os_name}",
+                              lambda: _runenv_from_cpp_info(cpp_info, os_name))
+
+
+def _runenv_from_cpp_info(cpp_info, os_name):
     dyn_runenv = Environment()
-    cpp_info = dep.cpp_info.aggregated_components()
+    cpp_info = cpp_info.aggregated_components()
 
     def _prepend_path(envvar, paths):
         existing = [p for p in paths if os.path.exists(p)] if paths else None
@@ -67,19 +75,23 @@ class VirtualRunEnv:
         else:
             return self._runenv
 
+        t1 = time.time()
         # Top priority: profile
-        profile_env = self._conanfile.runenv
-        self._runenv.compose_env(profile_env)
+        envs = [self._conanfile.runenv]
 
         host_req = self._conanfile.dependencies.host
         test_req = self._conanfile.dependencies.test
+        _os = self._conanfile.settings.get_safe("os")
         for require, dep in list(host_req.items()) + list(test_req.items()):
             if dep.runenv_info:
-                self._runenv.compose_env(dep.runenv_info)
+                envs.append(dep.runenv_info)
             if require.run:  # Only if the require is run (shared or application to be run)
-                _os = self._conanfile.settings.get_safe("os")
-                self._runenv.compose_env(runenv_from_cpp_info(dep, _os))
+                envs.append(runenv_from_cpp_info(dep, _os))
 
+        self._runenv.compose_envs(envs)
+        duration = time.time() - t1
+        self._conanfile.output.debug(f"VirtualRunEnv: composed {len(envs)} environments "
+                                     f"in {duration} time")
         return self._runenv
 
     def vars(self, scope="run"):
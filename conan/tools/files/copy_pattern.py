@@ -1,7 +1,9 @@
 import filecmp
 import fnmatch
 import os
+import re
 import shutil
+from multiprocessing.pool import ThreadPool
 
 from conan.errors import ConanException
 from conans.util.files import mkdir
@@ -44,7 +46,11 @@ def copy(conanfile, pattern, src, dst, keep_path=True, excludes=None,
     files_to_copy, files_symlinked_to_folders = _filter_files(src, pattern, excludes, ignore_case,
                                                               excluded_folder)
 
-    copied_files = _copy_files(files_to_copy, src, dst, keep_path, overwrite_equal)
+    conf = conanfile.conf if conanfile else None  # Some usages still pass None
+    parallel = conf.get("tools.files.copy:parallel", default=1, check_type=int) if conf else 1
+    hardlinks = conf.get("tools.files.copy:hardlinks", check_type=bool) if conf else False
+    copied_files = _copy_files(files_to_copy, src, dst, keep_path, overwrite_equal,
+                               parallel=parallel, hardlinks=hardlinks)
     copied_files.extend(_copy_files_symlinked_to_folders(files_symlinked_to_folders, src, dst))
     if conanfile:  # Some usages still pass None
         copied = '\n    '.join(files_to_copy)
@@ -55,11 +61,32 @@ def copy(conanfile, pattern, src, dst, keep_path=True, excludes=None,
     return copied_files
 
 
+def _compile(patterns):
+    """ the compiled equivalent of any(fnmatch.fnmatchcase(name, p) for p in patterns) """
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns)).match
+
+
+def _prunable(pattern):
+    """ returns a function telling if nothing inside a folder, given as a path relative to src,
+    can match the pattern, because it is not compatible with the literal prefix of the pattern,
+    like 'src/...' for the pattern 'include/*.h'. It is conservative, case and separators are
+    ignored, so it never prunes a folder that could contain a matching file
+    """
+    prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0].replace("\\", "/").lower()
+    if not prefix:
+        return lambda _: False
+
+    def prunable(relative_path):
+        folder = relative_path.replace("\\", "/").lower() + "/"
+        return not folder.startswith(prefix) and not prefix.startswith(folder)
+    return prunable
+
+
 def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
     """ return a list of the files matching the patterns
     The list will be relative path names wrt to the root src folder
     """
-    filenames = []
+    files_to_copy = []
     files_symlinked_to_folders = []
 
     if excludes:
@@ -70,6 +97,18 @@ def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
     else:
         excludes = []
 
+    # Compiled once, equivalent to the fnmatch() calls for every folder and file
+    exclude_folder = _compile([os.path.normcase(e) for e in excludes]) if excludes else None
+    if ignore_case:
+        normalize = lambda n: os.path.normcase(n.lower())  # noqa: E731
+        match = _compile([os.path.normcase(pattern.lower())])
+        exclude = _compile([os.path.normcase(e) for e in excludes]) if excludes else None
+    else:
+        normalize = lambda n: n  # noqa: E731
+        match = _compile([pattern])
+        exclude = _compile(excludes) if excludes else None
+    prunable = _prunable(pattern)
+
     for root, subfolders, files in os.walk(src):
         if root == excluded_folder:
             subfolders[:] = []
@@ -83,61 +122,82 @@ def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
                     files_symlinked_to_folders.append(relative_path)
 
         relative_path = os.path.relpath(root, src)
-        compare_relative_path = relative_path.lower() if ignore_case else relative_path
         # Don't try to exclude the start folder, it conflicts with excluding names starting with dots
-        if not compare_relative_path == ".":
-            for exclude in excludes:
-                if fnmatch.fnmatch(compare_relative_path, exclude):
-                    subfolders[:] = []
-                    files = []
-                    break
+        if relative_path != ".":
+            compare_relative_path = relative_path.lower() if ignore_case else relative_path
+            if exclude_folder and exclude_folder(os.path.normcase(compare_relative_path)):
+                subfolders[:] = []
+                continue
+            subfolders[:] = [s for s in subfolders
+                             if not prunable(os.path.join(relative_path, s))]
+            relative_path = os.path.join(relative_path, "")
+        else:
+            subfolders[:] = [s for s in subfolders if not prunable(s)]
+            relative_path = ""
+
         for f in files:
-            relative_name = os.path.normpath(os.path.join(relative_path, f))
-            filenames.append(relative_name)
+            relative_name = relative_path + f
+            compare_name = normalize(relative_name)
+            if match(compare_name) and not (exclude and exclude(compare_name)):
+                files_to_copy.append(relative_name)
 
-    if ignore_case:
-        pattern = pattern.lower()
-        files_to_copy = [n for n in filenames if fnmatch.fnmatch(os.path.normpath(n.lower()),
-                                                                 pattern)]
-    else:
-        files_to_copy = [n for n in filenames if fnmatch.fnmatchcase(os.path.normpath(n),
-                                                                     pattern)]
+    return files_to_copy, files_symlinked_to_folders
 
-    for exclude in excludes:
-        if ignore_case:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f.lower(), exclude)]
-        else:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatchcase(f, exclude)]
 
-    return files_to_copy, files_symlinked_to_folders
+def _copy_file(abs_src_name, abs_dst_name, overwrite_equal, hardlinks):
+    if os.path.islink(abs_src_name):
+        linkto = os.readlink(abs_src_name)
+        try:
+            os.remove(abs_dst_name)
+        except OSError:
+            pass
+        os.symlink(linkto, abs_dst_name)
+        return
+    # Avoid the copy if the file exists and has the exact same signature (size + mod time)
+    if not overwrite_equal and os.path.exists(abs_dst_name) \
+            and filecmp.cmp(abs_src_name, abs_dst_name):
+        return
+    if hardlinks:
+        try:
+            if os.path.lexists(abs_dst_name):
+                os.remove(abs_dst_name)
+            os.link(abs_src_name, abs_dst_name)
+            return
+        except OSError:  # Different filesystems, or not supported, fallback to copy
+            pass
+    shutil.copy2(abs_src_name, abs_dst_name)
 
 
-def _copy_files(files, src, dst, keep_path, overwrite_equal):
+def _copy_files(files, src, dst, keep_path, overwrite_equal, parallel=1, hardlinks=False):
     """ executes a multiple file copy from [(src_file, dst_file), (..)]
     managing symlinks if necessary
     """
     copied_files = []
+    to_copy = []
+    created_folders = set()
     for filename in files:
         abs_src_name = os.path.join(src, filename)
         filename = filename if keep_path else os.path.basename(filename)
         abs_dst_name = os.path.normpath(os.path.join(dst, filename))
         parent_folder = os.path.dirname(abs_dst_name)
-        if parent_folder:  # There are cases where this folder will be empty for relative paths
+        # There are cases where this folder will be empty for relative paths
+        if parent_folder and parent_folder not in created_folders:
             os.makedirs(parent_folder, exist_ok=True)
-
-        if os.path.islink(abs_src_name):
-            linkto = os.readlink(abs_src_name)
-            try:
-                os.remove(abs_dst_name)
-            except OSError:
-                pass
-            os.symlink(linkto, abs_dst_name)
-        else:
-            # Avoid the copy if the file exists and has the exact same signature (size + mod time)
-            if overwrite_equal or not os.path.exists(abs_dst_name) \
-                    or not filecmp.cmp(abs_src_name, abs_dst_name):
-                shutil.copy2(abs_src_name, abs_dst_name)
+            created_folders.add(parent_folder)
+        to_copy.append((abs_src_name, abs_dst_name))
         copied_files.append(abs_dst_name)
+
+    if parallel > 1 and len(to_copy) > 1:
+        thread_pool = ThreadPool(min(parallel, len(to_copy)))
+        try:
+            thread_pool.starmap(_copy_file, [(s, d, overwrite_equal, hardlinks)
+                                             for s, d in to_copy])
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+    else:
+        for abs_src_name, abs_dst_name in to_copy:
+            _copy_file(abs_src_name, abs_dst_name, overwrite_equal, hardlinks)
     return copied_files
 
 
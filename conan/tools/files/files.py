@@ -11,7 +11,8 @@ from shutil import which
 
 from conans.client.downloaders.caching_file_downloader import SourcesCachingDownloader
 from conan.errors import ConanException
-from conans.util.files import rmdir as _internal_rmdir, human_size, check_with_algorithm_sum
+from conans.util.files import rmdir as _internal_rmdir, human_size, check_with_algorithm_sum, \
+    copytree_compat, remove_if_dirty, set_dirty_context_manager
 
 
 def load(conanfile, path, encoding="utf-8"):
@@ -125,12 +126,56 @@ def get(conanfile, url, md5=None, sha1=None, sha256=None, destination=".", filen
                                  "parameter.".format(url_base))
         filename = os.path.basename(url_base)
 
-    download(conanfile, url, filename, verify=verify,
-             retry=retry, retry_wait=retry_wait, auth=auth, headers=headers,
-             md5=md5, sha1=sha1, sha256=sha256)
-    unzip(conanfile, filename, destination=destination, keep_permissions=keep_permissions,
-          pattern=pattern, strip_root=strip_root, extract_filter=extract_filter)
-    os.unlink(filename)
+    def _download_and_unzip(dest):
+        download(conanfile, url, filename, verify=verify,
+                 retry=retry, retry_wait=retry_wait, auth=auth, headers=headers,
+                 md5=md5, sha1=sha1, sha256=sha256)
+        unzip(conanfile, filename, destination=dest, keep_permissions=keep_permissions,
+              pattern=pattern, strip_root=strip_root, extract_filter=extract_filter)
+        os.unlink(filename)
+
+    archive = _archive_format(filename)
+    download_cache = None
+    if archive != "gz":  # A single .gz file is not extracted into the destination folder
+        download_cache = SourcesCachingDownloader(conanfile).extracted_sources_cache(sha256)
+    if download_cache is None:
+        _download_and_unzip(destination)
+        return
+
+    # The same archive, extracted with the same arguments, is reused from the download cache,
+    # for every recipe revision or package, without downloading and extracting it again
+    extract_filter = conanfile.conf.get("tools.files.unzip:filter") or extract_filter
+    extraction = (archive, keep_permissions, pattern, strip_root, extract_filter)
+    extracted, key = download_cache.extracted_sources_path(sha256, extraction)
+    with download_cache.lock(key):
+        remove_if_dirty(extracted)
+        hit = os.path.exists(extracted)
+        if hit:
+            conanfile.output.info(f"Sources of {filename} retrieved from the extracted sources "
+                                  "cache")
+        else:
+            with set_dirty_context_manager(extracted):
+                _download_and_unzip(extracted)
+        copytree_compat(extracted, destination, symlinks=True)
+    if hit:
+        download_cache.record_hit(extracted)
+        # The archive is still used by this recipe, its backup sources must be kept too
+        if not SourcesCachingDownloader(conanfile).reuse_backup_sources(download_cache, sha256,
+                                                                        url):
+            download(conanfile, url, filename, verify=verify, retry=retry,
+                     retry_wait=retry_wait, auth=auth, headers=headers, md5=md5, sha1=sha1,
+                     sha256=sha256)
+            os.unlink(filename)
+    else:
+        download_cache.record_download(extracted, sha256)
+
+
+def _archive_format(filename):
+    if filename.endswith((".tar.gz", ".tgz", ".tbz2", ".tar.bz2", ".tar", ".tar.xz", ".txz")):
+        return "tar"
+    if filename.endswith(".gz"):
+        return "gz"
+    return "zip"
 
 
 def ftp_download(conanfile, host, filename, login='', password='', secure=False):
@@ -344,7 +389,10 @@ def unzip(conanfile, filename, destination=".", keep_permissions=False, pattern=
         extracted_size = 0
 
         print_progress.last_size = -1
-        if platform.system() == "Windows":
+        parallel = conanfile.conf.get("tools.files.unzip:parallel", default=1, check_type=int)
+        if parallel > 1 and len(zip_info) > 1:
+            _unzip_parallel(filename, zip_info, full_path, keep_permissions, parallel, output)
+        elif platform.system() == "Windows":
             for file_ in zip_info:
                 extracted_size += file_.file_size
                 print_progress(extracted_size, uncompress_size)
@@ -368,6 +416,39 @@ def unzip(conanfile, filename, destination=".", keep_permissions=False, pattern=
         output.writeln("")
 
 
+def _unzip_parallel(filename, zip_info, full_path, keep_permissions, parallel, output):
+    """ extracts the zip members in ``parallel`` threads, every thread with its own handle of the
+    zip file, so the decompression of different members runs concurrently
+    """
+    import zipfile
+    from multiprocessing.pool import ThreadPool
+    keep_permissions = keep_permissions and platform.system() != "Windows"
+
+    def _extract(members):
+        with zipfile.ZipFile(filename, "r") as z:
+            for file_ in members:
+                try:
+                    try:
+                        z.extract(file_, full_path)
+                    except FileExistsError:  # Other thread created the same folder at the time
+                        z.extract(file_, full_path)
+                    if keep_permissions:
+                        # Could be dangerous if the ZIP has been created in a non nix system
+                        # https://bugs.python.org/issue15795
+                        perm = file_.external_attr >> 16 & 0xFFF
+                        os.chmod(os.path.join(full_path, file_.filename), perm)
+                except Exception as e:
+                    output.error(f"Error extract {file_.filename}\n{str(e)}", error_type="exception")
+
+    parallel = min(parallel, len(zip_info))
+    thread_pool = ThreadPool(parallel)
+    try:
+        thread_pool.map(_extract, [zip_info[i::parallel] for i in range(parallel)])
+    finally:
+        thread_pool.close()
+        thread_pool.join()
+
+
 def untargz(filename, destination=".", pattern=None, strip_root=False, extract_filter=None):
     # NOT EXPOSED at `conan.tools.files` but used in tests
     import tarfile
@@ -377,32 +458,43 @@ def untargz(filename, destination=".", pattern=None, strip_root=False, extract_f
         if not pattern and not strip_root:
             tarredgzippedFile.extractall(destination)
         else:
-            members = tarredgzippedFile.getmembers()
-
-            if strip_root:
-                names = [n.replace("\\", "/") for n in tarredgzippedFile.getnames()]
-                common_folder = os.path.commonprefix(names).split("/", 1)[0]
-                if not common_folder and len(names) > 1:
-                    raise ConanException("The tgz file contains more than 1 folder in the root")
-                if len(names) == 1 and len(names[0].split("/", 1)) == 1:
-                    raise ConanException("The tgz file contains a file in the root")
-                # Remove the directory entry if present
-                members = [m for m in members if m.name != common_folder]
-                for member in members:
-                    name = member.name.replace("\\", "/")
-                    member.name = name.split("/", 1)[1]
-                    member.path = member.name
-                    if member.linkpath.startswith(common_folder):
-                        # https://github.com/conan-io/conan/issues/11065
-                        linkpath = member.linkpath.replace("\\", "/")
-                        member.linkpath = linkpath.split("/", 1)[1]
-                        member.linkname = member.linkpath
+            # The members are renamed and filtered while they are read, extracting them in the
+            # same single pass over the archive, instead of reading all of them first with
+            # getmembers(), which for compressed archives means decompressing them twice
+            members = _strip_root_members(tarredgzippedFile) if strip_root else tarredgzippedFile
             if pattern:
-                members = list(filter(lambda m: fnmatch(m.name, pattern),
-                                      tarredgzippedFile.getmembers()))
+                members = (m for m in members if fnmatch(m.name, pattern))
             tarredgzippedFile.extractall(destination, members=members)
 
 
+def _strip_root_members(members):
+    common_folder = None
+    file_in_root = False
+    for member in members:
+        if file_in_root:
+            raise ConanException("The tgz file contains more than 1 folder in the root")
+        name = member.name.replace("\\", "/")
+        root, _, stripped = name.partition("/")
+        if common_folder is None:
+            common_folder = root
+        elif root != common_folder:
+            raise ConanException("The tgz file contains more than 1 folder in the root")
+        if not stripped:
+            # Remove the directory entry if present
+            file_in_root = not member.isdir()
+            continue
+        member.name = stripped
+        member.path = member.name
+        if member.linkpath.startswith(common_folder):
+            # https://github.com/conan-io/conan/issues/11065
+            linkpath = member.linkpath.replace("\\", "/")
+            member.linkpath = linkpath.split("/", 1)[1]
+            member.linkname = member.linkpath
+        yield member
+    if file_in_root:
+        raise ConanException("The tgz file contains a file in the root")
+
+
 def check_sha1(conanfile, file_path, signature):
     """
     Check that the specified ``sha1`` of the ``file_path`` matches with signature.
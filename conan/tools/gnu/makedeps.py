@@ -29,12 +29,13 @@ import os
 import re
 import textwrap
 
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 from typing import Optional
 
 from conan.api.output import ConanOutput
 from conan.internal import check_duplicated_generator
-from conan.tools.files import save
+from conan.internal.templates import get_template
+from conan.internal.api.install.generated_files import save_generated_file
 
 
 CONAN_MAKEFILE_FILENAME = "conandeps.mk"
@@ -278,8 +279,8 @@ class GlobalContentGenerator:
         """
         context = {"deps_cpp_info_dirs": deps_cpp_info_dirs,
                    "deps_cpp_info_flags": deps_cpp_info_flags}
-        template = Template(_jinja_format_list_values() + self.template, trim_blocks=True,
-                            lstrip_blocks=True, undefined=StrictUndefined)
+        template = get_template(_jinja_format_list_values() + self.template, trim_blocks=True,
+                                lstrip_blocks=True, undefined=StrictUndefined)
         return template.render(context)
 
     def deps_content(self, dependencies_names: list) -> str:
@@ -288,8 +289,8 @@ class GlobalContentGenerator:
         :param dependencies_names: Non-formatted dependencies names
         """
         context = {"deps": dependencies_names}
-        template = Template(_jinja_format_list_values() + self.template_deps, trim_blocks=True,
-                            lstrip_blocks=True, undefined=StrictUndefined)
+        template = get_template(_jinja_format_list_values() + self.template_deps, trim_blocks=True,
+                                lstrip_blocks=True, undefined=StrictUndefined)
         return template.render(context)
 
 
@@ -398,8 +399,8 @@ class DepComponentContentGenerator:
             "cpp_info_flags": self._flags,
             "properties": _makefy_properties(_filter_properties(self._dep.cpp_info.components[self._name]._properties, self._output)),
         }
-        template = Template(_jinja_format_list_values() + self.template, trim_blocks=True,
-                            lstrip_blocks=True, undefined=StrictUndefined)
+        template = get_template(_jinja_format_list_values() + self.template, trim_blocks=True,
+                                lstrip_blocks=True, undefined=StrictUndefined)
         return template.render(context)
 
 
@@ -464,8 +465,8 @@ class DepContentGenerator:
             "cpp_info_flags": self._flags,
             "properties": _makefy_properties(_filter_properties(self._dep.cpp_info._properties, self._output)),
         }
-        template = Template(_jinja_format_list_values() + self.template, trim_blocks=True,
-                            lstrip_blocks=True, undefined=StrictUndefined)
+        template = get_template(_jinja_format_list_values() + self.template, trim_blocks=True,
+                                lstrip_blocks=True, undefined=StrictUndefined)
         return template.render(context)
 
 
@@ -683,5 +684,5 @@ class MakeDeps:
         glob_gen = GlobalGenerator(self._conanfile, make_infos)
         content_buffer += glob_gen.deps_generate() + deps_buffer + glob_gen.generate()
 
-        save(self._conanfile, CONAN_MAKEFILE_FILENAME, content_buffer)
+        save_generated_file(self._conanfile, CONAN_MAKEFILE_FILENAME, content_buffer)
         self._conanfile.output.info(f"Generated {CONAN_MAKEFILE_FILENAME}")
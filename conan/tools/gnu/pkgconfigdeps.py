@@ -3,13 +3,14 @@ import re
 import textwrap
 from collections import namedtuple
 
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 
 from conan.errors import ConanException
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conan.tools.gnu.gnudeps_flags import GnuDepsFlags
 from conans.model.dependencies import get_transitive_requires
-from conans.util.files import save
 
 
 _PCInfo = namedtuple("PCInfo", ['name', 'version', 'requires', 'description',
@@ -129,8 +130,8 @@ class _PCContentGenerator:
     def content(self, info):
         assert isinstance(info, _PCInfo)
         context = self._get_context(info)
-        template = Template(self.template, trim_blocks=True, lstrip_blocks=True,
-                            undefined=StrictUndefined)
+        template = get_template(self.template, trim_blocks=True, lstrip_blocks=True,
+                                undefined=StrictUndefined)
         return template.render(context)
 
 
@@ -436,7 +437,7 @@ class PkgConfigDeps:
         # Current directory is the generators_folder
         generator_files = self.content
         for generator_file, content in generator_files.items():
-            save(generator_file, content)
+            save_generated_file(self._conanfile, generator_file, content)
 
     def set_property(self, dep, prop, value):
         """
@@ -3,12 +3,13 @@ import re
 import textwrap
 from collections import namedtuple
 
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 
 from conan.errors import ConanException
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conans.model.dependencies import get_transitive_requires
-from conans.util.files import save
 
 _BazelTargetInfo = namedtuple("DepInfo", ['repository_name', 'name', 'ref_name', 'requires', 'cpp_info'])
 _LibInfo = namedtuple("LibInfo", ['name', 'is_shared', 'lib_path', 'import_lib_path'])
@@ -325,23 +326,24 @@ class _BazelDependenciesBZLGenerator:
         self._dependencies = dependencies
 
     def _generate_6x_compatible(self):
-        repository_template = Template(self.repository_template, trim_blocks=True,
-                                       lstrip_blocks=True,
-                                       undefined=StrictUndefined)
+        repository_template = get_template(self.repository_template, trim_blocks=True,
+                                           lstrip_blocks=True,
+                                           undefined=StrictUndefined)
         content = repository_template.render(dependencies=self._dependencies)
         # dependencies.bzl file (Bazel 6.x compatible)
-        save(self.repository_filename, content)
+        save_generated_file(self._conanfile, self.repository_filename, content)
 
     def generate(self):
         # Keeping available Bazel 6.x, but it'll likely be dropped soon
         self._generate_6x_compatible()
         # Bazel 7.x files
-        module_template = Template(self.module_template, trim_blocks=True, lstrip_blocks=True,
-                                   undefined=StrictUndefined)
+        module_template = get_template(self.module_template, trim_blocks=True, lstrip_blocks=True,
+                                       undefined=StrictUndefined)
         content = module_template.render(dependencies=self._dependencies)
-        save(self.modules_filename, content)
-        save(self.repository_rules_filename, self.repository_rules_content)
-        save("BUILD.bazel", "# This is an empty BUILD file.")
+        save_generated_file(self._conanfile, self.modules_filename, content)
+        save_generated_file(self._conanfile, self.repository_rules_filename,
+                            self.repository_rules_content)
+        save_generated_file(self._conanfile, "BUILD.bazel", "# This is an empty BUILD file.")
 
 
 class _BazelBUILDGenerator:
@@ -547,10 +549,10 @@ class _BazelBUILDGenerator:
 
     def generate(self):
         context = self._get_context()
-        template = Template(self.template, trim_blocks=True, lstrip_blocks=True,
-                            undefined=StrictUndefined)
+        template = get_template(self.template, trim_blocks=True, lstrip_blocks=True,
+                                undefined=StrictUndefined)
         content = template.render(context)
-        save(self.build_file_pah, content)
+        save_generated_file(self._conanfile, self.build_file_pah, content)
 
 
 class _InfoGenerator:
@@ -23,14 +23,13 @@ Others:
 """
 import textwrap
 
-from jinja2 import Template
-
 from conan.internal import check_duplicated_generator
 from conan.internal.internal_tools import raise_on_universal_arch
+from conan.internal.templates import get_template
 from conan.tools.apple import to_apple_arch, is_apple_os
 from conan.tools.build.cross_building import cross_building
 from conan.tools.build.flags import cppstd_flag
-from conan.tools.files import save
+from conan.internal.api.install.generated_files import save_generated_file
 
 
 def _get_cpu_name(conanfile):
@@ -156,7 +155,7 @@ class BazelToolchain:
     @property
     def _content(self):
         context = self._context()
-        content = Template(self.bazelrc_template).render(context)
+        content = get_template(self.bazelrc_template).render(context)
         return content
 
     def generate(self):
@@ -165,4 +164,4 @@ class BazelToolchain:
         is put as ``conan-config``.
         """
         check_duplicated_generator(self, self._conanfile)
-        save(self._conanfile, BazelToolchain.bazelrc_name, self._content)
+        save_generated_file(self._conanfile, BazelToolchain.bazelrc_name, self._content)
@@ -1,11 +1,13 @@
 import os
 import textwrap
 
-from jinja2 import Template, StrictUndefined
+from jinja2 import StrictUndefined
 
 from conan.errors import ConanException
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
 from conan.internal.internal_tools import raise_on_universal_arch
+from conan.internal.templates import get_template
 from conan.tools.apple.apple import is_apple_os, apple_min_version_flag, \
     resolve_apple_flags
 from conan.tools.build.cross_building import cross_building
@@ -13,7 +15,6 @@ from conan.tools.build.flags import libcxx_flags
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.meson.helpers import *
 from conan.tools.microsoft import VCVars, msvc_runtime_flag
-from conans.util.files import save
 
 
 class MesonToolchain(object):
@@ -544,8 +545,8 @@ class MesonToolchain(object):
         :return: ``str`` whole Meson context content.
         """
         context = self._context()
-        content = Template(self._meson_file_template, trim_blocks=True, lstrip_blocks=True,
-                           undefined=StrictUndefined).render(context)
+        content = get_template(self._meson_file_template, trim_blocks=True, lstrip_blocks=True,
+                               undefined=StrictUndefined).render(context)
         return content
 
     def generate(self):
@@ -555,6 +556,6 @@ class MesonToolchain(object):
         If Windows OS, it will be created a ``conanvcvars.bat`` as well.
         """
         check_duplicated_generator(self, self._conanfile)
-        save(self._filename, self._content)
+        save_generated_file(self._conanfile, self._filename, self._content)
         # FIXME: Should we check the OS and compiler to call VCVars?
         VCVars(self._conanfile).generate()
@@ -4,13 +4,13 @@ import re
 import textwrap
 from xml.dom import minidom
 
-from jinja2 import Template
-
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conan.errors import ConanException
 from conan.internal.api.install.generators import relativize_path
 from conans.model.dependencies import get_transitive_requires
-from conans.util.files import load, save
+from conans.util.files import load
 
 VALID_LIB_EXTENSIONS = (".so", ".lib", ".a", ".dylib", ".bc")
 
@@ -125,7 +125,7 @@ class MSBuildDeps(object):
             raise ConanException("MSBuildDeps.platform is None, it should have a value")
         generator_files = self._content()
         for generator_file, content in generator_files.items():
-            save(generator_file, content)
+            save_generated_file(self._conanfile, generator_file, content)
 
     def _config_filename(self):
         props = [self.configuration,
@@ -226,8 +226,8 @@ class MSBuildDeps(object):
             'linker_flags': linker_flags,
             'host_context': not build
         }
-        formatted_template = Template(self._vars_props, trim_blocks=True,
-                                      lstrip_blocks=True).render(**fields)
+        formatted_template = get_template(self._vars_props, trim_blocks=True,
+                                          lstrip_blocks=True).render(**fields)
         return formatted_template
 
     def _activate_props_file(self, dep_name, vars_filename, deps, build):
@@ -242,7 +242,7 @@ class MSBuildDeps(object):
         # TODO: This must include somehow the user/channel, most likely pattern to exclude/include
         # Probably also the negation pattern, exclude all not @mycompany/*
         ca_exclude = any(fnmatch.fnmatch(dep_name, p) for p in self.exclude_code_analysis or ())
-        template = Template(self._conf_props, trim_blocks=True, lstrip_blocks=True)
+        template = get_template(self._conf_props, trim_blocks=True, lstrip_blocks=True)
         content_multi = template.render(host_context=not build, name=dep_name, ca_exclude=ca_exclude,
                                         vars_filename=vars_filename, deps=deps)
         return content_multi
@@ -269,7 +269,7 @@ class MSBuildDeps(object):
               </PropertyGroup>
             </Project>
             """)
-            content_multi = Template(content_multi).render({"name": dep_name})
+            content_multi = get_template(content_multi).render({"name": dep_name})
         # parse the multi_file and add new import statement if needed
         dom = minidom.parseString(content_multi)
         import_vars = dom.getElementsByTagName('ImportGroup')[0]
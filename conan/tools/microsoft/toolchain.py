@@ -2,14 +2,14 @@ import os
 import textwrap
 from xml.dom import minidom
 
-from jinja2 import Template
-
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conan.tools.build import build_jobs
 from conan.tools.intel.intel_cc import IntelCC
 from conan.tools.microsoft.visual import VCVars, msvs_toolset, msvc_runtime_flag
 from conan.errors import ConanException
-from conans.util.files import save, load
+from conans.util.files import load
 
 
 class MSBuildToolchain(object):
@@ -164,10 +164,10 @@ class MSBuildToolchain(object):
 
     def _write_config_toolchain(self, config_filename):
         config_filepath = os.path.join(self._conanfile.generators_folder, config_filename)
-        config_props = Template(self._config_toolchain_props, trim_blocks=True,
-                                lstrip_blocks=True).render(**self.context_config_toolchain)
+        config_props = get_template(self._config_toolchain_props, trim_blocks=True,
+                                    lstrip_blocks=True).render(**self.context_config_toolchain)
         self._conanfile.output.info("MSBuildToolchain created %s" % config_filename)
-        save(config_filepath, config_props)
+        save_generated_file(self._conanfile, config_filepath, config_props)
 
     def _write_main_toolchain(self, config_filename, condition):
         main_toolchain_path = os.path.join(self._conanfile.generators_folder, self.filename)
@@ -210,7 +210,7 @@ class MSBuildToolchain(object):
         conan_toolchain = dom.toprettyxml()
         conan_toolchain = "\n".join(line for line in conan_toolchain.splitlines() if line.strip())
         self._conanfile.output.info("MSBuildToolchain writing {}".format(self.filename))
-        save(main_toolchain_path, conan_toolchain)
+        save_generated_file(self._conanfile, main_toolchain_path, conan_toolchain)
 
     def _get_extra_flags(self):
         # Now, it's time to get all the flags defined by the user
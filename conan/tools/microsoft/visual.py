@@ -2,11 +2,11 @@ import os
 import textwrap
 
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
 from conan.internal.api.detect.detect_vs import vs_installation_path
 from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.scm import Version
 from conan.tools.intel.intel_cc import IntelCC
-from conans.util.files import save
 
 CONAN_VCVARS = "conanvcvars"
 
@@ -183,7 +183,7 @@ def _create_deactivate_vcvars_file(conanfile, filename):
     else:
         content = f"echo {message}"
     path = os.path.join(conanfile.generators_folder, deactivate_filename)
-    save(path, content)
+    save_generated_file(conanfile, path, content)
 
 
 def vs_ide_version(conanfile):
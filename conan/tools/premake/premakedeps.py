@@ -3,7 +3,7 @@ import glob
 import re
 
 from conan.internal import check_duplicated_generator
-from conans.util.files import save
+from conan.internal.api.install.generated_files import save_generated_file
 
 # Filename format strings
 PREMAKE_VAR_FILE = "conan_{pkgname}_vars{config}.premake5.lua"
@@ -142,7 +142,7 @@ class PremakeDeps(object):
         # Current directory is the generators_folder
         generator_files = self.content
         for generator_file, content in generator_files.items():
-            save(generator_file, content)
+            save_generated_file(self._conanfile, generator_file, content)
 
     def _config_suffix(self):
         props = [("Configuration", self.configuration),
@@ -1,4 +1,4 @@
-from conan.tools.files import save
+from conan.internal.api.install.generated_files import save_generated_file
 from conan.errors import ConanException
 from conans.model.dependencies import get_transitive_requires
 import json
@@ -196,4 +196,5 @@ class QbsDeps:
         Generates a single JSON file per dependency or component.
         """
         for file_name, qbs_deps_file in self.content.items():
-            save(self._conanfile, os.path.join('conan-qbs-deps', file_name), qbs_deps_file.render())
+            save_generated_file(self._conanfile, os.path.join('conan-qbs-deps', file_name),
+                                qbs_deps_file.render())
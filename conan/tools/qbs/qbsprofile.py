@@ -4,14 +4,14 @@ import shutil
 import platform
 import textwrap
 
-from jinja2 import Template
 from conan.internal import check_duplicated_generator
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conan.errors import ConanException
 from conan.tools.env import VirtualBuildEnv
 from conan.tools.microsoft import msvs_toolset
 from conan.tools.microsoft.visual import vs_installation_path, _vcvars_path, _vcvars_versions
 from conan.tools.qbs import common
-from conans.util.files import save
 
 
 def _find_msvc(conanfile):
@@ -139,7 +139,7 @@ class QbsProfile:
             {%- endfor %}
             defaultProfile: {{default_profile}}
         ''')
-        t = Template(template)
+        t = get_template(template)
         context = {
             'profile_values': self.content,
             'profile': self._profile,
@@ -157,7 +157,7 @@ class QbsProfile:
         """
         check_duplicated_generator(self, self._conanfile)
         self._check_for_compiler()
-        save(self.filename, self.render())
+        save_generated_file(self._conanfile, self.filename, self.render())
 
     def _check_for_compiler(self):
         compiler = self._conanfile.settings.get_safe('compiler')
@@ -1,7 +1,6 @@
-from jinja2 import Template
-
+from conan.internal.api.install.generated_files import save_generated_file
+from conan.internal.templates import get_template
 from conan.tools import CppInfo
-from conans.util.files import save
 
 
 class SConsDeps:
@@ -25,11 +24,11 @@ class SConsDeps:
         return ret
 
     def generate(self):
-        save(self._generator_file, self._content)
+        save_generated_file(self._conanfile, self._generator_file, self._content)
 
     @property
     def _content(self):
-        template = Template("""
+        template = get_template("""
         "{{dep_name}}" : {
             "CPPPATH"     : {{info.includedirs or []}},
             "LIBPATH"     : {{info.libdirs or []}},
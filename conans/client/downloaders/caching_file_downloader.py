@@ -41,6 +41,33 @@ class SourcesCachingDownloader:
                                    retry, retry_wait, verify_ssl, auth, headers, md5, sha1, sha256,
                                    download_cache_folder, backups_urls)
 
+    def extracted_sources_cache(self, sha256):
+        """ the download cache storing the sources extracted by get(), None if it is not enabled
+        """
+        if not sha256 or not self._global_conf.get("core.sources:extracted_cache", check_type=bool):
+            return None
+        download_cache_folder = self._global_conf.get("core.sources:download_cache")
+        download_cache_folder = download_cache_folder or HomePaths(self._home_folder).default_sources_backup_folder
+        if not os.path.isabs(download_cache_folder):
+            raise ConanException("core.sources:download_cache must be an absolute path")
+        return DownloadCache(download_cache_folder, self._max_size)
+
+    def reuse_backup_sources(self, download_cache, sha256, urls):
+        """ record the current recipe in the backup sources summary of an archive reused from the
+        extracted sources cache, without downloading it, so it is uploaded with the recipe.
+        :return: False if the archive is not in the backup sources and must be downloaded
+        """
+        cached_path = download_cache.source_path(sha256)
+        with download_cache.lock(sha256):
+            if not download_cache.is_complete(cached_path):
+                return False
+            download_cache.update_backup_sources_json(cached_path, self._conanfile, urls)
+        return True
+
+    @property
+    def _max_size(self):
+        return self._global_conf.get("core.download:download_cache_max_size", check_type=int)
+
     def _caching_download(self, urls, file_path,
                           retry, retry_wait, verify_ssl, auth, headers, md5, sha1, sha256,
                           download_cache_folder, backups_urls):
@@ -56,12 +83,13 @@ class SourcesCachingDownloader:
         if download_cache_folder and not os.path.isabs(download_cache_folder):
             raise ConanException("core.download:download_cache must be an absolute path")
 
-        download_cache = DownloadCache(download_cache_folder)
+        download_cache = DownloadCache(download_cache_folder, self._max_size)
         cached_path = download_cache.source_path(sha256)
         with download_cache.lock(sha256):
             remove_if_dirty(cached_path)
 
-            if os.path.exists(cached_path):
+            hit = os.path.exists(cached_path)
+            if hit:
                 self._output.info(f"Source {urls} retrieved from local download cache")
             else:
                 with set_dirty_context_manager(cached_path):
@@ -86,6 +114,11 @@ class SourcesCachingDownloader:
             mkdir(os.path.dirname(file_path))
             shutil.copy2(cached_path, file_path)
 
+        if hit:
+            download_cache.record_hit(cached_path)
+        else:
+            download_cache.record_download(cached_path, sha256)
+
     def _origin_download(self, urls, cached_path, retry, retry_wait,
                          verify_ssl, auth, headers, md5, sha1, sha256, is_last):
         """ download from the internet, the urls provided by the recipe (mirrors).
@@ -160,6 +193,7 @@ class ConanInternalCacheDownloader:
         self._download_cache = config.get("core.download:download_cache")
         if self._download_cache and not os.path.isabs(self._download_cache):
             raise ConanException("core.download:download_cache must be an absolute path")
+        self._max_size = config.get("core.download:download_cache_max_size", check_type=int)
         self._file_downloader = FileDownloader(requester, scope=scope)
         self._scope = scope
 
@@ -169,25 +203,47 @@ class ConanInternalCacheDownloader:
                                            verify_ssl=verify_ssl, auth=auth, overwrite=metadata)
             return
 
-        download_cache = DownloadCache(self._download_cache)
+        download_cache = DownloadCache(self._download_cache, self._max_size)
         cached_path, h = download_cache.cached_path(url)
+        # Readers of complete entries don't need the lock
+        if download_cache.is_complete(cached_path) and self._copy_cached(cached_path, file_path):
+            download_cache.record_hit(cached_path)
+            return
+
         with download_cache.lock(h):
             remove_if_dirty(cached_path)
 
-            if not os.path.exists(cached_path):
+            hit = os.path.exists(cached_path)
+            if not hit:
                 with set_dirty_context_manager(cached_path):
                     self._file_downloader.download(url, cached_path, retry=retry,
                                                    retry_wait=retry_wait, verify_ssl=verify_ssl,
                                                    auth=auth, overwrite=False)
-            else:  # Found in cache!
-                total_length = os.path.getsize(cached_path)
-                is_large_file = total_length > 10000000  # 10 MB
-                if is_large_file:
-                    base_name = os.path.basename(file_path)
-                    hs = human_size(total_length)
-                    ConanOutput(scope=self._scope).info(f"Copying {hs} {base_name} from download "
-                                                        f"cache, instead of downloading it")
 
             # Everything good, file in the cache, just copy it to final destination
+            self._copy_cached(cached_path, file_path, hit=hit, locked=True)
+
+        if hit:
+            download_cache.record_hit(cached_path)
+        else:
+            download_cache.record_download(cached_path)
+
+    def _copy_cached(self, cached_path, file_path, hit=True, locked=False):
+        """ copy the cached file to its final destination. Without the lock, the entry could be
+        pruned meanwhile, it returns False if it failed
+        """
+        try:
+            total_length = os.path.getsize(cached_path)
+            is_large_file = total_length > 10000000  # 10 MB
+            if hit and is_large_file:
+                base_name = os.path.basename(file_path)
+                hs = human_size(total_length)
+                ConanOutput(scope=self._scope).info(f"Copying {hs} {base_name} from download "
+                                                    f"cache, instead of downloading it")
             mkdir(os.path.dirname(file_path))
             shutil.copy2(cached_path, file_path)
+        except FileNotFoundError:
+            if locked:
+                raise
+            return False
+        return True
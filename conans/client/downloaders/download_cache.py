@@ -1,31 +1,141 @@
 import hashlib
 import json
 import os
+import sqlite3
+import time
 from contextlib import contextmanager
 from threading import Lock
 
+from conan.api.output import ConanOutput
 from conan.errors import ConanException
+from conan.internal.cache.db.table import BaseDbTable
 from conans.util.dates import timestamp_now
-from conans.util.files import load, save, remove_if_dirty
+from conans.util.files import load, save, remove_if_dirty, is_dirty, rmdir
 from conans.util.locks import simple_lock
 
 
+class _EntriesDBTable(BaseDbTable):
+    table_name = "entries"
+    columns_description = [("path", str, False, None, True),
+                           ("checksum", str, True),
+                           ("size", int),
+                           ("last_access", float),
+                           ("hits", int)]
+
+
+class _StatsDBTable(BaseDbTable):
+    table_name = "stats"
+    columns_description = [("kind", str, False, None, True),
+                           ("hits", int),
+                           ("misses", int)]
+
+
+class DownloadCacheIndex:
+    """ SQLite index of the download cache entries, with their checksum, size and last access
+    time, and the accumulated hits and misses of every kind of entry. It allows computing the
+    size of the cache, and pruning the least recently used entries, without walking the cache
+    """
+
+    def __init__(self, filename):
+        self._entries = _EntriesDBTable(filename)
+        self._stats = _StatsDBTable(filename)
+        # Always with "IF NOT EXISTS", other processes sharing the cache might be creating it
+        self._entries.create_table()
+        self._stats.create_table()
+
+    def _count(self, conn, path, column):
+        kind = path.split("/", 1)[0]
+        conn.execute(f"INSERT OR IGNORE INTO {self._stats.table_name} VALUES (?, 0, 0)", (kind,))
+        conn.execute(f"UPDATE {self._stats.table_name} SET {column} = {column} + 1 "
+                     f"WHERE kind = ?", (kind,))
+
+    def stored(self, path, checksum, size, hit=False):
+        """ a new entry stored in the cache, a miss, unless it is the indexing of an existing one
+        """
+        with self._entries.db_connection() as conn:
+            conn.execute(f"INSERT OR REPLACE INTO {self._entries.table_name} VALUES "
+                         f"(?, ?, ?, ?, ?)", (path, checksum, size, time.time(), int(hit)))
+            self._count(conn, path, "hits" if hit else "misses")
+
+    def accessed(self, path):
+        """ an existing entry read from the cache, a hit. Returns False if it was not indexed
+        """
+        with self._entries.db_connection() as conn:
+            r = conn.execute(f"UPDATE {self._entries.table_name} SET last_access = ?, "
+                             f"hits = hits + 1 WHERE path = ?", (time.time(), path))
+            if r.rowcount:
+                self._count(conn, path, "hits")
+            return r.rowcount > 0
+
+    def add(self, path, checksum, size, last_access):
+        """ index an entry that was already in the cache
+        """
+        with self._entries.db_connection() as conn:
+            conn.execute(f"INSERT OR IGNORE INTO {self._entries.table_name} VALUES "
+                         f"(?, ?, ?, ?, 0)", (path, checksum, size, last_access))
+
+    def remove(self, path):
+        with self._entries.db_connection() as conn:
+            conn.execute(f"DELETE FROM {self._entries.table_name} WHERE path = ?", (path,))
+
+    def entries(self):
+        """ all the entries, the least recently used first
+        """
+        with self._entries.db_connection() as conn:
+            r = conn.execute(f"SELECT * FROM {self._entries.table_name} "
+                             f"ORDER BY last_access ASC")
+            return [self._entries.row_type(*row) for row in r.fetchall()]
+
+    def total_size(self, kinds):
+        """ the size of the entries of the given kinds, the names of their folders
+        """
+        placeholders = ", ".join("?" for _ in kinds)
+        with self._entries.db_connection() as conn:
+            r = conn.execute(f"SELECT SUM(size) FROM {self._entries.table_name} "
+                             f"WHERE substr(path, 1, 2) IN ({placeholders})",
+                             [f"{k}/" for k in kinds])
+            return r.fetchone()[0] or 0
+
+    def stats(self):
+        with self._stats.db_connection() as conn:
+            r = conn.execute(f"SELECT * FROM {self._stats.table_name}")
+            return {row[0]: {"hits": row[1], "misses": row[2]} for row in r.fetchall()}
+
+
 class DownloadCache:
-    """ The download cache has 3 folders
+    """ The download cache has 4 folders
     - "s": SOURCE_BACKUP for the files.download(internet_url) backup sources feature
     - "c": CONAN_CACHE: for caching Conan packages artifacts
+    - "x": EXTRACTED_SOURCES: the sources archives already extracted by files.get()
     - "locks": The LOCKS folder containing the file locks for concurrent access to the cache
+    and an "index.sqlite3" database indexing the entries of the other folders
     """
     _LOCKS = "locks"
     _SOURCE_BACKUP = "s"
     _CONAN_CACHE = "c"
+    _EXTRACTED_SOURCES = "x"
+    _INDEX = "index.sqlite3"
+    _KINDS = {_SOURCE_BACKUP: "sources", _CONAN_CACHE: "packages",
+              _EXTRACTED_SOURCES: "extracted"}
+    _PRUNABLE = (_CONAN_CACHE, _EXTRACTED_SOURCES)
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, max_size=None):
         self._path: str = path
+        self._max_size = max_size  # Pruning the LRU entries after storing new ones if exceeded
+        self._index = None
 
     def source_path(self, sha256):
         return os.path.join(self._path, self._SOURCE_BACKUP, sha256)
 
+    def extracted_sources_path(self, sha256, extraction):
+        """ the folder with the contents of the archive ``sha256`` extracted with the
+        ``extraction`` arguments (strip_root, pattern...), as they change the result
+        """
+        md = hashlib.sha256()
+        md.update(f"{sha256}:{extraction}".encode())
+        h = md.hexdigest()
+        return os.path.join(self._path, self._EXTRACTED_SOURCES, h), h
+
     def cached_path(self, url):
         md = hashlib.sha256()
         md.update(url.encode())
@@ -47,6 +157,124 @@ class DownloadCache:
             finally:
                 thread_lock.release()
 
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def index(self):
+        if self._index is None:
+            os.makedirs(self._path, exist_ok=True)
+            self._index = DownloadCacheIndex(os.path.join(self._path, self._INDEX))
+        return self._index
+
+    @staticmethod
+    def is_complete(path):
+        """ if the entry can be read without locking it: it exists, and it is not being written.
+        Writers mark the entry as dirty before creating it, so checking it after the existence
+        guarantees it is complete
+        """
+        return os.path.exists(path) and not is_dirty(path)
+
+    def _key(self, path):
+        return os.path.relpath(path, self._path).replace("\\", "/")
+
+    @staticmethod
+    def _size(path):
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        size = 0
+        for root, _, files in os.walk(path):
+            size += sum(os.path.getsize(os.path.join(root, f)) for f in files
+                        if not os.path.islink(os.path.join(root, f)))
+        return size
+
+    def record_download(self, path, checksum=None):
+        """ index a new entry of the cache, downloaded or extracted, a miss, and prune the cache
+        if it exceeds the max size. It must be called without holding the lock of any entry, as
+        the pruning locks the removed ones. The index is not critical, it never fails a download
+        """
+        try:
+            self.index.stored(self._key(path), checksum, self._size(path))
+            if self._max_size is not None and \
+                    self.index.total_size(self._PRUNABLE) > self._max_size:
+                self.prune(self._max_size)
+        except (sqlite3.Error, OSError, ConanException) as e:
+            ConanOutput().warning(f"Could not update the download cache index: {e}")
+
+    def record_hit(self, path):
+        try:
+            if not self.index.accessed(self._key(path)):  # Created before having an index
+                self.index.stored(self._key(path), None, self._size(path), hit=True)
+        except (sqlite3.Error, OSError, ConanException) as e:
+            ConanOutput().warning(f"Could not update the download cache index: {e}")
+
+    def sync_index(self):
+        """ make the index match the contents of the cache folders: index the entries that
+        were stored without index, and drop the ones removed from disk
+        """
+        present = set()
+        for folder in self._KINDS:
+            folder_path = os.path.join(self._path, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for name in os.listdir(folder_path):
+                path = os.path.join(folder_path, name)
+                if name.endswith((".dirty", ".json")) or not self.is_complete(path):
+                    continue
+                present.add(f"{folder}/{name}")
+        indexed = {e.path for e in self.index.entries()}
+        for key in indexed - present:
+            self.index.remove(key)
+        for key in sorted(present - indexed):
+            path = os.path.join(self._path, key)
+            checksum = key.split("/", 1)[1] if key.startswith(self._SOURCE_BACKUP) else None
+            self.index.add(key, checksum, self._size(path), os.path.getmtime(path))
+
+    def stats(self):
+        """ entries, size and accumulated hits and misses of every kind of entry in the cache
+        """
+        self.sync_index()
+        stats = self.index.stats()
+        result = {}
+        for folder, kind in self._KINDS.items():
+            counters = stats.get(folder, {"hits": 0, "misses": 0})
+            result[kind] = {"entries": 0, "size": 0, **counters}
+        for entry in self.index.entries():
+            kind = result[self._KINDS[entry.path.split("/", 1)[0]]]
+            kind["entries"] += 1
+            kind["size"] += entry.size
+        return result
+
+    def prune(self, max_size):
+        """ remove the least recently used packages artifacts and extracted sources, until they
+        are not larger than max_size. The backup sources are never pruned, they might be pending
+        to be uploaded, use "conan cache clean --backup-sources" for them. The entries that
+        cannot be removed, as they are being read, are kept
+        :return: the list of removed entries and the size freed
+        """
+        entries = [e for e in self.index.entries() if e.path.split("/", 1)[0] in self._PRUNABLE]
+        total = sum(e.size for e in entries)
+        removed = []
+        freed = 0
+        for entry in entries:
+            if total - freed <= max_size:
+                break
+            path = os.path.join(self._path, entry.path)
+            with self.lock(os.path.basename(path)):
+                try:
+                    if os.path.isdir(path):
+                        rmdir(path)
+                    elif os.path.exists(path):
+                        os.remove(path)
+                except (OSError, ConanException) as e:  # Open in Windows by a lock-free reader
+                    ConanOutput().warning(f"Could not remove {path} from the download cache: {e}")
+                    continue
+                self.index.remove(entry.path)
+            removed.append(entry.path)
+            freed += entry.size
+        return removed, freed
+
     def get_backup_sources_files(self, excluded_urls, package_list=None, only_upload=True):
         """Get list of backup source files currently present in the cache,
         either all of them if no package_list is give, or filtered by those belonging to the references in the package_list
@@ -1,5 +1,6 @@
 from collections import OrderedDict
 
+from conan.internal.json_stream import JsonStreamDict
 from conans.client.graph.graph_error import GraphError
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
@@ -68,6 +69,9 @@ class Node(object):
         self.build_allowed = False
         self.is_conf = False
         self.replaced_requires = {}  # To track the replaced requires for self.dependencies[old-ref]
+        # The dependants chain down to the root when this node was expanded, check_downstream walks
+        self._downstream_nodes = frozenset()
+        self._requires_index = None  # graph-global {name: set(nodes)}, assigned by DepsGraph
 
     def __lt__(self, other):
         """
@@ -106,7 +110,7 @@ class Node(object):
         assert not require.version_range  # No ranges slip into transitive_deps definitions
         # TODO: Might need to move to an update() for performance
         self.transitive_deps.pop(require, None)
-        self.transitive_deps[require] = TransitiveRequirement(require, node)
+        self.add_transitive_dep(require, node)
 
         if self.conanfile.vendor:
             return
@@ -128,7 +132,33 @@ class Node(object):
         down_require.defining_require = require.defining_require
         return d.src.propagate_downstream(down_require, node)
 
-    def check_downstream_exists(self, require):
+    def add_transitive_dep(self, require, node):
+        self.transitive_deps[require] = TransitiveRequirement(require, node)
+        if self._requires_index is not None:
+            self._requires_index.setdefault(require.ref.name, set()).add(self)
+
+    def _downstream_candidates(self, name):
+        """ the nodes of the downstream chain, including self, that have a requirement or a ref
+        with this name, the only ones in which check_downstream_exists() can find something
+        """
+        if self._requires_index is None:
+            return None
+        indexed = self._requires_index.get(name)
+        if not indexed:
+            return set()
+        if len(indexed) < len(self._downstream_nodes):
+            result = {n for n in indexed if n is self or n in self._downstream_nodes}
+        else:
+            result = {n for n in self._downstream_nodes if n in indexed}
+            if self in indexed:
+                result.add(self)
+        return result
+
+    def check_downstream_exists(self, require, candidates=None):
+        if candidates is None:
+            candidates = self._downstream_candidates(require.ref.name)
+            if candidates is not None and not candidates:
+                return None  # Nothing with this name downstream, no need to walk
         # First, a check against self, could be a loop-conflict
         # This is equivalent as the Requirement hash and eq methods
         # TODO: Make self.ref always exist, but with name=None if name not defined
@@ -158,6 +188,10 @@ class Node(object):
 
         if self.conanfile.vendor:
             return result
+        if candidates is not None:
+            candidates.discard(self)
+            if not candidates:  # Nothing else downstream can match, no need to keep walking
+                return result
         # Seems the algrithm depth-first, would only have 1 dependant at most to propagate down
         # at any given time
         if not self.dependants:
@@ -165,7 +199,6 @@ class Node(object):
         assert len(self.dependants) == 1
         dependant = self.dependants[0]
 
-        # TODO: Implement an optimization where the requires is checked against a graph global
         # print("    Lets check_downstream one more")
         down_require = dependant.require.transform_downstream(self.conanfile.package_type,
                                                               require, None)
@@ -176,7 +209,7 @@ class Node(object):
 
         down_require.defining_require = require.defining_require
         source_node = dependant.src
-        return source_node.check_downstream_exists(down_require) or result
+        return source_node.check_downstream_exists(down_require, candidates) or result
 
     def check_loops(self, new_node, count=0):
         if self.ref == new_node.ref and self.context == new_node.context:
@@ -340,6 +373,9 @@ class DepsGraph(object):
         self.replaced_requires = {}
         self.options_conflicts = {}
         self.error = False
+        self._levels = None  # Cached topological levels, invalidated when the graph changes
+        # {name: set(nodes)} that have a requirement or a ref of that name, to check downstream
+        self._requires_index = {}
 
     def overrides(self):
         return Overrides.create(self.nodes)
@@ -353,12 +389,21 @@ class DepsGraph(object):
 
     def add_node(self, node):
         self.nodes.append(node)
+        self._levels = None
+        node._requires_index = self._requires_index
+        if node.ref is not None and node.ref.name is not None:
+            self._requires_index.setdefault(node.ref.name, set()).add(node)
+        for require in node.transitive_deps:
+            self._requires_index.setdefault(require.ref.name, set()).add(node)
 
     def add_edge(self, src, dst, require):
         assert src in self.nodes and dst in self.nodes
         edge = Edge(src, dst, require)
         src.add_edge(edge)
         dst.add_edge(edge)
+        if len(dst.dependants) == 1:
+            dst._downstream_nodes = src._downstream_nodes | {src}
+        self._levels = None
 
     def ordered_iterate(self):
         ordered = self.by_levels()
@@ -372,24 +417,38 @@ class DepsGraph(object):
         first level nodes, and so on
         return [[node1, node34], [node3], [node23, node8],...]
         """
+        if self._levels is None:
+            self._levels = self._compute_levels()
+        # TODO: SORTING seems only necessary for test order
+        # Sorted in every call, because the order depends on the package_id, computed later
+        return [sorted(level) for level in self._levels]
+
+    def _compute_levels(self):
+        # Kahn algorithm: every node keeps the count of its dependencies not yet in a level, and
+        # it goes to the next level when the last one is processed. Linear in nodes + edges
+        pending = {}
+        dependants = {}
+        for node in self.nodes:
+            pending[node] = 0
+            dependants[node] = []
+        for node in self.nodes:
+            # dict.fromkeys to count every different dependency only once, deterministically
+            for dep in dict.fromkeys(node.neighbors()):
+                if dep in pending:
+                    pending[node] += 1
+                    dependants[dep].append(node)
+
         result = []
-        # We make it a dict to preserve insertion order and be deterministic, s
-        # sets are not deterministic order. dict is fast for look up operations
-        opened = dict.fromkeys(self.nodes)
-        while opened:
-            current_level = []
-            for o in opened:
-                o_neighs = o.neighbors()
-                if not any(n in opened for n in o_neighs):
-                    current_level.append(o)
-
-            # TODO: SORTING seems only necessary for test order
-            current_level.sort()
+        current_level = [node for node, count in pending.items() if count == 0]
+        while current_level:
             result.append(current_level)
-            # now start new level, removing the current level items
-            for item in current_level:
-                opened.pop(item)
-
+            next_level = []
+            for node in current_level:
+                for dependant in dependants[node]:
+                    pending[dependant] -= 1
+                    if pending[dependant] == 0:
+                        next_level.append(dependant)
+            current_level = next_level
         return result
 
     def build_time_nodes(self):
@@ -403,11 +462,17 @@ class DepsGraph(object):
         if self.error:
             raise self.error
 
-    def serialize(self):
+    def serialize(self, lazy=False):
+        """ with lazy=True the nodes are serialized one by one while the result is being written
+        with iter_json(), instead of keeping the serialization of all of them in memory
+        """
         for i, n in enumerate(self.nodes):
             n.id = str(i)
         result = OrderedDict()
-        result["nodes"] = {n.id: n.serialize() for n in self.nodes}
+        if lazy:
+            result["nodes"] = JsonStreamDict((n.id, n.serialize()) for n in self.nodes)
+        else:
+            result["nodes"] = {n.id: n.serialize() for n in self.nodes}
         result["root"] = {self.root.id: repr(self.root.ref)}  # TODO: ref of consumer/virtual
         result["overrides"] = self.overrides().serialize()
         result["resolved_ranges"] = {repr(r): s.repr_notime() for r, s in self.resolved_ranges.items()}
@@ -5,7 +5,7 @@ from collections import deque
 from conan.internal.cache.conan_reference_layout import BasicLayout
 from conans.client.conanfile.configure import run_configure_method
 from conans.client.graph.graph import DepsGraph, Node, CONTEXT_HOST, \
-    CONTEXT_BUILD, TransitiveRequirement, RECIPE_VIRTUAL, RECIPE_EDITABLE
+    CONTEXT_BUILD, RECIPE_VIRTUAL, RECIPE_EDITABLE
 from conans.client.graph.graph import RECIPE_PLATFORM
 from conans.client.graph.graph_error import GraphLoopError, GraphConflictError, GraphMissingError, \
     GraphRuntimeError, GraphError
@@ -204,7 +204,7 @@ class DepsGraphBuilder(object):
             self._resolve_replace_requires(node, require, profile_build, profile_host, graph)
             if graph_lock:
                 graph_lock.resolve_overrides(require)
-            node.transitive_deps[require] = TransitiveRequirement(require, node=None)
+            node.add_transitive_dep(require, None)
 
     def _resolve_alias(self, node, require, alias, graph):
         # First try cached
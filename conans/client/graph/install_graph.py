@@ -1,4 +1,3 @@
-import json
 import os
 import shlex
 import textwrap
@@ -7,9 +6,43 @@ from conan.api.output import ConanOutput
 from conans.client.graph.graph import RECIPE_CONSUMER, RECIPE_VIRTUAL, BINARY_SKIP, \
     BINARY_MISSING, BINARY_INVALID, Overrides, BINARY_BUILD, BINARY_EDITABLE_BUILD, BINARY_PLATFORM
 from conan.errors import ConanException, ConanInvalidConfiguration
+from conan.internal.json_stream import iter_json_file
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
-from conans.util.files import load
+
+
+def _topological_levels(nodes):
+    """ Kahn algorithm over {key: node}, in which every node.depends is a list of keys. Returns the
+    levels, in order of processing, keeping the insertion order of the nodes inside every level,
+    and the {key: node} that couldn't be leveled because they are part of a loop
+    """
+    index = {}
+    pending = {}
+    dependants = {}
+    for i, key in enumerate(nodes):
+        index[key] = i
+        pending[key] = 0
+        dependants[key] = []
+    for key, node in nodes.items():
+        for dep in set(node.depends):
+            if dep in pending:  # depends to other elements not in this graph are already satisfied
+                pending[key] += 1
+                dependants[dep].append(key)
+
+    levels = []
+    current_level = [k for k, count in pending.items() if count == 0]
+    while current_level:
+        current_level.sort(key=index.get)
+        levels.append([nodes[k] for k in current_level])
+        next_level = []
+        for key in current_level:
+            for dependant in dependants[key]:
+                pending[dependant] -= 1
+                if pending[dependant] == 0:
+                    next_level.append(dependant)
+        current_level = next_level
+    remaining = {k: v for k, v in nodes.items() if pending[k] > 0}
+    return levels, remaining
 
 
 class _InstallPackageReference:
@@ -171,24 +204,8 @@ class _InstallRecipeReference:
                     self.depends.append(dep.dst.ref)
 
     def _install_order(self):
-        # TODO: Repeated, refactor
         # a topological order by levels, returns a list of list, in order of processing
-        levels = []
-        opened = self.packages
-        while opened:
-            current_level = []
-            closed = []
-            for o in opened.values():
-                requires = o.depends
-                if not any(n in opened for n in requires):
-                    current_level.append(o)
-                    closed.append(o)
-
-            if current_level:
-                levels.append(current_level)
-            # now initialize new level
-            opened = {k: v for k, v in opened.items() if v not in closed}
-
+        levels, _ = _topological_levels(self.packages)
         return levels
 
     def serialize(self):
@@ -369,17 +386,50 @@ class InstallGraph:
         self.reduced = False
         self._profiles = {"self": profile_args} if profile_args is not None else {}
         self._filename = None
+        self._levels = None  # Cached install_order() levels, invalidated by merge() and reduce()
         if deps_graph is not None:
             self._initialize_deps_graph(deps_graph)
             self._is_test_package = deps_graph.root.conanfile.tested_reference_str is not None
 
     @staticmethod
     def load(filename):
-        data = json.loads(load(filename))
+        """ reads the build-order file incrementally, deserializing its items one by one, without
+        loading the whole json text or document in memory
+        """
+        path = filename
         filename = os.path.basename(filename)
         filename = os.path.splitext(filename)[0]
-        install_graph = InstallGraph.deserialize(data, filename)
-        return install_graph
+        header = {}
+        pending = []  # Items found before "order_by", only if the fields are in other order
+        result = None
+        for keys, value in iter_json_file(path, ("order", "*", "*")):
+            if isinstance(keys[0], int):  # legacy format, a list of levels
+                header["legacy"] = True
+                header.setdefault("order_by", "recipe")
+                pending.extend(value)
+            elif keys[0] == "order":
+                pending.append(value)
+            else:
+                header[keys[0]] = value
+            if result is None and "order_by" in header:
+                result = InstallGraph(None, order_by=header["order_by"])
+                result._filename = filename
+            if result is not None:
+                for item in pending:
+                    result._add_serialized(item, filename)
+                pending = []
+        if result is None:
+            if header:
+                raise ConanException(f"Invalid build-order file, 'order_by' not defined: {path}")
+            # Nothing to read, an empty legacy build-order
+            result = InstallGraph(None)
+            result._filename = filename
+            header["legacy"] = True
+        result.legacy = header.get("legacy", False)
+        result.reduced = header.get("reduced", False)
+        profiles = header.get("profiles", {})
+        result._profiles = {k: ProfileArgs.deserialize(v) for k, v in profiles.items()}
+        return result
 
     def merge(self, other):
         """
@@ -395,6 +445,7 @@ class InstallGraph:
                 self._nodes[ref] = install_node
             else:
                 existing.merge(install_node)
+        self._levels = None
         # Make sure that self is also updated
         current = self._profiles.pop("self", None)
         if current is not None:
@@ -415,11 +466,14 @@ class InstallGraph:
         result._profiles = {k: ProfileArgs.deserialize(v) for k, v in profiles.items()}
         for level in data:
             for item in level:
-                elem = result._node_cls.deserialize(item, filename)
-                key = elem.ref if order == "recipe" else elem.pref
-                result._nodes[key] = elem
+                result._add_serialized(item, filename)
         return result
 
+    def _add_serialized(self, item, filename):
+        elem = self._node_cls.deserialize(item, filename)
+        key = elem.ref if self._order == "recipe" else elem.pref
+        self._nodes[key] = elem
+
     def _initialize_deps_graph(self, deps_graph):
         for node in deps_graph.ordered_iterate():
             if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL) \
@@ -434,6 +488,11 @@ class InstallGraph:
                 existing.add(node)
 
     def reduce(self):
+        # Index of consumers of every key, so removing a node only visits its own consumers
+        consumers = {}
+        for k, node in self._nodes.items():
+            for d in node.depends:
+                consumers.setdefault(d, {})[k] = node
         result = {}
         for k, node in self._nodes.items():
             if node.need_build:
@@ -441,37 +500,27 @@ class InstallGraph:
             else:  # Eliminate this element from the graph
                 dependencies = node.depends
                 # Find all consumers
-                for n in self._nodes.values():
-                    if k in n.depends:
-                        n.depends = [d for d in n.depends if d != k]  # Discard the removed node
-                        # Add new edges, without repetition
-                        n.depends.extend(d for d in dependencies if d not in n.depends)
+                for consumer_key, n in consumers.pop(k, {}).items():
+                    n.depends = [d for d in n.depends if d != k]  # Discard the removed node
+                    # Add new edges, without repetition
+                    for d in dependencies:
+                        if d not in n.depends:
+                            n.depends.append(d)
+                            consumers.setdefault(d, {})[consumer_key] = n
         self._nodes = result
+        self._levels = None
         self.reduced = True
 
     def install_order(self, flat=False):
         # a topological order by levels, returns a list of list, in order of processing
-        levels = []
-        opened = self._nodes
-        while opened:
-            current_level = []
-            closed = []
-            for o in opened.values():
-                requires = o.depends
-                if not any(n in opened for n in requires):
-                    current_level.append(o)
-                    closed.append(o)
-
-            if current_level:
-                levels.append(current_level)
-            else:
-                self._raise_loop_detected(opened)
-
-            # now initialize new level
-            opened = {k: v for k, v in opened.items() if v not in closed}
+        if self._levels is None:
+            levels, remaining = _topological_levels(self._nodes)
+            if remaining:
+                self._raise_loop_detected(remaining)
+            self._levels = levels
         if flat:
-            return [r for level in levels for r in level]
-        return levels
+            return [r for level in self._levels for r in level]
+        return [list(level) for level in self._levels]
 
     @staticmethod
     def _raise_loop_detected(nodes):
@@ -1,3 +1,5 @@
+from threading import Lock
+
 from conan.api.output import ConanOutput
 from conan.internal.cache.conan_reference_layout import BasicLayout
 from conans.client.graph.graph import (RECIPE_DOWNLOADED, RECIPE_INCACHE, RECIPE_NEWER,
@@ -14,6 +16,7 @@ class ConanProxy:
         self._cache = conan_app.cache
         self._remote_manager = conan_app.remote_manager
         self._resolved = {}  # Cache of the requested recipes to optimize calls
+        self._lock = Lock()  # The same app can compute several graphs concurrently
 
     def get_recipe(self, ref, remotes, update, check_update):
         """
@@ -21,10 +24,11 @@ class ConanProxy:
         """
         # TODO: cache2.0 Check with new locks
         # with layout.conanfile_write_lock(self._out):
-        resolved = self._resolved.get(ref)
-        if resolved is None:
-            resolved = self._get_recipe(ref, remotes, update, check_update)
-            self._resolved[ref] = resolved
+        with self._lock:
+            resolved = self._resolved.get(ref)
+            if resolved is None:
+                resolved = self._get_recipe(ref, remotes, update, check_update)
+                self._resolved[ref] = resolved
         return resolved
 
     # return the remote where the recipe was found or None if the recipe was not found
@@ -1,3 +1,5 @@
+from threading import Lock
+
 from conans.client.graph.proxy import should_update_reference
 from conan.errors import ConanException
 from conans.model.recipe_ref import RecipeReference
@@ -10,10 +12,14 @@ class RangeResolver:
         self._cache = conan_app.cache
         self._editable_packages = editable_packages
         self._remote_manager = conan_app.remote_manager
+        # The search results are cached sorted, newest first, so resolving each range is a scan
         self._cached_cache = {}  # Cache caching of search result, so invariant wrt installations
-        self._cached_remote_found = {}  # dict {ref (pkg/*): {remote_name: results (pkg/1, pkg/2)}}
+        self._cached_remote_found = {}  # dict {ref (pkg/*): {remote_name: results (pkg/2, pkg/1)}}
         self.resolved_ranges = {}
+        # {(name, user, channel, range key): ref} equivalent ranges are only resolved once
+        self._resolved_keys = {}
         self._resolve_prereleases = global_conf.get('core.version_ranges:resolve_prereleases')
+        self._lock = Lock()  # The same app can compute several graphs concurrently
 
     def resolve(self, require, base_conanref, remotes, update):
         try:
@@ -25,7 +31,10 @@ class RangeResolver:
         if version_range is None:
             return
         assert isinstance(version_range, VersionRange)
+        with self._lock:
+            self._resolve_range(require, version_range, base_conanref, remotes, update)
 
+    def _resolve_range(self, require, version_range, base_conanref, remotes, update):
         # Check if this ref with version range was already solved
         previous_ref = self.resolved_ranges.get(require.ref)
         if previous_ref is not None:
@@ -33,6 +42,13 @@ class RangeResolver:
             return
 
         ref = require.ref
+        key = ref.name, ref.user, ref.channel, version_range.key()
+        previous_ref = self._resolved_keys.get(key)
+        if previous_ref is not None:
+            self.resolved_ranges[require.ref] = previous_ref
+            require.ref = previous_ref
+            return
+
         search_ref = RecipeReference(ref.name, "*", ref.user, ref.channel)
 
         resolved_ref = self._resolve_local(search_ref, version_range)
@@ -49,6 +65,7 @@ class RangeResolver:
         # To fix Cache behavior, we remove the revision information
         resolved_ref.revision = None  # FIXME: Wasting information already obtained from server?
         self.resolved_ranges[require.ref] = resolved_ref
+        self._resolved_keys[key] = resolved_ref
         require.ref = resolved_ref
 
     def _resolve_local(self, search_ref, version_range):
@@ -63,6 +80,7 @@ class RangeResolver:
             local_found.extend(r for r in self._editable_packages.edited_refs
                                if r.name == search_ref.name and r.user == search_ref.user
                                and r.channel == search_ref.channel)
+            local_found = self._sort_newest_first(local_found)
             self._cached_cache[pattern] = local_found
         if local_found:
             return self._resolve_version(version_range, local_found, self._resolve_prereleases)
@@ -79,6 +97,7 @@ class RangeResolver:
             # TODO: This is still necessary to filter user/channel, until search_recipes is fixed
             results = [ref for ref in results if ref.user == search_ref.user
                        and ref.channel == search_ref.channel]
+            results = self._sort_newest_first(results)
             pattern_cached.update({remote.name: results})
         return results
 
@@ -94,12 +113,20 @@ class RangeResolver:
                 else:
                     update_candidates.append(resolved_version)
         if len(update_candidates) > 0:  # pick latest from already resolved candidates
-            resolved_version = self._resolve_version(version_range, update_candidates,
+            resolved_version = self._resolve_version(version_range,
+                                                     self._sort_newest_first(update_candidates),
                                                      self._resolve_prereleases)
             return resolved_version
 
+    @staticmethod
+    def _sort_newest_first(refs):
+        # All refs have the same name, user and channel, sorted as RecipeReference would do
+        return list(reversed(sorted(refs, key=lambda r: (r.version, r.timestamp or 0,
+                                                          r.revision or ""))))
+
     @staticmethod
     def _resolve_version(version_range, refs_found, resolve_prereleases):
-        for ref in reversed(sorted(refs_found)):
+        """ refs_found must be already sorted, newest first """
+        for ref in refs_found:
             if version_range.contains(ref.version, resolve_prereleases):
                 return ref
@@ -1,5 +1,6 @@
 import os
 import shutil
+import time
 from multiprocessing.pool import ThreadPool
 
 from conan.api.output import ConanOutput
@@ -15,7 +16,8 @@ from conan.errors import ConanException
 from conans.model.build_info import CppInfo, MockInfoProperty
 from conans.model.package_ref import PkgReference
 from conan.internal.paths import CONANINFO
-from conans.util.files import clean_dirty, is_dirty, mkdir, rmdir, save, set_dirty, chdir
+from conans.util.files import clean_dirty, is_dirty, mkdir, rmdir, save, set_dirty, chdir, \
+    clone_tree
 
 
 def build_id(conan_file):
@@ -33,8 +35,9 @@ def build_id(conan_file):
 
 class _PackageBuilder(object):
 
-    def __init__(self, app):
+    def __init__(self, app, global_conf):
         self._app = app
+        self._global_conf = global_conf
         self._cache = app.cache
         self._hook_manager = app.hook_manager
         self._remote_manager = app.remote_manager
@@ -76,19 +79,29 @@ class _PackageBuilder(object):
 
         return build_folder, skip_build
 
-    @staticmethod
-    def _copy_sources(conanfile, source_folder, build_folder):
+    def _copy_sources(self, conanfile, source_folder, build_folder):
         # Copies the sources to the build-folder, unless no_copy_source is defined
         rmdir(build_folder)
         if not getattr(conanfile, 'no_copy_source', False):
             conanfile.output.info('Copying sources to build folder')
+            global_conf = self._global_conf
+            mode = global_conf.get("core.build:copy_sources", default="copy",
+                                   choices=["copy", "reflink", "hardlink"])
+            parallel = global_conf.get("core.build:copy_sources_parallel", default=1,
+                                       check_type=int)
+            t1 = time.time()
             try:
-                shutil.copytree(source_folder, build_folder, symlinks=True)
+                if mode == "copy" and parallel <= 1:
+                    shutil.copytree(source_folder, build_folder, symlinks=True)
+                else:
+                    clone_tree(source_folder, build_folder, mode, parallel)
             except Exception as e:
                 msg = str(e)
                 if "206" in msg:  # System error shutil.Error 206: Filename or extension too long
                     msg += "\nUse short_paths=True if paths too long"
                 raise ConanException("%s\nError copying sources to build folder" % msg)
+            duration = time.time() - t1
+            conanfile.output.debug(f"Sources copied to build folder ({mode}) in {duration} time")
 
     def _build(self, conanfile, pref):
         write_generators(conanfile, self._app)
@@ -278,6 +291,7 @@ class BinaryInstaller:
         download_count = len(downloads)
         plural = 's' if download_count != 1 else ''
         ConanOutput().subtitle(f"Downloading {download_count} package{plural}")
+        stats = self._app.requester.connection_stats()
         parallel = self._global_conf.get("core.download:parallel", check_type=int)
         if parallel is not None:
             ConanOutput().info("Downloading binary packages in %s parallel threads" % parallel)
@@ -288,6 +302,9 @@ class BinaryInstaller:
         else:
             for node in downloads:
                 self._download_pkg(node)
+        stats = self._app.requester.connection_stats(since=stats)
+        ConanOutput().verbose(f"HTTP connections: {stats['opened']} opened, "
+                              f"{stats['reused']} reused")
 
     def _download_pkg(self, package):
         node = package.nodes[0]
@@ -390,7 +407,7 @@ class BinaryInstaller:
         with pkg_layout.package_lock():
             pkg_layout.package_remove()
             with pkg_layout.set_dirty_context_manager():
-                builder = _PackageBuilder(self._app)
+                builder = _PackageBuilder(self._app, self._global_conf)
                 pref = builder.build_package(node, pkg_layout)
             assert node.prev, "Node PREV shouldn't be empty"
             assert node.pref.revision, "Node PREF revision shouldn't be empty"
@@ -442,10 +459,10 @@ class BinaryInstaller:
 
                     # Paste the editable cpp_info but prioritizing it, only if a
                     # variable is not declared at build/source, the package will keep the value
-                    conanfile.buildenv_info.compose_env(conanfile.layouts.source.buildenv_info)
-                    conanfile.buildenv_info.compose_env(conanfile.layouts.build.buildenv_info)
-                    conanfile.runenv_info.compose_env(conanfile.layouts.source.runenv_info)
-                    conanfile.runenv_info.compose_env(conanfile.layouts.build.runenv_info)
+                    conanfile.buildenv_info.compose_envs([conanfile.layouts.source.buildenv_info,
+                                                          conanfile.layouts.build.buildenv_info])
+                    conanfile.runenv_info.compose_envs([conanfile.layouts.source.runenv_info,
+                                                        conanfile.layouts.build.runenv_info])
                     conanfile.conf_info.compose_conf(conanfile.layouts.source.conf_info)
                     conanfile.conf_info.compose_conf(conanfile.layouts.build.conf_info)
                 else:
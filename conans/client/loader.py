@@ -1,3 +1,5 @@
+import hashlib
+import marshal
 import traceback
 from importlib import invalidate_caches, util as imp_util
 import inspect
@@ -6,12 +8,13 @@ import re
 import sys
 import types
 import uuid
-from threading import Lock
+from threading import Lock, RLock
 
 import yaml
 
 from pathlib import Path
 
+from conan.internal.cache.conan_reference_layout import BYTECODE_FOLDER, EXPORT_FOLDER
 from conan.tools.cmake import cmake_layout
 from conan.tools.google import bazel_layout
 from conan.tools.microsoft import vs_layout
@@ -28,12 +31,24 @@ from conans.util.files import load, chdir, load_user_encoded
 
 class ConanFileLoader:
 
-    def __init__(self, pyreq_loader=None, conanfile_helpers=None):
+    def __init__(self, pyreq_loader=None, conanfile_helpers=None, cache=None):
         self._pyreq_loader = pyreq_loader
         self._cached_conanfile_classes = {}
         self._conanfile_helpers = conanfile_helpers
+        # Recipes inside the cache are immutable per revision, their compiled code can be reused
+        self._cache_store = os.path.join(cache.store, "") if cache is not None else None
+        # The same loader can compute several graphs concurrently, loading recipes and their
+        # python_requires is serialized. Reentrant, loading python_requires loads recipes
+        self._lock = RLock()
         invalidate_caches()
 
+    def _recipe_bytecode_folder(self, conanfile_path):
+        """ the compiled code is stored in the recipe layout, so it is removed with the recipe """
+        if self._cache_store is not None and conanfile_path.startswith(self._cache_store):
+            export_folder = os.path.dirname(conanfile_path)
+            if os.path.basename(export_folder) == EXPORT_FOLDER:
+                return os.path.join(os.path.dirname(export_folder), BYTECODE_FOLDER)
+
     def load_basic(self, conanfile_path, graph_lock=None, display="", remotes=None,
                    update=None, check_update=None):
         """ loads a conanfile basic object without evaluating anything
@@ -45,6 +60,12 @@ class ConanFileLoader:
                           update=None, check_update=None, tested_python_requires=None):
         """ loads a conanfile basic object without evaluating anything, returns the module too
         """
+        with self._lock:
+            return self._load_basic_module(conanfile_path, graph_lock, display, remotes, update,
+                                           check_update, tested_python_requires)
+
+    def _load_basic_module(self, conanfile_path, graph_lock, display, remotes, update,
+                           check_update, tested_python_requires):
         cached = self._cached_conanfile_classes.get(conanfile_path)
         if cached:
             conanfile = cached[0](display)
@@ -55,7 +76,8 @@ class ConanFileLoader:
             return conanfile, cached[1]
 
         try:
-            module, conanfile = _parse_conanfile(conanfile_path)
+            bytecode_folder = self._recipe_bytecode_folder(conanfile_path)
+            module, conanfile = _parse_conanfile(conanfile_path, bytecode_folder)
             if isinstance(tested_python_requires, RecipeReference):
                 if getattr(conanfile, "python_requires", None) == "tested_reference_str":
                     conanfile.python_requires = tested_python_requires.repr_notime()
@@ -264,8 +286,9 @@ class ConanFileLoader:
             conanfile.python_requires = [pr.repr_notime() for pr in python_requires]
 
         if self._pyreq_loader:
-            self._pyreq_loader.load_py_requires(conanfile, self, graph_lock, remotes,
-                                                update, check_updates)
+            with self._lock:
+                self._pyreq_loader.load_py_requires(conanfile, self, graph_lock, remotes,
+                                                    update, check_updates)
 
         conanfile._conan_is_consumer = True
         conanfile.generators = []  # remove the default txt generator
@@ -299,9 +322,9 @@ def _parse_module(conanfile_module, module_id):
 _load_python_lock = Lock()  # Loading our Python files is not thread-safe (modifies sys)
 
 
-def _parse_conanfile(conanfile_path):
+def _parse_conanfile(conanfile_path, bytecode_folder=None):
     with _load_python_lock:
-        module, module_id = _load_python_file(conanfile_path)
+        module, module_id = _load_python_file(conanfile_path, bytecode_folder)
     try:
         conanfile = _parse_module(module, module_id)
         return module, conanfile
@@ -317,8 +340,40 @@ def load_python_file(conan_file_path):
     return module, module_id
 
 
-def _load_python_file(conan_file_path):
+def _compile_python_file(conan_file_path, bytecode_folder):
+    """ Compile the given python file, reusing the code object marshalled in the
+    bytecode_folder by a previous run if the file (path and contents) didn't change
+    """
+    with open(conan_file_path, "rb") as f:
+        source = f.read()
+    sha = hashlib.sha256(imp_util.MAGIC_NUMBER)
+    sha.update(conan_file_path.encode("utf-8"))
+    sha.update(b"\0")
+    sha.update(source)
+    cached_path = os.path.join(bytecode_folder, sha.hexdigest())
+    try:
+        with open(cached_path, "rb") as f:
+            code = marshal.load(f)
+        if isinstance(code, types.CodeType):
+            return code
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # Not cached yet, or corrupted, compile it again
+
+    code = compile(source, conan_file_path, "exec", dont_inherit=True)
+    try:
+        os.makedirs(bytecode_folder, exist_ok=True)
+        tmp_path = "{}.{}.tmp".format(cached_path, uuid.uuid4().hex)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(code, f)
+        os.replace(tmp_path, cached_path)  # atomic, concurrent processes might be writing it
+    except OSError:
+        pass  # The cache is an optimization, failing to write it is not an error
+    return code
+
+
+def _load_python_file(conan_file_path, bytecode_folder=None):
     """ From a given path, obtain the in memory python import module
+    If a bytecode_folder is provided, the compiled code of the file will be cached there
     """
 
     if not os.path.exists(conan_file_path):
@@ -339,7 +394,11 @@ def _load_python_file(conan_file_path):
                 sys.dont_write_bytecode = True
                 spec = imp_util.spec_from_file_location(module_id, conan_file_path)
                 loaded = imp_util.module_from_spec(spec)
-                spec.loader.exec_module(loaded)
+                if bytecode_folder is None:
+                    spec.loader.exec_module(loaded)
+                else:
+                    code = _compile_python_file(conan_file_path, bytecode_folder)
+                    exec(code, loaded.__dict__)
                 sys.dont_write_bytecode = old_dont_write_bytecode
             except ImportError:
                 version_txt = _get_required_conan_version_without_loading(conan_file_path)
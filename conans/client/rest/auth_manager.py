@@ -9,6 +9,7 @@ Flow:
     if receives AuthenticationException (not open method) will ask user for login and password
     (with LOGIN_RETRIES retries) and retry to call with the new token.
 """
+import threading
 
 from conan.api.output import ConanOutput
 from conans.client.rest.remote_credentials import RemoteCredentials
@@ -43,6 +44,8 @@ class ConanApiAuthManager:
         self._creds = RemoteCreds(localdb)
         self._global_conf = global_conf
         self._cache_folder = cache_folder
+        # Concurrent calls (as parallel uploads) must not prompt for credentials at the same time
+        self._auth_lock = threading.Lock()
 
     def call_rest_api_method(self, remote, method_name, *args, **kwargs):
         """Handles AuthenticationException and request user to input a user and a password"""
@@ -61,8 +64,15 @@ class ConanApiAuthManager:
             # User valid but not enough permissions
             # token is None when you change user with user command
             # Anonymous is not enough, ask for a user
-            ConanOutput().info(f"Remote '{remote.name}' needs authentication, obtaining credentials")
-            if self._get_credentials_and_authenticate(rest_client, user, remote):
+            with self._auth_lock:
+                # Another thread could have already obtained a new token while waiting
+                authenticated = self._creds.get(remote)[1] != token
+                if not authenticated:
+                    ConanOutput().info(f"Remote '{remote.name}' needs authentication, "
+                                       "obtaining credentials")
+                    authenticated = self._get_credentials_and_authenticate(rest_client, user,
+                                                                           remote)
+            if authenticated:
                 return self.call_rest_api_method(remote, method_name, *args, **kwargs)
 
     def _get_credentials_and_authenticate(self, rest_client, user, remote):
@@ -3,6 +3,8 @@ import json
 import logging
 import os
 import platform
+import threading
+import weakref
 
 import requests
 import urllib3
@@ -26,6 +28,12 @@ logging.captureWarnings(True)
 
 DEFAULT_TIMEOUT = (30, 60)  # connect, read timeouts
 INFINITE_TIMEOUT = -1
+DEFAULT_POOL_MAXSIZE = 10  # the requests default
+
+# The http sessions are shared by all the requesters created from the same configuration, that is,
+# all the ConanApp of the same ConanAPI, so the connections are reused among API calls
+_http_sessions = weakref.WeakKeyDictionary()
+_http_sessions_lock = threading.Lock()
 
 
 class _SourceURLCredentials:
@@ -103,10 +111,11 @@ class ConanRequester:
         #  even if it doesn't use it
         # FIXME: Trick for testing when requests is mocked
         if hasattr(requests, "Session"):
-            self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=self._get_retries(config))
-            self._http_requester.mount("http://", adapter)
-            self._http_requester.mount("https://", adapter)
+            with _http_sessions_lock:
+                self._http_requester = _http_sessions.get(config)
+                if self._http_requester is None:
+                    self._http_requester = self._new_session(config)
+                    _http_sessions[config] = self._http_requester
         else:
             self._http_requester = requests
 
@@ -123,6 +132,46 @@ class ConanRequester:
                                    platform.machine()])
         self._user_agent = "Conan/%s (%s)" % (client_version, platform_info)
 
+    @staticmethod
+    def _new_session(config):
+        # The pool must be able to keep the connections of all the concurrent transfer threads,
+        # otherwise the extra ones are discarded and re-established (and TLS handshaked) every time
+        parallel = max(config.get("core.download:parallel", default=1, check_type=int),
+                       config.get("core.upload:parallel", default=1, check_type=int))
+        pool_maxsize = config.get("core.net.http:pool_maxsize", check_type=int)
+        pool_maxsize = pool_maxsize or max(DEFAULT_POOL_MAXSIZE, parallel)
+        session = requests.Session()
+        adapter = HTTPAdapter(max_retries=ConanRequester._get_retries(config),
+                              pool_maxsize=pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def connection_stats(self, since=None):
+        """ number of connections opened and of requests done through them in this session,
+        the difference is the number of times an already open connection was reused
+
+        :param since: a previous result of this method, to count only what happened after it, as
+            the session and its counters are shared by the whole process
+        """
+        opened = requests_done = 0
+        adapters = getattr(self._http_requester, "adapters", None)
+        if isinstance(adapters, dict):
+            for adapter in set(adapters.values()):
+                pool_manager = getattr(adapter, "poolmanager", None)
+                if pool_manager is None:
+                    continue
+                for key in list(pool_manager.pools.keys()):
+                    pool = pool_manager.pools.get(key)
+                    if pool is not None:
+                        opened += pool.num_connections
+                        requests_done += pool.num_requests
+        if since is not None:
+            opened = max(opened - since["opened"], 0)
+            requests_done = max(requests_done - since["requests"], 0)
+        return {"opened": opened, "requests": requests_done,
+                "reused": max(requests_done - opened, 0)}
+
     @staticmethod
     def _get_retries(config):
         retry = config.get("core.net.http:max_retries", default=2, check_type=int)
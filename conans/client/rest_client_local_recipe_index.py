@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import sys
 import textwrap
@@ -16,6 +18,7 @@ from conan.internal.errors import ConanReferenceDoesNotExistInDB, NotFoundExcept
 from conan.errors import ConanException
 from conans.model.conf import ConfDefinition
 from conans.model.recipe_ref import RecipeReference
+from conans.util.dates import revision_timestamp_now
 from conans.util.files import load, save, rmdir, copytree_compat
 
 
@@ -61,6 +64,7 @@ class RestApiClientLocalRecipesIndex:
         self._remote = remote
         local_recipes_index_path = HomePaths(home_folder).local_recipes_index_path
         local_recipes_index_path = os.path.join(local_recipes_index_path, remote.name)
+        index_path = os.path.join(local_recipes_index_path, "index.json")
         local_recipes_index_path = os.path.join(local_recipes_index_path, ".conan")
         repo_folder = self._remote.url
 
@@ -68,7 +72,7 @@ class RestApiClientLocalRecipesIndex:
         from conan.api.conan_api import ConanAPI
         conan_api = ConanAPI(local_recipes_index_path)
         self._app = ConanApp(conan_api)
-        self._layout = _LocalRecipesIndexLayout(repo_folder)
+        self._layout = _LocalRecipesIndexLayout(repo_folder, index_path)
 
     def call_method(self, method_name, *args, **kwargs):
         return getattr(self, method_name)(*args, **kwargs)
@@ -145,6 +149,18 @@ class RestApiClientLocalRecipesIndex:
     # Helper methods to implement the interface
     def _export_recipe(self, ref):
         folder = self._layout.get_recipe_folder(ref)
+        exported_ref = self._layout.get_exported_reference(ref)
+        if exported_ref is not None:
+            # The recipe didn't change since it was exported, if that revision is still the
+            # latest one in the internal cache, it doesn't need to be exported again, only its
+            # timestamp is updated, as exporting it again would do
+            latest = exported_ref.copy()
+            latest.revision = None
+            latest = self._app.cache.get_latest_recipe_reference(latest)
+            if latest is not None and latest.revision == exported_ref.revision:
+                latest.timestamp = revision_timestamp_now()
+                self._app.cache.update_recipe_timestamp(latest)
+                return latest
         conanfile_path = os.path.join(folder, "conanfile.py")
         original_stderr = sys.stderr
         sys.stderr = StringIO()
@@ -160,6 +176,7 @@ class RestApiClientLocalRecipesIndex:
             sys.stderr = original_stderr
             ConanOutput(scope="local-recipes-index").debug(f"Internal export for {ref}:\n"
                                                            f"{textwrap.indent(export_err, '    ')}")
+        self._layout.set_exported_reference(ref, new_ref)
         return new_ref
 
     @staticmethod
@@ -176,9 +193,19 @@ class RestApiClientLocalRecipesIndex:
 
 
 class _LocalRecipesIndexLayout:
+    """ The information of every recipe folder, its versions and their user/channel, and the
+    revisions exported from them, is stored in a persistent index. Every entry is invalidated
+    when any file of its recipe folder changes, so only the changed recipes are loaded and
+    exported again
+    """
+    _INDEX_VERSION = 1
 
-    def __init__(self, base_folder):
+    def __init__(self, base_folder, index_path=None):
         self._base_folder = base_folder
+        self._index_path = index_path
+        self._index = None
+        self._dirty = False  # The recomputed entries are saved once, at the end of the operation
+        self._stamps = {}  # Recipe folders are not expected to change while running a command
 
     def _get_base_folder(self, recipe_name):
         return os.path.join(self._base_folder, "recipes", recipe_name)
@@ -190,6 +217,75 @@ class _LocalRecipesIndexLayout:
             return None
         return yaml.safe_load(load(config))
 
+    def _load_index(self):
+        if self._index is None:
+            self._index = {}
+            if self._index_path and os.path.isfile(self._index_path):
+                try:
+                    index = json.loads(load(self._index_path))
+                    if index.get("version") == self._INDEX_VERSION:
+                        self._index = index["recipes"]
+                except Exception as e:  # A broken index is just recomputed
+                    ConanOutput().debug(f"Ignoring local-recipes-index {self._index_path}: {e}")
+        return self._index
+
+    def _save_index(self):
+        if self._dirty and self._index_path:
+            save(self._index_path, json.dumps({"version": self._INDEX_VERSION,
+                                               "recipes": self._index}))
+        self._dirty = False
+
+    def _folder_stamp(self, folder):
+        """ changes when any file of the folder is added, removed or modified """
+        stamp = self._stamps.get(folder)
+        if stamp is None:
+            sha = hashlib.sha1()
+            for root, dirs, files in os.walk(folder):
+                dirs.sort()
+                for f in sorted(files):
+                    path = os.path.join(root, f)
+                    st = os.stat(path)
+                    sha.update(f"{os.path.relpath(path, folder)}:{st.st_mtime_ns}:{st.st_size}\n"
+                               .encode("utf-8"))
+            stamp = self._stamps[folder] = sha.hexdigest()
+        return stamp
+
+    def _recipe_entry(self, recipe_name):
+        """ the index entry of the recipe, recomputed if anything changed in its folder,
+        None if the folder has no 'config.yml'
+        """
+        index = self._load_index()
+        folder = self._get_base_folder(recipe_name)
+        stamp = self._folder_stamp(folder)
+        entry = index.get(recipe_name)
+        if entry is not None and entry["stamp"] == stamp:
+            return entry
+
+        config_yml = self._load_config_yml(folder)
+        if config_yml is None:
+            return None
+        loader = ConanFileLoader(None)
+        versions = {}
+        for v, data in config_yml["versions"].items():
+            subfolder = data["folder"]
+            version = {"folder": subfolder}
+            # This check can be removed after compatibility with 2.0
+            conanfile = os.path.join(folder, subfolder, "conanfile.py")
+            conanfile_content = load(conanfile)
+            if "from conans" in conanfile_content or "import conans" in conanfile_content:
+                version["excluded"] = True
+            else:
+                try:
+                    recipe = loader.load_basic(conanfile)
+                    version["user"] = recipe.user
+                    version["channel"] = recipe.channel
+                except Exception as e:
+                    version["error"] = f"Couldn't load recipe {conanfile}: {e}"
+            versions[str(v)] = version
+        entry = index[recipe_name] = {"stamp": stamp, "versions": versions, "exports": {}}
+        self._dirty = True
+        return entry
+
     def get_recipes_references(self, pattern):
         name_pattern = pattern.split("/", 1)[0]
         recipes_dir = os.path.join(self._base_folder, "recipes")
@@ -198,41 +294,34 @@ class _LocalRecipesIndexLayout:
         ret = []
         excluded = set()
 
-        loader = ConanFileLoader(None)
         for r in recipes:
             if r.startswith("."):
                 # Skip hidden folders, no recipes should start with a dot
                 continue
             if not fnmatch(r, name_pattern):
                 continue
-            folder = self._get_base_folder(r)
-            config_yml = self._load_config_yml(folder)
-            if config_yml is None:
+            entry = self._recipe_entry(r)
+            if entry is None:
                 raise ConanException(f"Corrupted repo, folder {r} without 'config.yml'")
-            versions = config_yml["versions"]
-            for v in versions:
+            for v, version in entry["versions"].items():
                 # TODO: Check the search pattern is the same as remotes and cache
                 ref = f"{r}/{v}"
                 if not fnmatch(ref, pattern):
                     continue
-                subfolder = versions[v]["folder"]
-                # This check can be removed after compatibility with 2.0
-                conanfile = os.path.join(recipes_dir, r, subfolder, "conanfile.py")
-                conanfile_content = load(conanfile)
-
-                if "from conans" in conanfile_content or "import conans" in conanfile_content:
+                if version.get("excluded"):
                     excluded.add(r)
                     continue
                 ref = RecipeReference.loads(ref)
-                try:
-                    recipe = loader.load_basic(conanfile)
-                    ref.user = recipe.user
-                    ref.channel = recipe.channel
-                except Exception as e:
-                    ConanOutput().warning(f"Couldn't load recipe {conanfile}: {e}")
+                error = version.get("error")
+                if error:
+                    ConanOutput().warning(error)
+                else:
+                    ref.user = version["user"]
+                    ref.channel = version["channel"]
                 ret.append(ref)
         if excluded:
             ConanOutput().warning(f"Excluding recipes not Conan 2.0 ready: {', '.join(excluded)}")
+        self._save_index()
         return ret
 
     def get_recipe_folder(self, ref):
@@ -245,3 +334,16 @@ class _LocalRecipesIndexLayout:
             raise RecipeNotFoundException(ref)
         subfolder = versions[str(ref.version)]["folder"]
         return os.path.join(folder, subfolder)
+
+    def get_exported_reference(self, ref):
+        """ the reference exported from this recipe version, if its folder didn't change since """
+        entry = self._recipe_entry(ref.name)
+        exported = entry and entry["exports"].get(str(ref.version))
+        return RecipeReference.loads(exported) if exported else None
+
+    def set_exported_reference(self, ref, exported_ref):
+        entry = self._recipe_entry(ref.name)
+        if entry is not None:
+            entry["exports"][str(ref.version)] = exported_ref.repr_notime()
+            self._dirty = True
+        self._save_index()
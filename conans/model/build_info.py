@@ -3,6 +3,7 @@ import glob
 import json
 import os
 from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
 
 from conan.api.output import ConanOutput
 from conan.errors import ConanException
@@ -520,13 +521,14 @@ class CppInfo:
     def __init__(self, set_defaults=False):
         self.components = defaultdict(lambda: _Component(set_defaults))
         self._package = _Component(set_defaults)
+        self._memo = None  # {name: result} of the derived information, while memoized
 
     def __getattr__(self, attr):
         # all cpp_info.xxx of not defined things will go to the global package
         return getattr(self._package, attr)
 
     def __setattr__(self, attr, value):
-        if attr in ("components", "_package", "_aggregated"):
+        if attr in ("components", "_package", "_aggregated", "_memo"):
             super(CppInfo, self).__setattr__(attr, value)
         else:
             setattr(self._package, attr, value)
@@ -561,6 +563,7 @@ class CppInfo:
         @param other: The other CppInfo to merge
         @param overwrite: New values from other overwrite the existing ones
         """
+        self._invalidate()
         # Global merge
         self._package.merge(other._package, overwrite)
         # sysroot only of package, not components, first defined wins
@@ -572,16 +575,34 @@ class CppInfo:
 
     def set_relative_base_folder(self, folder):
         """Prepend the folder to all the directories definitions, that are relative"""
+        self._invalidate()
         self._package.set_relative_base_folder(folder)
         for component in self.components.values():
             component.set_relative_base_folder(folder)
 
     def deploy_base_folder(self, package_folder, deploy_folder):
         """Prepend the folder to all the directories"""
+        self._invalidate()
         self._package.deploy_base_folder(package_folder, deploy_folder)
         for component in self.components.values():
             component.deploy_base_folder(package_folder, deploy_folder)
 
+    def _invalidate(self):
+        if self._memo is not None:
+            self._memo = {}
+
+    def _memoized(self, name, func):
+        """ the result of func(), computed only once while the memoization is active, see
+        ``memoize_cpp_info()``
+        """
+        if self._memo is None:
+            return func()
+        try:
+            return self._memo[name]
+        except KeyError:
+            result = self._memo[name] = func()
+            return result
+
     def get_sorted_components(self):
         """
         Order the components taking into account if they depend on another component in the
@@ -589,6 +610,9 @@ class CppInfo:
 
         :return: ``OrderedDict`` {component_name: component}
         """
+        return self._memoized("sorted_components", self._sorted_components)
+
+    def _sorted_components(self):
         result = OrderedDict()
         opened = self.components.copy()
         while opened:
@@ -613,7 +637,11 @@ class CppInfo:
         """
         # This method had caching before, but after a ``--deployer``, the package changes
         # location, and this caching was invalid, still pointing to the Conan cache instead of
-        # the deployed
+        # the deployed. Now it is only memoized while generating the files of a consumer, see
+        # ``memoize_cpp_info()``
+        return self._memoized("aggregated_components", self._aggregated_components)
+
+    def _aggregated_components(self):
         if self.has_components:
             result = _Component()
             # Reversed to make more dependant first
@@ -668,7 +696,9 @@ class CppInfo:
     def required_components(self):
         """Returns a list of tuples with (require, component_name) required by the package
         If the require is internal (to another component), the require will be None"""
-        # FIXME: Cache the value
+        return self._memoized("required_components", self._required_components)
+
+    def _required_components(self):
         # First aggregate without repetition, respecting the order
         ret = [r for r in self._package.requires]
         for comp in self.components.values():
@@ -678,3 +708,20 @@ class CppInfo:
         # Then split the names
         ret = [r.split("::") if "::" in r else (None, r) for r in ret]
         return ret
+
+
+@contextmanager
+def memoize_cpp_info(cpp_infos):
+    """ The components sorting, aggregation and required components of these ``CppInfo`` are
+    computed only once inside this context, and the same result is returned to all the callers.
+    Used while generating the files of a consumer, as every generator needs them for all the
+    dependencies, that cannot change meanwhile
+    """
+    cpp_infos = [c for c in cpp_infos if c._memo is None]  # Nested contexts don't reset them
+    for cpp_info in cpp_infos:
+        cpp_info._memo = {}
+    try:
+        yield
+    finally:
+        for cpp_info in cpp_infos:
+            cpp_info._memo = None
@@ -23,17 +23,24 @@ BUILT_IN_CONFS = {
     "core.upload:retry": "Number of retries in case of failure when uploading to Conan server",
     "core.upload:retry_wait": "Seconds to wait between upload attempts to Conan server",
     "core.upload:parallel": "Number of concurrent threads to upload packages",
+    "core.upload:check_parallel": "Number of concurrent threads to check which revisions already exist in the server before uploading",
     "core.download:parallel": "Number of concurrent threads to download packages",
     "core.download:retry": "Number of retries in case of failure when downloading from Conan server",
     "core.download:retry_wait": "Seconds to wait between download attempts from Conan server",
     "core.download:download_cache": "Define path to a file download cache",
+    "core.download:download_cache_max_size": "(int) Maximum size in bytes of the packages artifacts and extracted sources in the download caches. When it is exceeded after storing a new entry, the least recently used ones are removed. Backup sources are never removed",
     "core.cache:storage_path": "Absolute path where the packages and database are stored",
+    "core.graph:parallel": "Number of concurrent threads to compute the graphs of 'graph build-order --matrix'",
+    "core.graph:cache": "(Experimental) Reuse the resolved references of a previous dependency graph computation with the same inputs, when not updating",
     # Sources backup
     "core.sources:download_cache": "Folder to store the sources backup",
+    "core.sources:extracted_cache": "(boolean) Keep the archives extracted by get() with a sha256 in the download cache, and copy the sources from there instead of downloading and extracting them again",
     "core.sources:download_urls": "List of URLs to download backup sources from",
     "core.sources:upload_url": "Remote URL to upload backup sources to",
     "core.sources:exclude_urls": "URLs which will not be backed up",
     # Package ID
+    "core.build:copy_sources": "How the sources are copied to the build folder: 'copy' (default), 'reflink' (copy-on-write clones if the filesystem supports them) or 'hardlink' (hard links for the files the user cannot write, reflink for the rest). Hard linked sources are the files in the Conan cache, they must never be modified, not even after changing their permissions",
+    "core.build:copy_sources_parallel": "Number of concurrent threads copying the sources to the build folder",
     "core.package_id:default_unknown_mode": "By default, 'semver_mode'",
     "core.package_id:default_non_embed_mode": "By default, 'minor_mode'",
     "core.package_id:default_embed_mode": "By default, 'full_mode'",
@@ -48,6 +55,7 @@ BUILT_IN_CONFS = {
     "core.net.http:cacert_path": "Path containing a custom Cacert file",
     "core.net.http:client_cert": "Path or tuple of files containing a client cert (and key)",
     "core.net.http:clean_system_proxy": "If defined, the proxies system env-vars will be discarded",
+    "core.net.http:pool_maxsize": "Maximum number of connections to keep open per host. By default, the maximum of 10, core.download:parallel and core.upload:parallel",
     # Gzip compression
     "core.gzip:compresslevel": "The Gzip compression level for Conan artifacts (default=9)",
     # Excluded from revision_mode = "scm" dirty and Git().is_dirty() checks
@@ -76,15 +84,21 @@ BUILT_IN_CONFS = {
     "tools.cmake.cmaketoolchain:presets_environment": "String to define wether to add or not the environment section to the CMake presets. Empty by default, will generate the environment section in CMakePresets. Can take values: 'disabled'.",
     "tools.cmake.cmaketoolchain:extra_variables": "Dictionary with variables to be injected in CMakeToolchain (potential override of CMakeToolchain defined variables)",
     "tools.cmake.cmaketoolchain:enabled_blocks": "Select the specific blocks to use in the conan_toolchain.cmake",
+    "tools.cmake.cmakedeps:parallel": "(Experimental) Number of concurrent threads to write the CMakeDeps generated files",
     "tools.cmake.cmake_layout:build_folder_vars": "Settings and Options that will produce a different build folder and different CMake presets names",
     "tools.cmake.cmake_layout:build_folder": "(Experimental) Allow configuring the base folder of the build for local builds",
     "tools.cmake.cmake_layout:test_folder": "(Experimental) Allow configuring the base folder of the build for test_package",
     "tools.cmake:cmake_program": "Path to CMake executable",
     "tools.cmake:install_strip": "Add --strip to cmake.install()",
     "tools.deployer:symlinks": "Set to False to disable deployers copying symlinks",
+    "tools.deployer:mode": "How the built-in deployers deploy the files: 'copy' (default), 'hardlink', 'reflink' (copy-on-write clones if the filesystem supports them) or 'symlink'. Linked files must not be modified, as they are the files in the Conan cache",
+    "tools.deployer:parallel": "Number of concurrent threads of the built-in deployers",
     "tools.files.download:retry": "Number of retries in case of failure when downloading",
     "tools.files.download:retry_wait": "Seconds to wait between download attempts",
     "tools.files.download:verify": "If set, overrides recipes on whether to perform SSL verification for their downloaded files. Only recommended to be set while testing",
+    "tools.files.copy:parallel": "Number of concurrent threads copying the files of the copy() tool",
+    "tools.files.copy:hardlinks": "(boolean) Create hard links instead of copying the files in the copy() tool, when the source and destination are in the same filesystem",
+    "tools.files.unzip:parallel": "Number of concurrent threads extracting the files of zip archives in the unzip() tool",
     "tools.files.unzip:filter": "Define tar extraction filter: 'fully_trusted', 'tar', 'data'",
     "tools.graph:vendor": "(Experimental) If 'build', enables the computation of dependencies of vendoring packages to build them",
     "tools.graph:skip_binaries": "Allow the graph to skip binaries not needed in the current configuration (True by default)",
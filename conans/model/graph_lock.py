@@ -22,6 +22,7 @@ class _LockRequires:
     """
     def __init__(self):
         self._requires = OrderedDict()  # {require: package_ids}
+        self._index = None  # {name: [refs]} in the same order as self._requires, built on demand
 
     def __contains__(self, item):
         return item in self._requires
@@ -32,6 +33,20 @@ class _LockRequires:
     def get(self, item):
         return self._requires.get(item)
 
+    def _name_index(self):
+        if self._index is None:
+            index = {}
+            for r in self._requires:
+                index.setdefault(r.name, []).append(r)
+            self._index = index
+        return self._index
+
+    def matches(self, ref):
+        """ the locked references with the same name, user and channel as ref, in locked order
+        """
+        return [r for r in self._name_index().get(ref.name, ())
+                if r.user == ref.user and r.channel == ref.channel]
+
     def serialize(self):
         result = []
         for k, v in self._requires.items():
@@ -52,6 +67,7 @@ class _LockRequires:
         return result
 
     def add(self, ref, package_ids=None):
+        existing = ref in self._requires
         if ref.revision is not None:
             old_package_ids = self._requires.pop(ref, None)  # Get existing one
             if old_package_ids is not None:
@@ -61,10 +77,14 @@ class _LockRequires:
                     package_ids = old_package_ids
             self._requires[ref] = package_ids
         else:  # Manual addition of something without revision
-            existing = {r: r for r in self._requires}.get(ref)
-            if existing and existing.revision is not None:
+            name_refs = self._name_index().get(ref.name, ())
+            if any(r == ref and r.revision is not None for r in name_refs):
                 raise ConanException(f"Cannot add {ref} to lockfile, already exists")
             self._requires[ref] = package_ids
+        if existing:  # The existing key might have been replaced or moved, recompute the index
+            self._index = None
+        elif self._index is not None:
+            self._index.setdefault(ref.name, []).append(ref)
 
     def remove(self, pattern):
         ref = RecipeReference.loads(pattern)
@@ -80,7 +100,11 @@ class _LockRequires:
                         remove.append(k)
         else:
             remove = [k for k in self._requires if k.matches(pattern, False)]
-        self._requires = OrderedDict((k, v) for k, v in self._requires.items() if k not in remove)
+        if remove:
+            removed = set(remove)
+            self._requires = OrderedDict((k, v) for k, v in self._requires.items()
+                                         if k not in removed)
+            self._index = None
         return remove
 
     def update(self, refs, name):
@@ -100,10 +124,12 @@ class _LockRequires:
 
     def sort(self):
         self._requires = OrderedDict(reversed(sorted(self._requires.items())))
+        self._index = None
 
-    def merge(self, other):
+    def merge(self, other, sort=True):
         """
         :type other: _LockRequires
+        :param sort: sort the result, can be disabled to merge many and sort only once at the end
         """
         # TODO: What happens when merging incomplete refs? Probably str(ref) should be used
         for k, v in other._requires.items():
@@ -112,7 +138,9 @@ class _LockRequires:
                     self._requires.setdefault(k, {}).update(v)
             else:
                 self._requires[k] = v
-        self.sort()
+        self._index = None
+        if sort:
+            self.sort()
 
 
 class Lockfile(object):
@@ -178,17 +206,27 @@ class Lockfile(object):
     def save(self, path):
         save(path, self.dumps())
 
-    def merge(self, other):
+    def merge(self, other, sort=True):
         """
         :type other: Lockfile
         """
-        self._requires.merge(other._requires)
-        self._build_requires.merge(other._build_requires)
-        self._python_requires.merge(other._python_requires)
-        self._conf_requires.merge(other._conf_requires)
+        self._requires.merge(other._requires, sort)
+        self._build_requires.merge(other._build_requires, sort)
+        self._python_requires.merge(other._python_requires, sort)
+        self._conf_requires.merge(other._conf_requires, sort)
         self._alias.update(other._alias)
         self._overrides.update(other._overrides)
 
+    def merge_all(self, lockfiles):
+        """ merge an iterable of lockfiles, sorting the locked references only once at the end
+        """
+        for lockfile in lockfiles:
+            self.merge(lockfile, sort=False)
+        self._requires.sort()
+        self._build_requires.sort()
+        self._python_requires.sort()
+        self._conf_requires.sort()
+
     def add(self, requires=None, build_requires=None, python_requires=None, config_requires=None):
         """ adding new things manually will trigger the sort() of the locked list, so lockfiles
         alwasys keep the ordered lists. This means that for some especial edge cases it might
@@ -277,16 +315,16 @@ class Lockfile(object):
 
     def resolve_locked(self, node, require, resolve_prereleases):
         if require.build or node.context == CONTEXT_BUILD:
-            locked_refs = self._build_requires.refs()
+            locked = self._build_requires
             kind = "build_requires"
         elif node.is_conf:
-            locked_refs = self._conf_requires.refs()
+            locked = self._conf_requires
             kind = "config_requires"
         else:
-            locked_refs = self._requires.refs()
+            locked = self._requires
             kind = "requires"
         try:
-            self._resolve(require, locked_refs, resolve_prereleases, kind)
+            self._resolve(require, locked, resolve_prereleases, kind)
         except ConanException:
             overrides = self._overrides.get(require.ref)
             if overrides is not None and len(overrides) > 1:
@@ -318,11 +356,10 @@ class Lockfile(object):
         if prevs:
             return prevs.get(node.package_id)
 
-    def _resolve(self, require, locked_refs, resolve_prereleases, kind):
+    def _resolve(self, require, locked, resolve_prereleases, kind):
         version_range = require.version_range
         ref = require.ref
-        matches = [r for r in locked_refs if r.name == ref.name and r.user == ref.user and
-                   r.channel == ref.channel]
+        matches = locked.matches(ref)
         if version_range:
             for m in matches:
                 if version_range.contains(m.version, resolve_prereleases):
@@ -354,5 +391,4 @@ class Lockfile(object):
             raise ConanException(f"Requirement alias '{alias}' not in lockfile")
 
     def resolve_locked_pyrequires(self, require, resolve_prereleases=None):
-        locked_refs = self._python_requires.refs()  # CHANGE
-        self._resolve(require, locked_refs, resolve_prereleases, "python_requires")
+        self._resolve(require, self._python_requires, resolve_prereleases, "python_requires")
@@ -4,6 +4,7 @@ from conans.util.dates import timestamp_to_str
 
 
 class PkgReference:
+    __slots__ = ("ref", "package_id", "revision", "timestamp")
 
     def __init__(self, ref=None, package_id=None, revision=None, timestamp=None):
         self.ref = ref
@@ -1,7 +1,8 @@
 
 import fnmatch
 import re
-from functools import total_ordering
+import sys
+from functools import total_ordering, lru_cache
 
 from conan.errors import ConanException
 from conans.model.version import Version
@@ -14,6 +15,11 @@ class RecipeReference:
     Should be enough to locate a recipe in the cache or in a server
     Validation will be external to this class, at specific points (export, api, etc)
     """
+    # There can be tens of thousands of references (cache listings, server results), so no
+    # __dict__. References are mutable, the cached str and hash are only valid while their
+    # name, version, user and channel are the very same objects
+    __slots__ = ("name", "version", "user", "channel", "revision", "timestamp", "_str_cache",
+                 "_hash_cache")
 
     def __init__(self, name=None, version=None, user=None, channel=None, revision=None,
                  timestamp=None):
@@ -25,6 +31,13 @@ class RecipeReference:
         self.channel = channel
         self.revision = revision
         self.timestamp = timestamp
+        self._str_cache = None
+        self._hash_cache = None
+
+    def _cached(self, cache):
+        if cache is not None and cache[0] is self.name and cache[1] is self.version \
+                and cache[2] is self.user and cache[3] is self.channel:
+            return cache[4]
 
     def copy(self):
         # Used for creating copy in lockfile-overrides mechanism
@@ -58,6 +71,9 @@ class RecipeReference:
 
     def __str__(self):
         """ shorter representation, excluding the revision and timestamp """
+        result = self._cached(self._str_cache)
+        if result is not None:
+            return result
         if self.name is None:
             return ""
         result = "/".join([self.name, str(self.version)])
@@ -66,6 +82,7 @@ class RecipeReference:
         if self.channel:
             assert self.user
             result += "/{}".format(self.channel)
+        self._str_cache = (self.name, self.version, self.user, self.channel, result)
         return result
 
     def __lt__(self, ref):
@@ -92,33 +109,16 @@ class RecipeReference:
 
     def __hash__(self):
         # This is necessary for building an ordered list of UNIQUE recipe_references for Lockfile
-        return hash((self.name, self.version, self.user, self.channel))
+        result = self._cached(self._hash_cache)
+        if result is None:
+            result = hash((self.name, self.version, self.user, self.channel))
+            self._hash_cache = (self.name, self.version, self.user, self.channel, result)
+        return result
 
     @staticmethod
     def loads(rref):
         try:
-            # timestamp
-            tokens = rref.rsplit("%", 1)
-            text = tokens[0]
-            timestamp = float(tokens[1]) if len(tokens) == 2 else None
-
-            # revision
-            tokens = text.split("#", 1)
-            ref = tokens[0]
-            revision = tokens[1] if len(tokens) == 2 else None
-
-            # name, version always here
-            tokens = ref.split("@", 1)
-            name, version = tokens[0].split("/", 1)
-            assert name and version
-            # user and channel
-            if len(tokens) == 2 and tokens[1]:
-                tokens = tokens[1].split("/", 1)
-                user = tokens[0] if tokens[0] else None
-                channel = tokens[1] if len(tokens) == 2 else None
-            else:
-                user = channel = None
-            return RecipeReference(name, version, user, channel, revision, timestamp)
+            return RecipeReference(*_parse_ref(rref))
         except Exception:
             from conan.errors import ConanException
             raise ConanException(
@@ -205,6 +205,41 @@ class RecipeReference:
                 return True
 
 
+@lru_cache(maxsize=4096)
+def _interned_version(version):
+    # Version is immutable, so references of the same version can share the parsed one
+    return Version(version)
+
+
+@lru_cache(maxsize=16384)
+def _parse_ref(rref):
+    """ the fields of a RecipeReference from its text, the same text, like the reference of all the
+    packages of a recipe revision in the cache database, is parsed only once
+    """
+    # timestamp
+    tokens = rref.rsplit("%", 1)
+    text = tokens[0]
+    timestamp = float(tokens[1]) if len(tokens) == 2 else None
+
+    # revision
+    tokens = text.split("#", 1)
+    ref = tokens[0]
+    revision = tokens[1] if len(tokens) == 2 else None
+
+    # name, version always here
+    tokens = ref.split("@", 1)
+    name, version = tokens[0].split("/", 1)
+    assert name and version
+    # user and channel
+    if len(tokens) == 2 and tokens[1]:
+        tokens = tokens[1].split("/", 1)
+        user = sys.intern(tokens[0]) if tokens[0] else None
+        channel = sys.intern(tokens[1]) if len(tokens) == 2 else None
+    else:
+        user = channel = None
+    return sys.intern(name), _interned_version(version), user, channel, revision, timestamp
+
+
 def ref_matches(ref, pattern, is_consumer):
     if not ref or not str(ref):
         assert is_consumer
@@ -3,7 +3,7 @@ from collections import OrderedDict
 from conan.errors import ConanException
 from conans.model.pkg_type import PackageType
 from conans.model.recipe_ref import RecipeReference
-from conans.model.version_range import VersionRange
+from conans.model.version_range import version_range_from_expression
 
 
 class Requirement:
@@ -172,7 +172,7 @@ class Requirement:
         """
         version = repr(self.ref.version)
         if version.startswith("[") and version.endswith("]"):
-            return VersionRange(version[1:-1])
+            return version_range_from_expression(version[1:-1])
 
     @property
     def alias(self):
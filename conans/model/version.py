@@ -76,6 +76,14 @@ class Version:
         while items and items[-1].value == 0:
             del items[-1]
         self._nonzero_items = tuple(items)
+        # Precomputed sort key for the most common case, only digits, without pre-release or build
+        # Comparing it is equivalent to comparing the _VersionItem, but much faster
+        self._key = None
+        if self._pre is None and self._build is None:
+            key = tuple(item.value for item in items)
+            if all(type(k) is int for k in key):
+                self._key = key
+        self._hash = None
 
     def bump(self, index):
         """
@@ -164,11 +172,15 @@ class Version:
         if not isinstance(other, Version):
             other = Version(other, self._qualifier)
 
+        if self._key is not None and other._key is not None:
+            return self._key == other._key
         return (self._nonzero_items, self._pre, self._build) ==\
                (other._nonzero_items, other._pre, other._build)
 
     def __hash__(self):
-        return hash((self._nonzero_items, self._pre, self._build))
+        if self._hash is None:
+            self._hash = hash((self._nonzero_items, self._pre, self._build))
+        return self._hash
 
     def __lt__(self, other):
         if other is None:
@@ -176,6 +188,9 @@ class Version:
         if not isinstance(other, Version):
             other = Version(other)
 
+        if self._key is not None and other._key is not None:
+            return self._key < other._key
+
         if self._pre:
             if other._pre:  # both are pre-releases
                 return (self._nonzero_items, self._pre, self._build) < \
@@ -1,4 +1,4 @@
-from functools import total_ordering
+from functools import total_ordering, lru_cache
 from typing import Optional
 
 from conan.errors import ConanException
@@ -64,18 +64,52 @@ class _Condition:
 
 class _ConditionSet:
 
-    def __init__(self, expression, prerelease):
+    def __init__(self, expression, prerelease, conditions=None):
+        self.prerelease = prerelease
+        if conditions is not None:  # Already computed, e.g. for intersections
+            self.conditions = conditions
+            return
         expressions = expression.split()
         if not expressions:
             # Guarantee at least one expression
             expressions = [""]
 
-        self.prerelease = prerelease
         self.conditions = []
         for e in expressions:
             e = e.strip()
             self.conditions.extend(self._parse_expression(e))
 
+    def __str__(self):
+        return " ".join(str(c) for c in self.conditions)
+
+    def intersection(self, other):
+        """ the normalized set of conditions satisfying both sets: the most restrictive lower and
+        upper limits, and the exact versions. None if no version can satisfy it
+        """
+        def _limit(operator):
+            limits = ([c for c in self.conditions if operator in c.operator]
+                      + [c for c in other.conditions if operator in c.operator])
+            if limits:
+                return sorted(limits, reverse=operator == ">")[0]
+
+        lower_limit = _limit(">")
+        upper_limit = _limit("<")
+        if lower_limit and upper_limit and not lower_limit <= upper_limit:
+            return None
+        conditions = [c for c in (lower_limit, upper_limit) if c]
+        prerelease = self.prerelease and other.prerelease
+        exact = [c for c in self.conditions + other.conditions if c.operator == "="]
+        if exact:
+            # An exact version is only satisfiable if it is the same for all and within the limits
+            exact_version = exact[0].version
+            limits = _ConditionSet(None, True, conditions + exact)
+            if not limits.valid(exact_version, True):
+                return None
+            conditions = [exact[0]]
+        if not conditions:
+            return None
+        return _ConditionSet(None, prerelease, conditions)
+
     @staticmethod
     def _parse_expression(expression):
         if expression in ("", "*"):
@@ -146,16 +180,27 @@ class _ConditionSet:
         return True
 
 
+def _warn(warnings):
+    if warnings:
+        from conan.api.output import ConanOutput
+        for warning in warnings:
+            ConanOutput().warning(warning)
+
+
 class VersionRange:
     def __init__(self, expression):
+        _warn(self._parse(expression))
+
+    def _parse(self, expression):
+        """ initializes the range from the expression, returning the warnings about it """
+        warnings = []
         self._expression = expression
         tokens = expression.split(",")
         prereleases = False
         for t in tokens[1:]:
             if "include_prerelease" in t:
                 if "include_prerelease=" in t:
-                    from conan.api.output import ConanOutput
-                    ConanOutput().warning(
+                    warnings.append(
                         f'include_prerelease version range option in "{expression}" does not take an attribute, '
                         'its presence unconditionally enables prereleases')
                 prereleases = True
@@ -163,14 +208,14 @@ class VersionRange:
             else:
                 t = t.strip()
                 if len(t) > 0 and t[0].isalpha():
-                    from conan.api.output import ConanOutput
-                    ConanOutput().warning(f'Unrecognized version range option "{t}" in "{expression}"')
+                    warnings.append(f'Unrecognized version range option "{t}" in "{expression}"')
                 else:
                     raise ConanException(f'"{t}" in version range "{expression}" is not a valid option')
         version_expr = tokens[0]
         self.condition_sets = []
         for alternative in version_expr.split("||"):
             self.condition_sets.append(_ConditionSet(alternative, prereleases))
+        return warnings
 
     def __str__(self):
         return self._expression
@@ -191,43 +236,62 @@ class VersionRange:
                 return True
         return False
 
-    def intersection(self, other):
-        conditions = []
-
-        def _calculate_limits(operator, lhs, rhs):
-            limits = ([c for c in lhs.conditions if operator in c.operator]
-                      + [c for c in rhs.conditions if operator in c.operator])
-            if limits:
-                return sorted(limits, reverse=operator == ">")[0]
+    @staticmethod
+    def _from_condition_sets(condition_sets, prerelease):
+        """ builds the range directly from already computed condition sets, without parsing.
+        The expression is the equivalent one, as it is used to define new requirements
+        """
+        result = VersionRange.__new__(VersionRange)
+        expression = " || ".join(str(cs) for cs in condition_sets)
+        result._expression = expression + (", include_prerelease" if prerelease else "")
+        for cs in condition_sets:
+            cs.prerelease = prerelease
+        result.condition_sets = condition_sets
+        return result
 
-        prerelease = True
+    def intersection(self, other):
+        """ the range of versions satisfying both ranges, None if they are incompatible """
+        condition_sets = []
+        # conservative approach: if any of the conditions forbid prereleases, forbid them in the result
+        prerelease = all(cs.prerelease for cs in self.condition_sets + other.condition_sets)
         for lhs_conditions in self.condition_sets:
             for rhs_conditions in other.condition_sets:
-                internal_conditions = []
-                lower_limit = _calculate_limits(">", lhs_conditions, rhs_conditions)
-                upper_limit = _calculate_limits("<", lhs_conditions, rhs_conditions)
-                if lower_limit:
-                    internal_conditions.append(lower_limit)
-                if upper_limit:
-                    internal_conditions.append(upper_limit)
-                if internal_conditions and (not lower_limit or not upper_limit or lower_limit <= upper_limit):
-                    conditions.append(internal_conditions)
-                # conservative approach: if any of the conditions forbid prereleases, forbid them in the result
-                if not lhs_conditions.prerelease or not rhs_conditions.prerelease:
-                    prerelease = False
+                result = lhs_conditions.intersection(rhs_conditions)
+                if result is not None:
+                    condition_sets.append(result)
 
-        if not conditions:
+        if not condition_sets:
             return None
-        expression = ' || '.join(' '.join(str(c) for c in cs) for cs in conditions) + (', include_prerelease' if prerelease else '')
-        result = VersionRange(expression)
-        # TODO: Direct definition of conditions not reparsing
-        # result.condition_sets = self.condition_sets + other.condition_sets
-        return result
+        return VersionRange._from_condition_sets(condition_sets, prerelease)
+
+    def key(self):
+        """ a hashable key, equal for ranges with the same conditions in any order, like
+        "[>=1 <2]" and "[<2 >=1]", that can be resolved just once
+        """
+        return frozenset((frozenset(str(c) for c in cs.conditions), cs.prerelease)
+                         for cs in self.condition_sets)
 
     def version(self):
         return Version(f"[{self._expression}]")
 
 
+@lru_cache(maxsize=2048)
+def _parsed_version_range(expression):
+    version_range = VersionRange.__new__(VersionRange)
+    warnings = version_range._parse(expression)
+    return version_range, tuple(warnings)
+
+
+def version_range_from_expression(expression):
+    """ The same expressions are repeated in many requirements and evaluated many times while
+    expanding the graph, they are parsed once. The returned VersionRange is shared, it must not
+    be modified. The warnings of the expression are reported every time, as if parsed again
+    """
+    version_range, warnings = _parsed_version_range(expression)
+    _warn(warnings)
+    return version_range
+
+
 def validate_conan_version(required_range):
     clientver = Version(client_version)
     version_range = VersionRange(required_range)
@@ -383,9 +383,86 @@ def human_size(size_bytes):
 
 
 # FIXME: completely remove disutils once we don't support <3.8 any more
-def copytree_compat(source_folder, dest_folder):
+def copytree_compat(source_folder, dest_folder, symlinks=False):
     if sys.version_info >= (3, 8):
-        shutil.copytree(source_folder, dest_folder, dirs_exist_ok=True)
+        shutil.copytree(source_folder, dest_folder, symlinks=symlinks, dirs_exist_ok=True)
     else:
         from distutils.dir_util import copy_tree
-        copy_tree(source_folder, dest_folder)
+        copy_tree(source_folder, dest_folder, preserve_symlinks=int(symlinks))
+
+
+_FICLONE = 0x40049409  # Linux ioctl cloning a file sharing its data blocks, copy-on-write
+
+
+def reflink_file(src, dst):
+    """ copy-on-write clone of the src file in dst, without copying its data, for the Linux
+    filesystems that support it, like btrfs or XFS. Raises OSError if it is not supported
+    """
+    if platform.system() != "Linux":
+        raise OSError("reflink clones are only supported in Linux")
+    import fcntl
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+def clone_tree(src, dst, mode="copy", parallel=1):
+    """ copies the src folder into the dst one, like shutil.copytree(symlinks=True), the files
+    according to the mode:
+    - "copy": regular copies
+    - "reflink": copy-on-write clones, or copies if the filesystem doesn't support them
+    - "hardlink": hard links for the files the current user cannot write, and copy-on-write
+      clones or copies for the rest (all of them when running as root, that can write anything).
+      The linked files are the src ones, so they must never be modified in dst, not even after
+      changing their permissions
+    With parallel > 1 the files are cloned concurrently
+    """
+    from multiprocessing.pool import ThreadPool
+    files = []
+    folders = []
+    for root, subfolders, filenames in os.walk(src):
+        dst_root = os.path.normpath(os.path.join(dst, os.path.relpath(root, src)))
+        os.makedirs(dst_root, exist_ok=True)
+        folders.append((root, dst_root))
+        # symlinks to folders are not walked, but copied as symlinks
+        links = [f for f in subfolders if os.path.islink(os.path.join(root, f))]
+        subfolders[:] = [f for f in subfolders if f not in links]
+        for f in filenames + links:
+            src_file = os.path.join(root, f)
+            dst_file = os.path.join(dst_root, f)
+            if os.path.islink(src_file):
+                os.symlink(os.readlink(src_file), dst_file)
+            else:
+                files.append((src_file, dst_file))
+
+    reflink = [mode in ("reflink", "hardlink")]
+
+    def _clone(src_dst):
+        src_file, dst_file = src_dst
+        if mode == "hardlink" and not os.access(src_file, os.W_OK):
+            try:
+                os.link(src_file, dst_file)
+                return
+            except OSError:
+                pass
+        if reflink[0]:
+            try:
+                reflink_file(src_file, dst_file)
+                return
+            except OSError:  # Not supported by this filesystem, don't try it again
+                reflink[0] = False
+        shutil.copy2(src_file, dst_file)
+
+    if parallel > 1 and len(files) > 1:
+        thread_pool = ThreadPool(min(parallel, len(files)))
+        try:
+            thread_pool.map(_clone, files)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+    else:
+        for f in files:
+            _clone(f)
+    # As shutil.copytree(), the folders get their permissions and times once they are complete
+    for src_folder, dst_folder in reversed(folders):
+        shutil.copystat(src_folder, dst_folder)
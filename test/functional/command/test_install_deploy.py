@@ -318,6 +318,61 @@ def test_deploy_overwrite():
     assert "bye" in header
 
 
+@pytest.mark.parametrize("mode", ["copy", "hardlink", "symlink"])
+def test_deploy_modes_incremental(mode):
+    """ the full deployer can link the files instead of copying them, deploying the dependencies
+    concurrently, and re-deploying only writes what changed
+    """
+    c = TestClient()
+    c.save_home({"global.conf": f"tools.deployer:mode={mode}\ntools.deployer:parallel=2"})
+    for name in ("pkga", "pkgb"):
+        c.save({"conanfile.py": GenConanfile(name, "1.0").with_package_file("include/hi.h", name)
+                                                         .with_package_file("old.h", "old")})
+        c.run("create .")
+    c.run("install --requires=pkga/1.0 --requires=pkgb/1.0 --deployer=full_deploy -of=output")
+    deployed = os.path.join(c.current_folder, "output", "full_deploy", "host", "pkga", "1.0")
+    assert c.load(os.path.join(deployed, "include", "hi.h")) == "pkga"
+    assert os.path.islink(os.path.join(deployed, "include", "hi.h")) == (mode == "symlink")
+    c.run("cache path pkga/1.0:da39a3ee5e6b4b0d3255bfef95601890afd80709")
+    pkga_folder = c.stdout.strip()
+    assert os.path.samefile(os.path.join(pkga_folder, "include", "hi.h"),
+                            os.path.join(deployed, "include", "hi.h")) == (mode != "copy")
+
+    # A new revision of the package, its changes are deployed, the rest is not written again
+    hi_stat = os.stat(os.path.join(deployed, "include", "hi.h"), follow_symlinks=False)
+    c.save({"conanfile.py": GenConanfile("pkga", "1.0").with_package_file("include/hi.h", "pkga")
+                                                       .with_package_file("new.h", "new")})
+    c.run("create .")
+    c.run("install --requires=pkga/1.0 --requires=pkgb/1.0 --deployer=full_deploy -of=output")
+    assert c.load(os.path.join(deployed, "new.h")) == "new"
+    assert not os.path.exists(os.path.join(deployed, "old.h"))
+    assert c.load(os.path.join(deployed, "include", "hi.h")) == "pkga"
+    if mode == "copy":
+        new_stat = os.stat(os.path.join(deployed, "include", "hi.h"), follow_symlinks=False)
+        assert new_stat.st_ino == hi_stat.st_ino
+
+
+def test_deploy_copy_after_hardlink():
+    """ re-deploying in copy mode what was deployed as hardlinks replaces them with real copies,
+    so modifying the deployed files doesn't modify the package in the cache
+    """
+    c = TestClient()
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_package_file("include/hi.h", "hi")})
+    c.run("create .")
+    c.save_home({"global.conf": "tools.deployer:mode=hardlink"})
+    c.run("install --requires=pkg/1.0 --deployer=full_deploy -of=output")
+    deployed = os.path.join(c.current_folder, "output", "full_deploy", "host", "pkg", "1.0",
+                            "include", "hi.h")
+    c.run("cache path pkg/1.0:da39a3ee5e6b4b0d3255bfef95601890afd80709")
+    package_file = os.path.join(c.stdout.strip(), "include", "hi.h")
+    assert os.path.samefile(package_file, deployed)
+
+    c.save_home({"global.conf": "tools.deployer:mode=copy"})
+    c.run("install --requires=pkg/1.0 --deployer=full_deploy -of=output")
+    assert not os.path.samefile(package_file, deployed)
+    assert c.load(deployed) == "hi"
+
+
 def test_deploy_editable():
     """ when deploying something that is editable, with the full_deploy built-in, it will copy the
     editable files as-is, but it doesn't fail at this moment
@@ -1,11 +1,16 @@
+import json
 import os
+import shutil
+import tarfile
 import textwrap
+from unittest.mock import patch
 
 from conan.test.assets.genconanfile import GenConanfile
 from conan.test.utils.file_server import TestFileServer
 from conan.test.utils.test_files import temp_folder
 from conan.test.utils.tools import TestClient
-from conans.util.files import save, set_dirty
+from conans.client.downloaders.download_cache import DownloadCache
+from conans.util.files import save, set_dirty, load, sha256sum
 
 
 class TestDownloadCache:
@@ -156,3 +161,154 @@ class TestDownloadCache:
         c.save_home({"global.conf": f"core.download:download_cache=mytmp_folder"})
         c.run("install --requires=mypkg/0.1@user/testing", assert_error=True)
         assert 'core.download:download_cache must be an absolute path' in c.out
+
+    def test_extracted_sources_cache(self):
+        """ the sources extracted by get() are reused by other recipe revisions, without
+        downloading and extracting them again
+        """
+        client = TestClient()
+        file_server = TestFileServer()
+        client.servers["file_server"] = file_server
+        client.save({"pkg-1.0/src/main.cpp": "int main(){}",
+                     "pkg-1.0/include/pkg.h": "// header"})
+        tgz = os.path.join(temp_folder(), "pkg.tgz")
+        with tarfile.open(tgz, "w:gz") as tar:
+            tar.add(os.path.join(client.current_folder, "pkg-1.0"), arcname="pkg-1.0")
+        sha256 = sha256sum(tgz)
+        shutil.copy(tgz, file_server.store)
+
+        tmp_folder = temp_folder()
+        client.save_home({"global.conf": f"core.sources:download_cache={tmp_folder}\n"
+                                         "core.sources:extracted_cache=True"})
+        conanfile = textwrap.dedent("""
+            from conan import ConanFile
+            from conan.tools.files import get
+            class Pkg(ConanFile):
+                name = "pkg"
+                version = "1.0"
+                def source(self):
+                    get(self, "{}/pkg.tgz", sha256="{}", strip_root=True)
+                    # Modifying the sources doesn't change the cached ones
+                    with open("include/pkg.h", "a") as f:
+                        f.write("{{}}")
+            """)
+        client.save({"conanfile.py": conanfile.format(file_server.fake_url, sha256)}, clean_first=True)
+        client.run("create .")
+        assert "retrieved from the extracted sources cache" not in client.out
+
+        # Other recipe revision, the server no longer has the file
+        os.remove(os.path.join(file_server.store, "pkg.tgz"))
+        client.save({"conanfile.py": conanfile.format(file_server.fake_url, sha256) + "\n#new"})
+        client.run("create .")
+        assert "pkg.tgz retrieved from the extracted sources cache" in client.out
+        build_folder = client.created_layout().build()
+        assert load(os.path.join(build_folder, "src", "main.cpp")) == "int main(){}"
+        assert load(os.path.join(build_folder, "include", "pkg.h")) == "// header{}"
+
+        # Other recipes reusing the extracted sources are recorded in the backup sources too
+        client.save({"conanfile.py": conanfile.format(file_server.fake_url, sha256)
+                     .replace('name = "pkg"', 'name = "other"')})
+        client.run("create .")
+        assert "pkg.tgz retrieved from the extracted sources cache" in client.out
+        summary = json.loads(load(os.path.join(tmp_folder, "s", sha256 + ".json")))
+        assert sorted(summary["references"]) == ["other/1.0", "pkg/1.0"]
+
+        # If the backup sources were removed, they are downloaded again
+        shutil.copy(tgz, file_server.store)
+        os.remove(os.path.join(tmp_folder, "s", sha256))
+        client.save({"conanfile.py": conanfile.format(file_server.fake_url, sha256) + "\n#new2"})
+        client.run("create .")
+        assert "pkg.tgz retrieved from the extracted sources cache" in client.out
+        assert os.path.isfile(os.path.join(tmp_folder, "s", sha256))
+
+    def test_download_cache_index(self):
+        """ the download cache keeps an index with the size and accesses of the entries, to
+        report the hits and misses and prune the least recently used ones
+        """
+        client = TestClient(default_server_user=True)
+        client.save({"conanfile.py": GenConanfile().with_package_file("file.txt", "content")})
+        client.run("create . --name=pkga --version=0.1")
+        client.run("create . --name=pkgb --version=0.1")
+        client.run("upload * -c -r default")
+        client.run("remove * -c")
+
+        tmp_folder = temp_folder()
+        client.save_home({"global.conf": f"core.download:download_cache={tmp_folder}"})
+        client.run("install --requires=pkga/0.1 --requires=pkgb/0.1")
+        client.run("remove * -c")
+        client.run("install --requires=pkga/0.1")
+        client.run("cache download-stats --format=json")
+        stats = json.loads(client.stdout)[tmp_folder]["packages"]
+        # conanmanifest.txt, conaninfo.txt, conanfile.py, conan_package.tgz... of both packages
+        assert stats["entries"] == stats["misses"] > 4
+        assert stats["hits"] == stats["misses"] // 2
+        assert stats["size"] > 0
+        client.run("cache download-stats")
+        assert "packages: {} entries".format(stats["entries"]) in client.out
+        assert "hit rate 33%" in client.out
+
+        # The entries read again in the last install are the most recently used ones
+        entries = DownloadCache(tmp_folder).index.entries()
+        assert [e.hits for e in entries] == [0] * (len(entries) - stats["hits"]) + \
+               [1] * stats["hits"]
+        client.run(f"cache download-prune --max-size={stats['size'] - 1} --format=json")
+        pruned = json.loads(client.stdout)[tmp_folder]
+        assert pruned["removed"] == [entries[0].path]
+        assert pruned["freed"] == entries[0].size
+
+        client.run("cache download-prune --max-size=0")
+        assert "freed" in client.out
+        assert os.listdir(os.path.join(tmp_folder, "c")) == []
+        client.run("cache download-prune --max-size=1Z", assert_error=True)
+        assert "Invalid size '1Z'" in client.out
+
+    def test_download_cache_max_size(self):
+        """ the least recently used packages artifacts are pruned, but not the backup sources,
+        that might be pending to upload
+        """
+        client = TestClient(default_server_user=True)
+        file_server = TestFileServer()
+        client.servers["file_server"] = file_server
+        save(os.path.join(file_server.store, "myfile.txt"), "some content")
+        sha256 = sha256sum(os.path.join(file_server.store, "myfile.txt"))
+        conanfile = textwrap.dedent(f"""
+            from conan import ConanFile
+            from conan.tools.files import download
+            class Pkg(ConanFile):
+                def source(self):
+                    download(self, "{file_server.fake_url}/myfile.txt", "myfile.txt",
+                             sha256="{sha256}")
+            """)
+        client.save({"conanfile.py": conanfile})
+        client.run("create . --name=pkg --version=0.1")
+        client.run("upload * -c -r default")
+        client.run("remove * -c")
+
+        tmp_folder = temp_folder()
+        client.save_home({"global.conf": f"core.download:download_cache={tmp_folder}\n"
+                                         f"core.sources:download_cache={tmp_folder}\n"
+                                         "core.download:download_cache_max_size=1"})
+        client.run("install --requires=pkg/0.1 --build=*")
+        assert os.listdir(os.path.join(tmp_folder, "c")) == []
+        assert sorted(os.listdir(os.path.join(tmp_folder, "s"))) == [sha256, sha256 + ".json"]
+        client.run("cache download-stats --format=json")
+        stats = json.loads(client.stdout)[tmp_folder]
+        assert stats["packages"]["entries"] == 0 and stats["packages"]["misses"] > 0
+        assert stats["sources"]["entries"] == 1 and stats["sources"]["misses"] == 1
+        client.run("cache download-prune --max-size=0")
+        assert sorted(os.listdir(os.path.join(tmp_folder, "s"))) == [sha256, sha256 + ".json"]
+
+    def test_download_cache_prune_busy(self):
+        """ in Windows, the entries being read by other processes cannot be removed, they are
+        kept in the cache and in the index
+        """
+        tmp_folder = temp_folder()
+        download_cache = DownloadCache(tmp_folder)
+        cached_path, _ = download_cache.cached_path("http://myserver/conan_package.tgz")
+        save(cached_path, "content")
+        download_cache.record_download(cached_path)
+        with patch("conans.client.downloaders.download_cache.os.remove",
+                   side_effect=PermissionError("used by another process")):
+            assert download_cache.prune(0) == ([], 0)
+        assert os.path.isfile(cached_path)
+        assert len(download_cache.index.entries()) == 1
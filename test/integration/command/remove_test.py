@@ -389,3 +389,16 @@ def _get_revisions_packages(client, pref, with_remote):
             return set([r.repr_notime() for r in api.list.package_revisions(pref, remote=remote)])
         except NotFoundException:
             return set()
+
+
+def test_remove_recipe_bytecode():
+    """ the compiled code of the recipes is stored in their layout and removed with them """
+    c = TestClient(light=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    c.run("export .")
+    ref_layout = c.exported_layout()
+    c.run("graph info --requires=pkg/0.1")
+    bytecode_folder = os.path.join(ref_layout.base_folder, "pyc")
+    assert len(os.listdir(bytecode_folder)) == 1
+    c.run("remove pkg/0.1 -c")
+    assert not os.path.exists(bytecode_folder)
@@ -1,7 +1,10 @@
+import threading
+
+import pytest
 from requests import ConnectionError
 
 from conan.test.assets.genconanfile import GenConanfile
-from conan.test.utils.tools import TestClient, TestRequester
+from conan.test.utils.tools import TestClient, TestRequester, TestServer
 
 
 def test_upload_parallel_error():
@@ -57,3 +60,75 @@ def test_upload_parallel_fail_on_interaction():
     client.run('remote logout default')
     client.run('upload lib* -c -r default', assert_error=True)
     assert "ERROR: Conan interactive mode disabled. [Remote: default]" in client.out
+
+
+@pytest.mark.parametrize("parallel", [1, 3])
+def test_upload_check_upstream_concurrent(parallel):
+    """The existence checks of the packages already in the server can be concurrent"""
+
+    class CountingRequester(TestRequester):
+        urls = []
+
+        def get(self, url, *args, **kwargs):
+            self.urls.append(url)
+            return super().get(url, *args, **kwargs)
+
+    client = TestClient(requester_class=CountingRequester, default_server_user=True)
+    client.save_home({"global.conf": f"core.upload:check_parallel={parallel}"})
+    client.save({"conanfile.py": GenConanfile().with_settings("os")})
+    for name in ("lib0", "lib1"):
+        for os_ in ("Windows", "Linux", "Macos"):
+            client.run(f"create . --name={name} --version=1.0 -s os={os_}")
+    CountingRequester.urls.clear()
+    client.run("upload * -c -r default")
+    assert client.out.count("Uploading package") == 6
+    # The packages of recipes not in the server are not checked
+    assert not [u for u in CountingRequester.urls if "/packages/" in u and "revisions" in u]
+
+    client.run("create . --name=lib1 --version=1.0 -s os=FreeBSD")
+    CountingRequester.urls.clear()
+    client.run("upload * -c -r default")
+    assert client.out.count("already in server, skipping upload") == 2 + 6
+    assert client.out.count("Uploading package") == 1
+    assert "Uploading package 'lib1/1.0" in client.out
+    package_checks = [u for u in CountingRequester.urls if "/packages/" in u and "revisions" in u]
+    assert len(package_checks) == 7
+
+    client.run("upload * -c -r default --force")
+    assert client.out.count("already in server, forcing upload") == 2 + 7
+
+
+def test_upload_check_upstream_concurrent_auth():
+    """ The concurrent checks against a server requiring authentication only ask for the
+    credentials once
+    """
+    class SyncRequester(TestRequester):
+        # Make sure all the checks are rejected before the first one obtains credentials
+        barrier = None
+
+        def get(self, url, *args, **kwargs):
+            ret = super().get(url, *args, **kwargs)
+            if self.barrier is not None and ret.status_code == 401:
+                try:
+                    self.barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+            return ret
+
+    server = TestServer(read_permissions=[("*/*@*/*", "admin")],
+                        write_permissions=[("*/*@*/*", "admin")],
+                        users={"admin": "password"})
+    client = TestClient(servers={"default": server}, requester_class=SyncRequester,
+                        inputs=["admin", "password"])
+    client.save({"conanfile.py": GenConanfile()})
+    for index in range(4):
+        client.run(f"create . --name=lib{index} --version=1.0")
+    client.run("remote login default admin -p password")
+    client.run("upload * -c -r default")
+    client.run("remote logout default")
+
+    client.save_home({"global.conf": "core.upload:check_parallel=4"})
+    SyncRequester.barrier = threading.Barrier(4, timeout=5)
+    client.run("upload * -c -r default")
+    assert client.out.count("needs authentication, obtaining credentials") == 1
+    assert client.out.count("already in server, skipping upload") == 4 + 4
@@ -805,3 +805,50 @@ def test_build_order_space_in_options():
     order = json.loads(tc.load("order.json"))
     assert order["order"][0][0]["build_args"] == '''--requires=dep/1.0 --build=dep/1.0 -o="dep/*:extras=cxx="yes" gnuext='no'" -o="dep/*:flags=define=FOO define=BAR define=BAZ"'''
 
+
+@pytest.mark.parametrize("parallel", [1, 2])
+def test_build_order_matrix(parallel):
+    """ computing several configurations at once is the same as merging their build-orders
+    """
+    c = TestClient()
+    c.save_home({"global.conf": f"core.graph:parallel={parallel}"})
+    c.save({"dep/conanfile.py": GenConanfile().with_settings("os"),
+            "pkg/conanfile.py": GenConanfile().with_settings("os").with_requires("dep/[>=0.1]"),
+            "consumer/conanfile.txt": "[requires]\npkg/0.1",
+            "mypr": ""})
+    c.run("export dep --name=dep --version=0.1")
+    c.run("export pkg --name=pkg --version=0.1")
+    args = "-pr=mypr -s:b os=Linux -o:h *:shared=True -c:h user.my:conf=1"
+    c.run(f"graph build-order consumer --format=json --build=missing -s os=Windows {args} "
+          "--order-by=recipe", redirect_stdout="bo_win.json")
+    c.run(f"graph build-order consumer --format=json --build=missing -s os=Linux {args} "
+          "--order-by=recipe", redirect_stdout="bo_nix.json")
+    c.run("graph build-order-merge --file=bo_win.json --file=bo_nix.json --format=json",
+          redirect_stdout="merged.json")
+
+    c.run(f"graph build-order consumer --format=json --build=missing {args} --order-by=recipe "
+          "--matrix='bo_win -s os=Windows' --matrix='bo_nix -s os=Linux'",
+          redirect_stdout="matrix.json")
+    assert "Dependency graph of configuration 'bo_win'" in c.out
+    assert "Dependency graph of configuration 'bo_nix'" in c.out
+    assert json.loads(c.load("matrix.json")) == json.loads(c.load("merged.json"))
+
+    c.run("graph build-order --requires=pkg/0.1 --format=json --build=missing --order-by=recipe "
+          "--matrix='-s os=Windows' --matrix='-s os=Linux' --reduce", redirect_stdout="req.json")
+    bo_json = json.loads(c.load("req.json"))
+    assert bo_json["profiles"] == {"config0": {"args": '-s:h="os=Windows"'},
+                                   "config1": {"args": '-s:h="os=Linux"'}}
+    packages = [p for level in bo_json["order"] for r in level for level_pkgs in r["packages"]
+                for p in level_pkgs]
+    assert sorted(f for p in packages for f in p["filenames"]) == ["config0", "config0",
+                                                                   "config1", "config1"]
+
+
+def test_build_order_matrix_errors():
+    c = TestClient(light=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    c.run("graph build-order . --order-by=recipe --matrix='a -s os=Linux' --matrix='a'",
+          assert_error=True)
+    assert "Duplicated --matrix configuration name 'a'" in c.out
+    c.run("graph build-order . --order-by=recipe --matrix='--build=missing'", assert_error=True)
+    assert "Invalid --matrix '--build=missing'" in c.out
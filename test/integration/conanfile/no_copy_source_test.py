@@ -1,7 +1,10 @@
 import os
 import textwrap
 
+import pytest
+
 from conan.test.utils.tools import TestClient
+from conans.util.files import load
 
 
 def test_no_copy_source():
@@ -43,3 +46,32 @@ def test_no_copy_source():
     assert "file.h" in os.listdir(package_folder)
     assert "header.h" in os.listdir(package_folder)
     assert "myartifact.lib" in os.listdir(package_folder)
+
+
+@pytest.mark.parametrize("mode", ["reflink", "hardlink"])
+def test_copy_source_modes(mode):
+    conanfile = textwrap.dedent('''
+        from conan import ConanFile
+        from conan.tools.files import load, save
+        import os
+
+        class Pkg(ConanFile):
+            name = "pkg"
+            version = "0.1"
+            exports_sources = "*"
+
+            def build(self):
+                self.output.info("Source files: %s" % load(self, "file.h"))
+                save(self, "file.h", "modified")
+        ''')
+    client = TestClient(light=True)
+    client.save_home({"global.conf": f"core.build:copy_sources={mode}\n"
+                                     "core.build:copy_sources_parallel=2"})
+    client.save({"conanfile.py": conanfile,
+                 "file.h": "myfile.h contents"})
+    client.run("create . -vvv")
+    assert "Source files: myfile.h contents" in client.out
+    assert f"Sources copied to build folder ({mode}) in" in client.out
+    # The build didn't modify the sources
+    source_folder = client.exported_layout().source()
+    assert load(os.path.join(source_folder, "file.h")) == "myfile.h contents"
@@ -57,3 +57,65 @@ class ConanRequesterHeadersTests(unittest.TestCase):
             requester.get(url="aaa", headers={"User-Agent": "MyUserAgent"})
             headers = requester._http_requester.get.call_args[1]["headers"]
             self.assertEqual("MyUserAgent", headers["User-Agent"])
+
+
+class TestConanRequesterSession:
+
+    def test_session_shared_by_config(self):
+        config = ConfDefinition()
+        requester1 = ConanRequester(config)
+        requester2 = ConanRequester(config)
+        assert requester1._http_requester is requester2._http_requester
+        other = ConanRequester(ConfDefinition())
+        assert other._http_requester is not requester1._http_requester
+
+    def test_pool_maxsize(self):
+        requester = ConanRequester(ConfDefinition())
+        assert requester._http_requester.get_adapter("https://")._pool_maxsize == 10
+
+        config = ConfDefinition()
+        config.update("core.download:parallel", 16)
+        requester = ConanRequester(config)
+        assert requester._http_requester.get_adapter("https://")._pool_maxsize == 16
+
+        config = ConfDefinition()
+        config.update("core.download:parallel", 16)
+        config.update("core.net.http:pool_maxsize", 4)
+        requester = ConanRequester(config)
+        assert requester._http_requester.get_adapter("http://")._pool_maxsize == 4
+
+    def test_connection_stats(self):
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        from threading import Thread
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True  # Do not wait for the keep-alive connections on shutdown
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            config = ConfDefinition()
+            requester = ConanRequester(config)
+            url = "http://127.0.0.1:{}/file".format(server.server_address[1])
+            for _ in range(3):
+                assert requester.get(url).content == b"ok"
+            stats = requester.connection_stats()
+            assert stats == {"opened": 1, "requests": 3, "reused": 2}
+            # The session is shared, the counters are cumulative, but can be taken since a point
+            assert ConanRequester(config).get(url).content == b"ok"
+            assert requester.connection_stats(since=stats) == {"opened": 0, "requests": 1,
+                                                               "reused": 1}
+        finally:
+            server.shutdown()
+            server.server_close()
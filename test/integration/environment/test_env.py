@@ -6,6 +6,7 @@ import textwrap
 import pytest
 
 from conan.tools.env.environment import environment_wrap_command
+from conan.test.utils.test_files import temp_folder
 from conan.test.utils.tools import TestClient, GenConanfile
 
 
@@ -852,3 +853,36 @@ def test_deactivate_relocatable_substitute():
     conanbuild = c.load("conanbuildenv.sh")
     result = os.path.join("$script_folder", "deactivate_conanbuildenv.sh")
     assert f'"{result}"' in conanbuild
+
+
+def test_runenv_dependency_cpp_info_modified_in_generate():
+    """ the runtime environment deduced from the dependencies cpp_info is not kept after
+    generating, the consumer generate() can modify it, even if the dependency was already used
+    to generate the files of another package in the same graph
+    """
+    c = TestClient()
+    mybin = temp_folder()
+    mid = GenConanfile("mid", "0.1").with_settings("os").with_requirement("dep/0.1", run=True)\
+                                    .with_generator("VirtualRunEnv")
+    app = textwrap.dedent(f"""
+        from conan import ConanFile
+        from conan.tools.env import VirtualRunEnv
+
+        class App(ConanFile):
+            settings = "os"
+            requires = "mid/0.1", "dep/0.1"
+
+            def generate(self):
+                self.dependencies["dep"].cpp_info.bindirs.append({mybin!r})
+                VirtualRunEnv(self).generate()
+        """)
+    c.save({"dep/conanfile.py": GenConanfile("dep", "0.1").with_package_type("shared-library")
+                                                        .with_package_file("bin/myexe", "exe"),
+            "mid/conanfile.py": mid,
+            "app/conanfile.py": app})
+    c.run("create dep")
+    c.run("export mid")
+    c.run("install app --build=missing -s os=Linux")
+    assert "mid/0.1: Created package" in c.out
+    assert mybin in c.load("app/conanrunenv.sh")
+
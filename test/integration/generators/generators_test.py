@@ -1,3 +1,7 @@
+import os
+import textwrap
+
+from conan.test.assets.genconanfile import GenConanfile
 from conan.test.utils.tools import TestClient
 
 
@@ -8,3 +12,32 @@ class TestGenerators:
         client.save({"conanfile.txt": "[generators]\nunknown"})
         client.run("install . --build=*", assert_error=True)
         assert "ERROR: Invalid generator 'unknown'. Available types:" in client.out
+
+    def test_generate_modifies_dependencies(self):
+        """ generators instantiated in generate() see the changes to the cpp_info of the
+        dependencies done in between them
+        """
+        client = TestClient()
+        conanfile = textwrap.dedent("""
+            from conan import ConanFile
+            from conan.tools.cmake import CMakeDeps
+            from conan.tools.gnu import AutotoolsDeps
+            class Pkg(ConanFile):
+                settings = "os", "arch", "build_type"
+                requires = "dep/0.1"
+                generators = "PkgConfigDeps"
+                def generate(self):
+                    AutotoolsDeps(self).generate()
+                    self.dependencies["dep"].cpp_info.libs = ["changed"]
+                    CMakeDeps(self).generate()
+            """)
+        client.save({"dep/conanfile.py": GenConanfile("dep", "0.1").with_package_info(
+                     cpp_info={"libs": ["orig"]}, env_info={}),
+                     "app/conanfile.py": conanfile})
+        client.run("create dep")
+        client.run("install app")
+        assert "-lorig" in client.load("app/dep.pc")
+        assert "-lorig" in client.load("app/conanautotoolsdeps.sh")
+        cmake = [f for f in os.listdir(os.path.join(client.current_folder, "app"))
+                 if f.endswith("-data.cmake")][0]
+        assert "set(dep_LIBS_RELEASE changed)" in client.load(os.path.join("app", cmake))
@@ -114,3 +114,27 @@ def test_custom_global_generator_multiple():
     assert "conanfile.txt: MyGenerator0!!" in c.out
     assert "conanfile.txt: MyGenerator1!!" in c.out
     assert "conanfile.txt: MyGenerator2!!" in c.out
+
+
+def test_custom_global_generator_loaded_once():
+    c = TestClient()
+    generator = textwrap.dedent("""
+        print("Loading MyCustomGenerator module")
+        class MyCustomGenerator:
+            def __init__(self, conanfile):
+                self._conanfile = conanfile
+            def generate(self):
+                self._conanfile.output.info(f"MyCustomGenerator generate!!")
+        """)
+    save(os.path.join(c.cache.custom_generators_path, "mygen.py"), generator)
+    c.save({"dep/conanfile.py": GenConanfile("dep", "0.1").with_generator("MyCustomGenerator"),
+            "pkg/conanfile.py": GenConanfile("pkg", "0.1").with_requires("dep/0.1")
+                                                          .with_generator("MyCustomGenerator")})
+    c.run("export dep")
+    c.run("export pkg")
+    c.run("install --requires=pkg/0.1 --build=missing")
+    assert "dep/0.1: MyCustomGenerator generate!!" in c.out
+    assert "pkg/0.1: MyCustomGenerator generate!!" in c.out
+    # Loaded once for the binaries installation app, not for every built package, plus once for
+    # the consumer generators
+    assert c.out.count("Loading MyCustomGenerator module") == 2
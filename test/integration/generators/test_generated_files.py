@@ -0,0 +1,119 @@
+import os
+import textwrap
+
+from conan.test.assets.genconanfile import GenConanfile
+from conan.test.utils.tools import TestClient
+from conans.util.files import load
+
+
+def _mtimes(folder):
+    return {f: os.stat(os.path.join(folder, f)).st_mtime_ns for f in os.listdir(folder)}
+
+
+def test_unchanged_generated_files_not_rewritten():
+    c = TestClient()
+    c.save({"dep/conanfile.py": GenConanfile("dep", "0.1"),
+            "conanfile.txt": "[requires]\ndep/0.1\n[generators]\nCMakeDeps\nCMakeToolchain"})
+    c.run("create dep")
+    c.run("install . -of=build")
+    build = os.path.join(c.current_folder, "build")
+    assert os.path.isfile(os.path.join(build, "conangenerated.json"))
+    generated = _mtimes(build)
+    # Make it impossible that a rewrite keeps the same timestamp
+    for f in generated:
+        if f.endswith(".cmake"):
+            os.utime(os.path.join(build, f), ns=(0, 0))
+    c.run("install . -of=build -vverbose")
+    assert "Generated files: 0 changed" in c.out
+    for f, mtime in _mtimes(build).items():
+        if f.endswith(".cmake"):
+            assert mtime == 0, f
+
+    # A change in the inputs rewrites only the files that change
+    c.run("install . -of=build -c tools.cmake.cmaketoolchain:generator=Ninja")
+    mtimes = _mtimes(build)
+    assert mtimes["conan_toolchain.cmake"] == 0
+    assert mtimes["CMakePresets.json"] != 0
+    assert mtimes["dep-config.cmake"] == 0
+
+
+def test_stale_generated_files_removed():
+    c = TestClient()
+    c.save({"dep/conanfile.py": GenConanfile("dep", "0.1"),
+            "other/conanfile.py": GenConanfile("other", "0.1"),
+            "conanfile.txt": "[requires]\ndep/0.1\nother/0.1\n[generators]\nCMakeDeps"})
+    c.run("create dep")
+    c.run("create other")
+    c.run("install . -of=build")
+    build = os.path.join(c.current_folder, "build")
+    c.save({"build/other-config.cmake.user": "user file, not generated"})
+    assert os.path.isfile(os.path.join(build, "other-config.cmake"))
+
+    # A different configuration in the same folder doesn't remove the previous one files
+    c.run("install . -of=build -s build_type=Debug")
+    assert os.path.isfile(os.path.join(build, "other-release-x86_64-data.cmake"))
+    assert os.path.isfile(os.path.join(build, "other-debug-x86_64-data.cmake"))
+
+    c.save({"conanfile.txt": "[requires]\ndep/0.1\n[generators]\nCMakeDeps"})
+    c.run("install . -of=build -vverbose")
+    assert "unchanged, 2 removed" in c.out  # data and Target-release files of "other"
+    # Still generated by the Debug configuration
+    assert os.path.isfile(os.path.join(build, "other-config.cmake"))
+    assert not os.path.isfile(os.path.join(build, "other-release-x86_64-data.cmake"))
+    assert not os.path.isfile(os.path.join(build, "other-Target-release.cmake"))
+    c.run("install . -of=build -s build_type=Debug")
+    assert not os.path.isfile(os.path.join(build, "other-config.cmake"))
+    assert not os.path.isfile(os.path.join(build, "other-debug-x86_64-data.cmake"))
+    assert os.path.isfile(os.path.join(build, "dep-config.cmake"))
+    assert os.path.isfile(os.path.join(build, "other-config.cmake.user"))
+
+
+def test_generated_files_not_tracked():
+    """ the files saved by the recipe generate() are never removed, and nothing is removed
+    when generating in the project folder, without layout
+    """
+    c = TestClient()
+    conanfile = textwrap.dedent("""
+        from conan import ConanFile
+        from conan.tools.files import save
+
+        class Pkg(ConanFile):
+            settings = "build_type"
+            generators = "CMakeToolchain"
+
+            def generate(self):
+                if self.settings.build_type == "Release":
+                    save(self, "myfile.txt", "contents")
+        """)
+    c.save({"conanfile.py": conanfile})
+    c.run("install . -of=build")
+    manifest = load(os.path.join(c.current_folder, "build", "conangenerated.json"))
+    assert "conan_toolchain.cmake" in manifest
+    assert "myfile.txt" not in manifest
+    c.run("install . -of=build -s build_type=Debug")
+    c.save({"conanfile.py": conanfile.replace('"Release"', '"Debug"')})
+    c.run("install . -of=build")
+    assert os.path.isfile(os.path.join(c.current_folder, "build", "myfile.txt"))
+
+    c.run("install .")
+    assert os.path.isfile(os.path.join(c.current_folder, "conan_toolchain.cmake"))
+    assert not os.path.isfile(os.path.join(c.current_folder, "conangenerated.json"))
+
+
+def test_generated_files_manifest_pruned():
+    """ the generated files already removed are not kept in the manifest """
+    c = TestClient()
+    c.save({"conanfile.txt": "[generators]\nCMakeToolchain"})
+    c.run("install . -of=build -s build_type=Debug")
+    c.run("install . -of=build")
+    build = os.path.join(c.current_folder, "build")
+    manifest = load(os.path.join(build, "conangenerated.json"))
+    assert manifest.count("conan_toolchain.cmake") == 2
+    assert "conanbuildenv-debug-x86_64.sh" in manifest
+    for f in os.listdir(build):
+        if f != "conangenerated.json":
+            os.remove(os.path.join(build, f))
+    c.run("install . -of=build")
+    manifest = load(os.path.join(build, "conangenerated.json"))
+    assert "conanbuildenv-debug-x86_64.sh" not in manifest
+    assert "conanbuildenv-release-x86_64.sh" in manifest
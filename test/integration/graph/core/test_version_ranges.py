@@ -418,6 +418,9 @@ def test_unknown_options():
 
     c.run("graph info --requires=lib/[>1.2,unknown_conf]")
     assert 'WARN: Unrecognized version range option "unknown_conf" in ">1.2,unknown_conf"' in c.out
+    # The parsed ranges are reused in the same process, but the warning is still reported
+    c.run("graph info --requires=lib/[>1.2,unknown_conf]")
+    assert 'WARN: Unrecognized version range option "unknown_conf" in ">1.2,unknown_conf"' in c.out
 
 
 @pytest.mark.parametrize("version_range,should_warn", [
@@ -0,0 +1,120 @@
+import os
+from unittest.mock import patch
+
+from conan.internal.cache.graph_cache import GraphCache
+from conan.test.assets.genconanfile import GenConanfile
+from conan.test.utils.tools import TestClient
+
+REUSED = "Reusing the resolved graph of a previous computation with the same inputs"
+
+
+def _client():
+    c = TestClient(light=True)
+    c.save_home({"global.conf": "core.graph:cache=True"})
+    c.save({"dep/conanfile.py": GenConanfile("dep"),
+            "app/conanfile.py": GenConanfile("app", "0.1").with_requires("dep/[>=1.0 <2]")})
+    c.run("create dep --version=1.0")
+    return c
+
+
+def test_graph_cache_reused():
+    c = _client()
+    c.run("install app")
+    assert REUSED not in c.out
+    c.assert_listed_require({"dep/1.0": "Cache"})
+    c.run("install app")
+    assert REUSED in c.out
+    c.assert_listed_require({"dep/1.0": "Cache"})
+    c.run("graph info app --format=json")
+    assert REUSED in c.out
+    assert '"dep/[>=1.0 <2]": "dep/1.0' in c.stdout
+    # A different profile is a different computation
+    c.run("graph info app -c tools.build:jobs=3")
+    assert REUSED not in c.out
+    # Updating always resolves again
+    c.run("install app --update")
+    assert REUSED not in c.out
+    assert os.listdir(os.path.join(c.cache.store, "graphs"))
+    c.run("cache clean --temp")
+    assert not os.path.exists(os.path.join(c.cache.store, "graphs"))
+
+
+def test_graph_cache_invalidated():
+    c = _client()
+    c.run("install app")
+    # A new version in the cache can change the resolution of the ranges
+    c.run("create dep --version=1.1")
+    c.run("install app")
+    assert REUSED not in c.out
+    c.assert_listed_require({"dep/1.1": "Cache"})
+    # Changes in the consumer
+    c.save({"app/conanfile.py": GenConanfile("app", "0.1").with_requires("dep/[>=1.0 <1.1]")})
+    c.run("install app")
+    assert REUSED not in c.out
+    c.assert_listed_require({"dep/1.0": "Cache"})
+    c.run("remove dep/1.0 -c")
+    c.run("install app", assert_error=True)
+    assert REUSED not in c.out
+
+
+def test_graph_cache_disabled():
+    c = TestClient(light=True)
+    c.save({"dep/conanfile.py": GenConanfile("dep", "1.0"),
+            "app/conanfile.py": GenConanfile("app", "0.1").with_requires("dep/1.0")})
+    c.run("create dep")
+    c.run("install app")
+    c.run("install app")
+    assert REUSED not in c.out
+    assert not os.path.exists(os.path.join(c.cache.store, "graphs"))
+
+
+def test_graph_cache_editable():
+    c = _client()
+    c.run("install app")
+    c.save({"dep/conanfile.py": GenConanfile("dep", "1.5")})
+    c.run("editable add dep")
+    c.run("install app")
+    assert REUSED not in c.out
+    c.assert_listed_require({"dep/1.5": "Editable"})
+    c.run("install app")
+    assert REUSED in c.out
+    c.assert_listed_require({"dep/1.5": "Editable"})
+    # Changes in the editable recipe
+    c.save({"dep/conanfile.py": GenConanfile("dep", "1.5").with_settings("os")})
+    c.run("install app")
+    assert REUSED not in c.out
+    c.run("editable remove dep")
+    c.run("install app")
+    assert REUSED in c.out
+    c.assert_listed_require({"dep/1.0": "Cache"})
+
+
+def test_graph_cache_remote_downloads():
+    c = TestClient(light=True, default_server_user=True)
+    c.save_home({"global.conf": "core.graph:cache=True"})
+    c.save({"dep/conanfile.py": GenConanfile("dep"),
+            "app/conanfile.py": GenConanfile("app", "0.1").with_requires("dep/[>=1.0 <2]")})
+    c.run("create dep --version=1.0")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.run("install app")
+    c.assert_listed_require({"dep/1.0": "Downloaded (default)"})
+    # The recipe downloaded by the previous computation is part of the stored entry
+    c.run("install app")
+    assert REUSED in c.out
+    c.assert_listed_require({"dep/1.0": "Cache"})
+    # A new version in the server is not used while a matching one is in the cache
+    c.run("create dep --version=1.1")
+    c.run("upload * -r=default -c")
+    c.run("remove dep/1.1 -c")
+    c.run("install app")
+    assert REUSED in c.out
+    c.assert_listed_require({"dep/1.0": "Cache"})
+
+
+def test_graph_cache_bounded():
+    c = _client()
+    with patch.object(GraphCache, "_MAX_ENTRIES", 2):
+        for jobs in range(4):
+            c.run(f"install app -c tools.build:jobs={jobs}")
+    assert len(os.listdir(os.path.join(c.cache.store, "graphs"))) == 2
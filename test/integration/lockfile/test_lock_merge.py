@@ -4,6 +4,8 @@ import pytest
 
 from conan.test.assets.genconanfile import GenConanfile
 from conan.test.utils.tools import TestClient
+from conans.model.graph_lock import Lockfile
+from conans.model.recipe_ref import RecipeReference
 
 
 @pytest.mark.parametrize("requires", ["requires", "tool_requires"])
@@ -57,3 +59,26 @@ def test_merge_alias(requires):
     assert "ERROR: Package 'pkg/0.3' not resolved" in c.out
     c.run("install app -s build_type=Debug", assert_error=True)
     assert "ERROR: Package 'pkg/0.4' not resolved" in c.out
+
+
+def test_merge_all():
+    """ merging many lockfiles sorts once at the end, with the same result as merging one by one
+    """
+    lockfiles = []
+    for i in range(5):
+        lockfile = Lockfile()
+        lockfile.add(requires=[RecipeReference.loads(f"pkg/1.{i}#rev{i}"),
+                               RecipeReference.loads(f"dep{i}/0.1")],
+                     build_requires=[RecipeReference.loads(f"tool/{i}.0")])
+        lockfiles.append(lockfile)
+
+    result = Lockfile()
+    result.merge_all(iter(lockfiles))
+    expected = Lockfile()
+    for lockfile in lockfiles:
+        expected.merge(lockfile)
+    assert result.serialize() == expected.serialize()
+    assert result.serialize()["requires"][:2] == ["pkg/1.4#rev4", "pkg/1.3#rev3"]
+    # The name index of the locked references follows the merged and sorted order
+    matches = result._requires.matches(RecipeReference.loads("pkg/[*]"))
+    assert [repr(r) for r in matches] == [f"pkg/1.{i}#rev{i}" for i in reversed(range(5))]
@@ -1,6 +1,7 @@
 import json
 import os
 import textwrap
+from unittest.mock import patch
 
 import pytest
 
@@ -298,6 +299,67 @@ class TestInstall:
         assert "zlib/0.1@myuser/mychannel" in client.out
 
 
+class TestIndex:
+    def test_index_incremental(self):
+        """ recipes are only loaded and exported again when their folder changes """
+        folder = temp_folder()
+        recipes_folder = os.path.join(folder, "recipes")
+        config = textwrap.dedent("""
+            versions:
+              "0.1":
+                folder: all
+            """)
+        save_files(recipes_folder, {"zlib/config.yml": config,
+                                    "zlib/all/conanfile.py": str(GenConanfile("zlib")),
+                                    "openssl/config.yml": config,
+                                    "openssl/all/conanfile.py": str(GenConanfile("openssl"))})
+        c = TestClient(light=True)
+        c.run(f"remote add local '{folder}'")
+        c.run("list * -r=local")
+        assert "openssl/0.1" in c.out
+        assert "zlib/0.1" in c.out
+        c.run("install --requires=zlib/0.1 --build=missing -vvv")
+        assert "Internal export for zlib/0.1" in c.out
+        c.run("install --requires=zlib/0.1 --update -vvv")
+        assert "Internal export for zlib/0.1" not in c.out
+        assert "zlib/0.1: Already installed!" in c.out
+
+        zlib = GenConanfile("zlib").with_class_attribute("user='myuser'")\
+                                   .with_class_attribute("channel='mychannel'")
+        save(os.path.join(recipes_folder, "zlib", "all", "conanfile.py"), str(zlib))
+        c.run("list * -r=local")
+        assert "openssl/0.1" in c.out
+        assert "zlib/0.1@myuser/mychannel" in c.out
+        c.run("install --requires=zlib/0.1@myuser/mychannel --build=missing -vvv")
+        assert "Internal export for zlib/0.1@myuser/mychannel" in c.out
+        assert "zlib/0.1@myuser/mychannel: Created package" in c.out
+        c.run("install --requires=zlib/0.1@myuser/mychannel -vvv")
+        assert "Internal export" not in c.out
+
+    def test_index_saved_once(self):
+        """ the index is saved once after recomputing all the entries, and not at all if nothing
+        changed """
+        folder = temp_folder()
+        config = textwrap.dedent("""
+            versions:
+              "0.1":
+                folder: all
+            """)
+        files = {}
+        for index in range(5):
+            files[f"pkg{index}/config.yml"] = config
+            files[f"pkg{index}/all/conanfile.py"] = str(GenConanfile(f"pkg{index}"))
+        save_files(os.path.join(folder, "recipes"), files)
+        c = TestClient(light=True)
+        c.run(f"remote add local '{folder}'")
+        with patch("conans.client.rest_client_local_recipe_index.save", wraps=save) as saved:
+            c.run("list * -r=local")
+            assert saved.call_count == 1
+            c.run("list * -r=local")
+            assert saved.call_count == 1
+        assert "pkg4/0.1" in c.out
+
+
 class TestRestrictedOperations:
     def test_upload(self):
         folder = temp_folder()
@@ -908,3 +908,19 @@ def test_alias_cmakedeps_set_property():
 
     assert "add_library(component_alias" in targetsData
     assert "add_library(dep::my_aliased_component" in targetsData
+
+
+def test_cmakedeps_parallel_write():
+    c = TestClient()
+    c.save({"dep1/conanfile.py": GenConanfile("dep1", "0.1"),
+            "dep2/conanfile.py": GenConanfile("dep2", "0.1"),
+            "conanfile.txt": "[requires]\ndep1/0.1\ndep2/0.1"})
+    c.run("create dep1")
+    c.run("create dep2")
+    c.run("install . -g CMakeDeps")
+    sequential = {f: c.load(f) for f in os.listdir(c.current_folder) if f.endswith(".cmake")}
+    c.run("install . -g CMakeDeps -c tools.cmake.cmakedeps:parallel=4")
+    parallel = {f: c.load(f) for f in os.listdir(c.current_folder) if f.endswith(".cmake")}
+    assert "dep1-config.cmake" in parallel
+    assert "dep2-release-x86_64-data.cmake" in parallel
+    assert sequential == parallel
@@ -0,0 +1,59 @@
+import time
+from unittest.mock import patch
+
+from conans.client.graph.graph import Node
+from test.integration.graph.core.graph_manager_base import GraphManagerTest
+from conan.test.utils.tools import GenConanfile
+
+
+class TestDeepDiamondsExpansion(GraphManagerTest):
+    """ deep graph with diamonds at every level, every package depends on all the packages of the
+    previous level and on some own leaf packages
+    """
+    depth = 25
+    width = 4
+    leaves = 2
+
+    def _create_recipes(self):
+        previous = []
+        for level in range(self.depth):
+            current = []
+            for i in range(self.width):
+                ref = f"pkg{level}_{i}/0.1"
+                leaves = [f"leaf{level}_{i}_{j}/0.1" for j in range(self.leaves)]
+                for leaf in leaves:
+                    self.recipe_cache(leaf)
+                self.recipe_cache(ref, previous + leaves)
+                current.append(ref)
+            previous = current
+        return GenConanfile("app", "0.1").with_requires(*previous)
+
+    def _expand(self, consumer):
+        checks = []
+        original = Node.check_downstream_exists
+
+        def counted(*args, **kwargs):
+            checks.append(1)
+            return original(*args, **kwargs)
+
+        with patch.object(Node, "check_downstream_exists", counted):
+            start = time.perf_counter()
+            deps_graph = self.build_graph(consumer, install=False)
+            elapsed = time.perf_counter() - start
+        return deps_graph, len(checks), elapsed
+
+    def test_expansion(self):
+        consumer = self._create_recipes()
+        deps_graph, checks, elapsed = self._expand(consumer)
+        # The previous behavior, always walking down the whole dependants chain
+        with patch.object(Node, "_downstream_candidates", lambda *args: None):
+            full_graph, full_checks, full_elapsed = self._expand(consumer)
+        print(f"Graph expansion: {len(deps_graph.nodes)} nodes, {checks} downstream checks in "
+              f"{elapsed:.3f}s. Without requirements index: {full_checks} downstream checks "
+              f"in {full_elapsed:.3f}s")
+
+        assert deps_graph.error is False
+        assert len(deps_graph.nodes) == 1 + self.depth * self.width * (1 + self.leaves)
+        assert ([(n.ref, sorted(str(d.ref) for d in n.neighbors())) for n in deps_graph.nodes] ==
+                [(n.ref, sorted(str(d.ref) for d in n.neighbors())) for n in full_graph.nodes])
+        assert checks < full_checks
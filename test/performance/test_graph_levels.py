@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+from conans.client.graph.graph import DepsGraph, Node, CONTEXT_HOST
+from conans.client.graph.install_graph import InstallGraph, _InstallConfiguration
+from conans.model.recipe_ref import RecipeReference
+
+
+def _deps_graph(num_nodes):
+    """ a long chain in which every node also depends on some previous ones, the worst case of
+    the previous by_levels() algorithm, that scanned all the remaining nodes for every level
+    """
+    graph = DepsGraph()
+    nodes = []
+    for i in range(num_nodes):
+        node = Node(RecipeReference.loads(f"pkg{i}/0.1"), None, CONTEXT_HOST)
+        graph.add_node(node)
+        nodes.append(node)
+        for dep in (i - 1, i - 3, i // 2):
+            if 0 <= dep < i:
+                graph.add_edge(node, nodes[dep], None)
+    return graph
+
+
+def _build_order(num_nodes):
+    order = []
+    for i in range(num_nodes):
+        depends = [f"pkg{d}/0.1#rev:pid#prev" for d in (i - 1, i - 3, i // 2) if 0 <= d < i]
+        order.append({"ref": f"pkg{i}/0.1#rev", "pref": f"pkg{i}/0.1#rev:pid#prev",
+                      "package_id": "pid", "prev": "prev", "context": "host",
+                      "binary": "Build" if i % 2 else "Download", "options": [],
+                      "filenames": [], "depends": list(dict.fromkeys(depends)),
+                      "overrides": {}, "info": {}})
+    data = {"order_by": "configuration", "reduced": False, "order": [order]}
+    return InstallGraph.deserialize(data, "build_order")
+
+
+def _check_levels(levels, depends, key=lambda item: item):
+    processed = set()
+    for level in levels:
+        for item in level:
+            assert all(d in processed for d in depends(item))
+        processed.update(key(item) for item in level)
+
+
+def test_by_levels_scaling():
+    num_nodes = 1000
+    graph = _deps_graph(num_nodes)
+    visits = []
+    original = Node.neighbors
+
+    def counted(node):
+        visits.append(node)
+        return original(node)
+
+    # Compute the levels without the cache, which is tested separately
+    with patch.object(Node, "neighbors", counted):
+        levels = graph._compute_levels()
+    assert sum(len(level) for level in levels) == num_nodes
+    assert len(levels) == num_nodes
+    _check_levels(levels, lambda n: n.neighbors())
+    # The dependencies of every node are visited once. The previous algorithm visited the
+    # dependencies of all the remaining nodes for every level, num_nodes^2 / 2 here
+    assert len(visits) == num_nodes
+
+
+def test_by_levels_cached():
+    graph = _deps_graph(10)
+    levels = graph.by_levels()
+    assert graph.by_levels() == levels
+    new_node = Node(RecipeReference.loads("consumer/0.1"), None, CONTEXT_HOST)
+    graph.add_node(new_node)
+    graph.add_edge(new_node, graph.nodes[9], None)
+    assert graph.by_levels() == levels + [[new_node]]
+
+
+def _depends_reads(num_nodes):
+    """ number of times the dependencies of any node are read to reduce and order the graph """
+    install_graph = _build_order(num_nodes)
+    reads = []
+
+    def get_depends(node):
+        reads.append(node)
+        return node.__dict__["depends"]
+
+    def set_depends(node, value):
+        node.__dict__["depends"] = value
+
+    depends = property(get_depends, set_depends)
+    with patch.object(_InstallConfiguration, "depends", depends, create=True):
+        install_graph.reduce()
+        levels = install_graph.install_order()
+    assert sum(len(level) for level in levels) == num_nodes // 2
+    prefs = [n.pref for level in levels for n in level]
+    _check_levels(levels, lambda n: n.depends, key=lambda n: n.pref)
+    assert len(set(prefs)) == len(prefs)
+    return len(reads)
+
+
+def test_install_order_reduce_scaling():
+    # Every node has a few dependencies, so their dependencies are read a few times per node
+    # (~16 here). The previous algorithms read the dependencies of all the nodes for every
+    # removed node and for every level, thousands of times per node
+    for num_nodes in (1000, 4000):
+        assert _depends_reads(num_nodes) < 20 * num_nodes
@@ -0,0 +1,47 @@
+import time
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from conan.cli.formatters.graph import format_graph_json
+from conans.client.graph.graph import DepsGraph, Node, CONTEXT_HOST
+from conans.model.recipe_ref import RecipeReference
+
+
+def _deps_graph(num_nodes):
+    graph = DepsGraph()
+    for i in range(num_nodes):
+        conanfile = SimpleNamespace(requires={})
+        graph.add_node(Node(RecipeReference.loads(f"pkg{i}/0.1#rev"), conanfile, CONTEXT_HOST))
+    return graph
+
+
+def _node_serialize(node):
+    # The real serialization of a node, with its conanfile information, is several KB
+    return {"ref": repr(node.ref), "id": node.id, "info": {"settings": {f"s{i}": "x" * 100
+                                                                          for i in range(50)}}}
+
+
+def _format_json(num_nodes):
+    graph = _deps_graph(num_nodes)
+    result = {"graph": graph, "field_filter": None, "package_filter": None}
+    written = []
+    with patch.object(Node, "serialize", _node_serialize), \
+            patch("conan.cli.formatters.cli_out_write", lambda d, endline="\n": written.append(1)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        format_graph_json(result)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"Graph json {num_nodes} nodes: {elapsed:.3f}s, peak memory {peak / 2**20:.1f} MB")
+    assert written
+    return peak
+
+
+def test_graph_json_flat_memory():
+    small = _format_json(200)
+    large = _format_json(2000)
+    # The whole serialization of the large graph would be >10MB, the output is written node
+    # by node, so the memory doesn't grow with the size of the graph
+    assert large < 2 * small + 2 ** 20
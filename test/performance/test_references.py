@@ -0,0 +1,60 @@
+import os
+import time
+import tracemalloc
+
+from conan.internal.cache.db.packages_table import PackagesDBTable
+from conan.test.utils.test_files import temp_folder
+from conans.model.package_ref import PkgReference
+from conans.model.recipe_ref import RecipeReference
+from conans.model.version import Version
+
+
+def _package_rows(table, num_recipes, num_packages):
+    """ rows like the ones read from the cache database when listing all the packages """
+    for i in range(num_recipes):
+        for j in range(num_packages):
+            yield table.row_type(f"pkg{i % 100}/{i // 100}.0@user/channel", f"rrev{i}",
+                                 f"pkgid{j}", f"prev{j}", f"p/pkg{i}{j}", 1.0 * j, None, 0)
+
+
+def _list_packages(rows):
+    return [PackagesDBTable._as_dict(row) for row in rows]
+
+
+def test_list_100k_packages():
+    table = PackagesDBTable(os.path.join(temp_folder(), "cache.sqlite3"))
+    rows = list(_package_rows(table, 1000, 100))
+    tracemalloc.start()
+    start = time.perf_counter()
+    packages = _list_packages(rows)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Listed {len(packages)} packages in {elapsed:.3f}s, peak memory {peak / 2**20:.1f} MB")
+
+    prefs = [p["pref"] for p in packages]
+    start = time.perf_counter()
+    found = {pref.ref for pref in prefs}
+    names = sorted(set(str(pref.ref) for pref in prefs))
+    print(f"Hashed and printed {len(prefs)} references in {time.perf_counter() - start:.3f}s")
+    assert len(found) == 1000  # Same name/version/user/channel with different revisions
+    assert len(names) == 1000
+
+    pref = prefs[0]
+    assert not hasattr(pref, "__dict__") and not hasattr(pref.ref, "__dict__")
+    # The same reference text is parsed only once, the immutable parts are shared
+    assert prefs[0].ref is not prefs[1].ref
+    assert prefs[0].ref.version is prefs[1].ref.version
+
+
+def test_cached_str_hash_follow_changes():
+    ref = RecipeReference.loads("pkg/1.0@user/channel#rev")
+    assert str(ref) == "pkg/1.0@user/channel"
+    h = hash(ref)
+    ref.version = Version("2.0")  # References are mutable, e.g. when resolving ranges
+    assert str(ref) == "pkg/2.0@user/channel"
+    assert hash(ref) != h
+    assert hash(ref) == hash(RecipeReference.loads("pkg/2.0@user/channel"))
+    ref.user = ref.channel = None
+    assert str(ref) == "pkg/2.0"
+    assert str(PkgReference(ref, "pkgid")) == "pkg/2.0:pkgid"
@@ -0,0 +1,69 @@
+import os
+import tarfile
+import time
+import zipfile
+
+from conan.test.utils.mocks import ConanFileMock
+from conan.test.utils.test_files import temp_folder
+from conan.tools.files import unzip
+from conans.util.files import save_files
+
+
+def _sources(num_files=3000):
+    folder = temp_folder()
+    files = {f"pkg-1.0/src/dir{i % 50}/file{i}.cpp": f"// file {i}\n" + "int x = 0;\n" * 400
+             for i in range(num_files)}
+    save_files(folder, files)
+    return folder, files
+
+
+def _untargz_getmembers(filename, destination):
+    # The previous implementation of strip_root, reading all the members before extracting
+    with tarfile.TarFile.open(filename, 'r:*') as tgz:
+        members = tgz.getmembers()
+        names = [n.replace("\\", "/") for n in tgz.getnames()]
+        common_folder = os.path.commonprefix(names).split("/", 1)[0]
+        members = [m for m in members if m.name != common_folder]
+        for member in members:
+            member.name = member.name.replace("\\", "/").split("/", 1)[1]
+            member.path = member.name
+        tgz.extractall(destination, members=members)
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def test_untargz_strip_root_benchmark():
+    folder, files = _sources()
+    tgz = os.path.join(temp_folder(), "pkg-1.0.tgz")
+    with tarfile.open(tgz, "w:gz") as tar:
+        tar.add(os.path.join(folder, "pkg-1.0"), arcname="pkg-1.0")
+
+    conanfile = ConanFileMock({})
+    previous = _timed(_untargz_getmembers, tgz, temp_folder())
+    dest = temp_folder()
+    current = _timed(unzip, conanfile, tgz, dest, strip_root=True)
+    print(f"untargz strip_root {len(files)} files: getmembers() {previous:.3f}s, "
+          f"streaming {current:.3f}s")
+    assert os.path.isfile(os.path.join(dest, "src", "dir0", "file0.cpp"))
+
+
+def test_unzip_parallel_benchmark():
+    folder, files = _sources()
+    zip_path = os.path.join(temp_folder(), "pkg-1.0.zip")
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        for name in files:
+            z.write(os.path.join(folder, name), name)
+
+    timings = {}
+    for parallel in (1, 4):
+        conanfile = ConanFileMock({})
+        conanfile.conf.define("tools.files.unzip:parallel", parallel)
+        dest = temp_folder()
+        timings[parallel] = _timed(unzip, conanfile, zip_path, dest, strip_root=True)
+        assert os.path.isfile(os.path.join(dest, "src", "dir0", "file0.cpp"))
+    print(f"unzip {len(files)} files: sequential {timings[1]:.3f}s, "
+          f"4 threads {timings[4]:.3f}s")
@@ -1,12 +1,15 @@
+import marshal
 import os
 import sys
 import textwrap
+import types
 import unittest
 
 import pytest
 from parameterized import parameterized
 
-from conans.client.loader import ConanFileLoader, ConanFileTextLoader, load_python_file
+from conans.client.loader import ConanFileLoader, ConanFileTextLoader, load_python_file, \
+    _load_python_file
 from conan.errors import ConanException
 from conan.test.utils.test_files import temp_folder
 from conans.util.files import save, chdir
@@ -36,6 +39,54 @@ class BasePackage(ConanFile):
         self.assertEqual(result.short_paths, True)
 
 
+class TestBytecodeCache:
+
+    def test_bytecode_cached(self):
+        tmp = temp_folder()
+        bytecode_folder = os.path.join(tmp, "pyc")
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        save(conanfile_path, "from mylib import value\ndef get():\n    return value")
+        save(os.path.join(tmp, "mylib.py"), "value = 42")
+
+        module, module_id = _load_python_file(conanfile_path, bytecode_folder)
+        assert module.get() == 42
+        assert module.__file__ == conanfile_path
+        assert len(os.listdir(bytecode_folder)) == 1
+        # The local imported modules are still isolated in the module namespace
+        assert "mylib" not in sys.modules
+        assert "{}.mylib".format(module_id) in sys.modules
+
+        module2, module_id2 = _load_python_file(conanfile_path, bytecode_folder)
+        assert module_id2 != module_id
+        assert module2.get() == 42
+        assert len(os.listdir(bytecode_folder)) == 1
+
+        # Changing the file contents does not reuse the previously compiled code
+        save(conanfile_path, "def get():\n    return 23")
+        module3, _ = _load_python_file(conanfile_path, bytecode_folder)
+        assert module3.get() == 23
+        assert len(os.listdir(bytecode_folder)) == 2
+
+    def test_bytecode_corrupted(self):
+        tmp = temp_folder()
+        bytecode_folder = os.path.join(tmp, "pyc")
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        save(conanfile_path, "def get():\n    return 42")
+        _load_python_file(conanfile_path, bytecode_folder)
+        cached = os.path.join(bytecode_folder, os.listdir(bytecode_folder)[0])
+        save(cached, "garbage")
+        module, _ = _load_python_file(conanfile_path, bytecode_folder)
+        assert module.get() == 42
+
+        # Valid marshal data that is not a code object is compiled again too
+        with open(cached, "wb") as f:
+            marshal.dump(42, f)
+        module, _ = _load_python_file(conanfile_path, bytecode_folder)
+        assert module.get() == 42
+        with open(cached, "rb") as f:
+            assert isinstance(marshal.load(f), types.CodeType)
+
+
 class ConanLoaderTxtTest(unittest.TestCase):
     def test_conanfile_txt_errors(self):
         # Invalid content
@@ -252,3 +252,59 @@ def test_profile_core_confs_error(conf_name):
     with pytest.raises(ConanException) as exc:
         profile_loader.from_cli_args([], [], [], [conf_name], None)
     assert "[conf] 'core.*' configurations are not allowed in profiles" in str(exc.value)
+
+
+def test_profile_load_memoized(monkeypatch):
+    tmp = temp_folder()
+    save(os.path.join(tmp, "base"), "[settings]\nos=Linux\n[conf]\nuser.myconf:values=['a']")
+    save(os.path.join(tmp, "macros.jinja"), "{% macro arch() %}x86_64{% endmacro %}")
+    save(os.path.join(tmp, "host"), textwrap.dedent("""\
+        include(base)
+        [settings]
+        build_type={{ os.getenv("MY_BUILD_TYPE", "Release") }}
+        """))
+    save(os.path.join(tmp, "imports"), textwrap.dedent("""\
+        {% import "macros.jinja" as macros %}
+        [settings]
+        arch={{ macros.arch() }}
+        """))
+    profile_loader = ProfileLoader(cache_folder=temp_folder())
+
+    profile = profile_loader.load_profile("./host", tmp)
+    assert profile.settings == {"os": "Linux", "build_type": "Release"}
+    # The returned profiles are independent objects
+    profile.settings["os"] = "Windows"
+    profile.conf.update("user.myconf:values", ["b"])
+    profile = profile_loader.load_profile("./host", tmp)
+    assert profile.settings == {"os": "Linux", "build_type": "Release"}
+    assert profile.conf.get("user.myconf:values") == ["a"]
+    assert len(profile_loader._templates) == 2
+
+    # The environment is an input of the rendering
+    monkeypatch.setenv("MY_BUILD_TYPE", "Debug")
+    assert profile_loader.load_profile("./host", tmp).settings["build_type"] == "Debug"
+    # and so are the profile contents and included profiles
+    save(os.path.join(tmp, "base"), "[settings]\nos=Macos")
+    assert profile_loader.load_profile("./host", tmp).settings["os"] == "Macos"
+    assert len(profile_loader._templates) == 3  # The "base" one changed
+
+    # Templates importing other templates are rendered again, they might change
+    assert profile_loader.load_profile("./imports", tmp).settings["arch"] == "x86_64"
+    save(os.path.join(tmp, "macros.jinja"), "{% macro arch() %}armv8{% endmacro %}")
+    assert profile_loader.load_profile("./imports", tmp).settings["arch"] == "armv8"
+
+
+def test_profile_load_memo_bounded(monkeypatch):
+    tmp = temp_folder()
+    save(os.path.join(tmp, "host"), "[settings]\nos={{ os.getenv('MY_OS', 'Linux') }}")
+    monkeypatch.setattr(ProfileLoader, "_MEMO_SIZE", 2)
+    profile_loader = ProfileLoader(cache_folder=temp_folder())
+    for os_ in ("Windows", "Macos", "Linux", "FreeBSD"):
+        monkeypatch.setenv("MY_OS", os_)
+        assert profile_loader.load_profile("./host", tmp).settings["os"] == os_
+    assert len(profile_loader._rendered) == 2
+    assert len(profile_loader._parsed) == 2
+    # The discarded ones are rendered again
+    monkeypatch.setenv("MY_OS", "Windows")
+    assert profile_loader.load_profile("./host", tmp).settings["os"] == "Windows"
+
@@ -1,6 +1,6 @@
 import unittest
 
-from conans.model.build_info import CppInfo
+from conans.model.build_info import CppInfo, memoize_cpp_info
 
 
 class CppInfoComponentsTest(unittest.TestCase):
@@ -74,3 +74,21 @@ class CppInfoComponentsTest(unittest.TestCase):
                          info.components["Crypto"].bindirs)
         self.assertEqual(["different_res", "another_res", "another_other_res"],
                          info.components["Crypto"].resdirs)
+
+    def test_memoize_cpp_info(self):
+        info = CppInfo()
+        info.components["crypto"].libs = ["crypto"]
+        info.components["ssl"].libs = ["ssl"]
+        info.components["ssl"].requires = ["crypto"]
+        self.assertIsNot(info.aggregated_components(), info.aggregated_components())
+        with memoize_cpp_info([info]):
+            aggregated = info.aggregated_components()
+            self.assertIs(aggregated, info.aggregated_components())
+            self.assertIs(info.get_sorted_components(), info.get_sorted_components())
+            self.assertEqual(["ssl", "crypto"], aggregated.libs)
+            self.assertEqual([(None, "crypto")], info.required_components)
+            # The relocation of the package invalidates the memoized information
+            info.deploy_base_folder("/pkg", "/deploy")
+            self.assertIsNot(aggregated, info.aggregated_components())
+        self.assertIsNone(info._memo)
+        self.assertIsNot(info.aggregated_components(), info.aggregated_components())
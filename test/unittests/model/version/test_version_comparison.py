@@ -155,3 +155,20 @@ def test_elem_comparison():
     assert micro > 3
     assert micro < 5
     assert micro == 4
+
+
+def test_sort_key_equivalent():
+    """ the precomputed key for digit-only versions gives the same results as the full comparison
+    """
+    versions = ["1", "1.0", "1.0.1", "1.10", "1.9", "2.0.0", "10", "0.1", "0.0.0", "1.2.3.4",
+                "1.0-pre", "1.a", "1.0+b1", "01.2"]
+    full = [Version(v) for v in versions]
+    for v in full:
+        v._key = None
+    fast = [Version(v) for v in versions]
+    assert fast[0]._key == (1,) and fast[-4]._key is None
+    for i, v1 in enumerate(versions):
+        for j, v2 in enumerate(versions):
+            assert (fast[i] < fast[j]) == (full[i] < full[j]), f"{v1} < {v2}"
+            assert (fast[i] == fast[j]) == (full[i] == full[j]), f"{v1} == {v2}"
+    assert [str(v) for v in sorted(fast)] == [str(v) for v in sorted(full)]
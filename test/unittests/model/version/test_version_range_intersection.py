@@ -122,3 +122,33 @@ def test_range_intersection_prerelease(range1, range2, result):
     assert str(inter.version()) == f'[{result}]'
     inter = r2.intersection(r1)  # Test reverse order, result should be the same
     assert str(inter.version()) == f'[{result}]'
+
+
+exact_values = [
+    ['1.0', ">=0.5", "=1.0"],
+    ['1.0', ">=0.5 <2", "=1.0"],
+    ['1.0', "1.0", "=1.0"],
+    ['1.0 || 3.0', ">=2", "=3.0"],
+]
+
+
+@pytest.mark.parametrize("range1, range2, result", exact_values)
+def test_range_intersection_exact(range1, range2, result):
+    r1 = VersionRange(range1)
+    r2 = VersionRange(range2)
+    assert str(r1.intersection(r2).version()) == f"[{result}]"
+    assert str(r2.intersection(r1).version()) == f"[{result}]"
+
+
+@pytest.mark.parametrize("range1, range2", [['1.0', ">1.0"], ['1.0', "<1.0"], ['1.0', "1.1"],
+                                            ['1.0', ">=2 <3"]])
+def test_range_intersection_exact_incompatible(range1, range2):
+    assert VersionRange(range1).intersection(VersionRange(range2)) is None
+    assert VersionRange(range2).intersection(VersionRange(range1)) is None
+
+
+def test_range_key():
+    assert VersionRange(">=1 <2").key() == VersionRange("<2 >=1").key()
+    assert VersionRange(">=1 <2 || >3").key() == VersionRange(">3 || <2 >=1").key()
+    assert VersionRange(">=1 <2").key() != VersionRange(">=1 <2, include_prerelease").key()
+    assert VersionRange(">=1 <2").key() != VersionRange(">=1 <3").key()
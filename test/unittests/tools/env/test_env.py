@@ -128,6 +128,44 @@ def test_compose_path_combinations(op1, v1, op2, v2, result):
     assert env._values["MyVar"].get_str("{name}", None, pathsep=":") == result
 
 
+
+def test_compose_envs():
+    """ composing a list of environments at once is the same as composing them one by one,
+    but the repeated paths are removed
+    """
+    def _envs():
+        result = []
+        for i in range(20):
+            env = Environment()
+            env.prepend_path("PATH", [f"/dep{i}/bin", "/common/bin"])
+            env.append_path("PATH", f"/dep{i}/lib")
+            env.append("CXXFLAGS", f"-Ddep{i}")
+            if i == 10:  # Nothing else is composed after a define
+                env.define("MyVar", "Value10")
+            else:
+                env.append("MyVar", f"Value{i}")
+            result.append(env)
+        return result
+
+    env = Environment()
+    env.prepend_path("PATH", "/consumer/bin")
+    env.prepend("CXXFLAGS", "-Dconsumer")
+    expected = env.copy()
+    for other in _envs():
+        expected.compose_env(other)
+    env.compose_envs(_envs())
+
+    env = env.vars(ConanFileMock())
+    expected = expected.vars(ConanFileMock())
+    assert env.get("CXXFLAGS") == expected.get("CXXFLAGS")
+    assert env.get("MyVar") == expected.get("MyVar") == "Value10 " + " ".join(f"Value{i}" for i in
+                                                                              range(9, -1, -1))
+    path = env._values["PATH"].get_str("{name}", None, pathsep=":")
+    bins = ":".join(f"/dep{i}/bin" for i in range(20))
+    libs = ":".join(f"/dep{i}/lib" for i in range(19, -1, -1))
+    assert path == f"/consumer/bin:/dep0/bin:/common/bin:{bins[len('/dep0/bin:'):]}:PATH:{libs}"
+
+
 def test_profile():
     myprofile = textwrap.dedent("""
         # define
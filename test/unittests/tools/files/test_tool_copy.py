@@ -6,6 +6,7 @@ import unittest
 import pytest
 
 from conan.tools.files import copy
+from conan.test.utils.mocks import ConanFileMock
 from conan.test.utils.test_files import temp_folder
 from conans.util.files import load, save, mkdir, save_files, chdir
 
@@ -299,3 +300,42 @@ class ToolCopyTest(unittest.TestCase):
         copy(None, "*.txt", folder1, folder2, keep_path=False)
         for file_number in range(1, 8):
             assert load(os.path.join(folder2, f"file{file_number}.txt")) == f"file{file_number}"
+
+    def test_pruned_folders(self):
+        folder1 = temp_folder()
+        save_files(folder1, {"include/a.h": "", "include/sub/b.h": "", "Include2/c.h": "",
+                             "src/include/d.h": "", "src/e.h": ""})
+        folder2 = temp_folder()
+        with mock.patch("os.path.relpath", wraps=os.path.relpath) as relpath:
+            copied = copy(None, "include/*.h", folder1, folder2)
+        visited = {c.args[0] for c in relpath.call_args_list}
+        # The "src" folder cannot contain any matching file, it is not even walked
+        assert not any("src" in v for v in visited)
+        assert sorted(os.path.relpath(f, folder2) for f in copied) == \
+               [os.path.join("include", "a.h"), os.path.join("include", "sub", "b.h")]
+
+        folder2 = temp_folder()
+        copy(None, "INCLUDE*/*.h", folder1, folder2)
+        assert sorted(os.listdir(folder2)) == ["Include2", "include"]
+        folder2 = temp_folder()
+        copy(None, "INCLUDE*/*.h", folder1, folder2, ignore_case=False)
+        assert not os.listdir(folder2)
+
+    def test_parallel_hardlinks(self):
+        folder1 = temp_folder()
+        save_files(folder1, {f"sub{i}/file{j}.h": f"{i}-{j}" for i in range(3) for j in range(5)})
+        conanfile = ConanFileMock()
+        conanfile.conf.define("tools.files.copy:parallel", 4)
+        conanfile.conf.define("tools.files.copy:hardlinks", True)
+        folder2 = temp_folder()
+        copied = copy(conanfile, "*.h", folder1, folder2)
+        assert len(copied) == 15
+        for i in range(3):
+            for j in range(5):
+                src = os.path.join(folder1, f"sub{i}", f"file{j}.h")
+                dst = os.path.join(folder2, f"sub{i}", f"file{j}.h")
+                assert load(dst) == f"{i}-{j}"
+                assert os.path.samefile(src, dst)
+        # Copying again, the already linked files are not touched
+        copied = copy(conanfile, "*.h", folder1, folder2)
+        assert len(copied) == 15
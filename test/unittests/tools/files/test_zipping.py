@@ -29,3 +29,23 @@ def test_unzip():
     dest_dir = temp_folder()
     unzip(conanfile, os.path.join(tmp_dir, 'zipfile.zip'), dest_dir)
     assert os.path.exists(os.path.join(dest_dir, "foo.txt"))
+
+
+@pytest.mark.parametrize("strip_root", [False, True])
+def test_unzip_parallel(strip_root):
+    tmp_dir = temp_folder()
+    zip_path = os.path.join(tmp_dir, "zipfile.zip")
+    files = {f"root/sub{i}/sub/file{j}.txt": f"{i}-{j}" for i in range(4) for j in range(10)}
+    with zipfile.ZipFile(zip_path, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("root/", "")
+        for name, content in files.items():
+            zf.writestr(name, content)
+
+    conanfile = ConanFileMock({})
+    conanfile.conf.define("tools.files.unzip:parallel", 4)
+    dest_dir = temp_folder()
+    unzip(conanfile, zip_path, dest_dir, strip_root=strip_root)
+    for name, content in files.items():
+        name = name.split("/", 1)[1] if strip_root else name
+        with open(os.path.join(dest_dir, name)) as f:
+            assert f.read() == content
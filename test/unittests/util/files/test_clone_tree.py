@@ -0,0 +1,37 @@
+import os
+import platform
+import stat
+
+import pytest
+
+from conan.test.utils.test_files import temp_folder
+from conans.util.files import clone_tree, load, save_files
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Requires symlinks")
+@pytest.mark.parametrize("mode", ["copy", "reflink", "hardlink"])
+@pytest.mark.parametrize("parallel", [1, 3])
+def test_clone_tree(mode, parallel):
+    src = temp_folder()
+    save_files(src, {"src/main.cpp": "main", "src/sub/lib.cpp": "lib", "readonly.h": "header",
+                     "empty/.keep": ""})
+    readonly = os.path.join(src, "readonly.h")
+    os.chmod(readonly, stat.S_IRUSR | stat.S_IRGRP)
+    os.symlink("src", os.path.join(src, "link_folder"))
+    os.symlink("readonly.h", os.path.join(src, "link_file.h"))
+
+    dst = os.path.join(temp_folder(), "build")
+    clone_tree(src, dst, mode, parallel)
+    assert load(os.path.join(dst, "src", "main.cpp")) == "main"
+    assert load(os.path.join(dst, "src", "sub", "lib.cpp")) == "lib"
+    assert load(os.path.join(dst, "readonly.h")) == "header"
+    assert os.path.isfile(os.path.join(dst, "empty", ".keep"))
+    assert os.readlink(os.path.join(dst, "link_folder")) == "src"
+    assert os.readlink(os.path.join(dst, "link_file.h")) == "readonly.h"
+    # Only the read-only files can be shared, the others can be modified by the build. The root
+    # user can write any file, so nothing is shared
+    is_root = hasattr(os, "geteuid") and os.geteuid() == 0
+    assert os.path.samefile(readonly, os.path.join(dst, "readonly.h")) == \
+        (mode == "hardlink" and not is_root)
+    assert not os.path.samefile(os.path.join(src, "src", "main.cpp"),
+                                os.path.join(dst, "src", "main.cpp"))
@@ -0,0 +1,57 @@
+import json
+import os
+
+import pytest
+
+from conan.internal.json_stream import iter_json, iter_json_file, JsonStreamDict
+from conan.test.utils.test_files import temp_folder
+from conans.util.files import save
+
+
+DATA = {"nodes": {"0": {"ref": "pkg/0.1", "deps": [1, 2.5, None, True, "sé\n\"x\""],
+                        "empty": {}, "empty_list": [], "nested": {"a": {"b": [[1], {}]}}}},
+        "root": {"0": "pkg/0.1"},
+        3: "non-str key",
+        "error": None}
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 3, 10])
+def test_iter_json_same_as_dumps(depth):
+    assert "".join(iter_json(DATA, depth=depth)) == json.dumps(DATA, indent=4)
+    assert "".join(iter_json(DATA, indent=2, depth=depth)) == json.dumps(DATA, indent=2)
+
+
+def test_iter_json_lazy():
+    nodes = {str(i): {"ref": f"pkg{i}/0.1", "deps": [i]} for i in range(5)}
+    data = {"nodes": JsonStreamDict((k, v) for k, v in nodes.items()),
+            "levels": ([i] for i in range(3)),
+            "empty": JsonStreamDict(iter([]))}
+    expected = {"nodes": nodes, "levels": [[i] for i in range(3)], "empty": {}}
+    assert "".join(iter_json(data)) == json.dumps(expected, indent=4)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_json_file(chunk_size):
+    data = {"order_by": "recipe",
+            "order": [[{"ref": f"pkg{i}/0.1", "size": i * 12345} for i in range(20)], [], [{}]],
+            "reduced": False,
+            "profiles": {"self": {"args": "-pr=default"}},
+            "number": 1234567}
+    path = os.path.join(temp_folder(), "order.json")
+    save(path, json.dumps(data, indent=4))
+    result = list(iter_json_file(path, ("order", "*", "*"), chunk_size=chunk_size))
+    assert result[0] == (("order_by",), "recipe")
+    assert result[1:21] == [(("order", 0, i), item) for i, item in enumerate(data["order"][0])]
+    assert result[21:] == [(("order", 2, 0), {}),
+                           (("reduced",), False),
+                           (("profiles",), {"self": {"args": "-pr=default"}}),
+                           (("number",), 1234567)]
+
+
+@pytest.mark.parametrize("content", ['{"a": 1', '{"a" 1}', '{"a": 1} x', '', '{"a": [1,]}',
+                                     '{1: 2}'])
+def test_iter_json_file_errors(content):
+    path = os.path.join(temp_folder(), "broken.json")
+    save(path, content)
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_file(path, ("*", "*"), chunk_size=3))
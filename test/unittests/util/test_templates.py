@@ -0,0 +1,23 @@
+import pytest
+from jinja2 import StrictUndefined, UndefinedError
+
+from conan.internal.templates import get_template
+
+
+def test_get_template_cached():
+    text = "{% for v in values %}{{v}};{% endfor %}"
+    template = get_template(text, trim_blocks=True, lstrip_blocks=True)
+    assert template.render(values=[1, 2]) == "1;2;"
+    # The same text and options reuse the same compiled template
+    assert get_template(text, trim_blocks=True, lstrip_blocks=True) is template
+    # Different options or different texts produce different templates
+    assert get_template(text) is not template
+    assert get_template(text + "\n", trim_blocks=True, lstrip_blocks=True) is not template
+
+
+def test_get_template_options():
+    assert get_template("{{missing}}").render() == ""
+    with pytest.raises(UndefinedError):
+        get_template("{{missing}}", undefined=StrictUndefined).render()
+    assert get_template("value\n").render() == "value"
+    assert get_template("value\n", keep_trailing_newline=True).render() == "value\n"